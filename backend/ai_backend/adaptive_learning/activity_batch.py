@@ -0,0 +1,129 @@
+# backend/ai_backend/adaptive_learning/activity_batch.py
+
+from sqlalchemy import case, tuple_
+
+from backend.extensions import db
+from backend.ai_backend.models.progress import Progress
+from backend.ai_backend.models.upsert import upsert_insert
+from backend.ai_backend.models.user import User
+from backend.ai_backend.adaptive_learning.progress_aggregates import record_progress_changes
+from backend.ai_backend.adaptive_learning.result_cache import bump_data_versions
+from datetime import datetime
+
+# Time it takes to complete a module without a quiz, as in track_activity
+TARGET_TIME = 600  # seconds
+
+# Rows per upsert statement, well below SQLite's bound parameter limit
+UPSERT_CHUNK_SIZE = 1000
+
+def _least(a, b):
+    return case((a <= b, a), else_=b)
+
+def _greatest(a, b):
+    return case((a >= b, a), else_=b)
+
+def _time_based_completion(time_spent):
+    """SQL for the completion percentage earned by time alone"""
+    return _least(time_spent * 100.0 / TARGET_TIME, 100.0)
+
+def coalesce_activity(events):
+    """
+    Sum time spent per (user_id, module_id)
+
+    Args:
+        events (list): (user_id, module_id, time_spent) tuples
+
+    Returns:
+        dict: Total time spent keyed by (user_id, module_id), in first-seen order
+    """
+    totals = {}
+    for user_id, module_id, time_spent in events:
+        key = (user_id, module_id)
+        totals[key] = totals.get(key, 0) + time_spent
+    return totals
+
+def apply_activity_batch(events):
+    """
+    Record many activity heartbeats at once
+
+    Events are coalesced per (user_id, module_id) and applied with one
+    INSERT ... ON CONFLICT DO UPDATE per chunk of keys. Time is added to
+    existing rows and, as in track_activity, completion only grows with
+    time while no quiz has been taken. Affected users' progress summaries
+    take the change of every row in the same transaction: the new values
+    come from RETURNING and the old ones from one read of the chunk's keys
+    just before its upsert.
+
+    Args:
+        events (list): (user_id, module_id, time_spent) tuples
+
+    Returns:
+        dict: Updated progress per key and the user IDs that were skipped
+    """
+    totals = coalesce_activity(events)
+
+    # Drop events for users that do not exist, with one lookup
+    user_ids = {user_id for user_id, _ in totals}
+    known = {user_id for (user_id,) in db.session.query(User.id).filter(User.id.in_(user_ids))} if user_ids else set()
+    unknown_users = sorted(user_ids - known)
+
+    now = datetime.utcnow()
+    rows = [
+        {
+            'user_id': user_id,
+            'module_id': module_id,
+            'time_spent': time_spent,
+            'completion_percentage': min(100.0, time_spent * 100.0 / TARGET_TIME),
+            'last_activity': now
+        }
+        for (user_id, module_id), time_spent in totals.items()
+        if user_id in known
+    ]
+
+    progress = []
+    changes = []
+    for start in range(0, len(rows), UPSERT_CHUNK_SIZE):
+        chunk = rows[start:start + UPSERT_CHUNK_SIZE]
+        before = {
+            (user_id, module_id): (completion_percentage or 0.0, time_spent or 0)
+            for user_id, module_id, completion_percentage, time_spent in db.session.query(
+                Progress.user_id, Progress.module_id, Progress.completion_percentage, Progress.time_spent
+            ).filter(tuple_(Progress.user_id, Progress.module_id).in_(
+                [(row['user_id'], row['module_id']) for row in chunk]
+            ))
+        }
+
+        stmt = upsert_insert(Progress).values(chunk)
+        total_time = Progress.time_spent + stmt.excluded.time_spent
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Progress.user_id, Progress.module_id],
+            set_={
+                'time_spent': total_time,
+                'last_activity': stmt.excluded.last_activity,
+                'completion_percentage': case(
+                    (Progress.quiz_score.is_(None),
+                     _greatest(Progress.completion_percentage, _time_based_completion(total_time))),
+                    else_=Progress.completion_percentage
+                )
+            }
+        ).returning(Progress.user_id, Progress.module_id, Progress.time_spent, Progress.completion_percentage)
+
+        for user_id, module_id, time_spent, completion_percentage in db.session.execute(stmt):
+            progress.append({
+                'user_id': user_id,
+                'module_id': module_id,
+                'time_spent_total': time_spent,
+                'completion_percentage': completion_percentage
+            })
+            changes.append((user_id, before.get((user_id, module_id)), (completion_percentage, time_spent)))
+
+    record_progress_changes(changes)
+    bump_data_versions(known)
+    db.session.commit()
+
+    return {
+        'events': len(events),
+        'updated': len(progress),
+        'progress': progress,
+        'unknown_users': unknown_users
+    }
@@ -0,0 +1,233 @@
+# backend/ai_backend/adaptive_learning/curriculum.py
+
+import json
+import os
+from collections import namedtuple
+
+CURRICULUM_FILE = os.path.join(os.path.dirname(__file__), 'data', 'curriculum.json')
+
+Module = namedtuple('Module', ['id', 'title', 'requires', 'min_age', 'languages', 'position'])
+
+
+class Curriculum:
+    """
+    Learning modules and their prerequisites, as a DAG
+
+    Modules are stored in topological order and identified by their
+    position in it. Prerequisites and transitive ancestors are kept as
+    integer bitsets over those positions, so checking whether a module is
+    unlocked is a single AND against the user's completed set.
+    """
+
+    def __init__(self, modules, age_check=None):
+        """
+        Args:
+            modules (list): Dicts with id, title, requires, min_age and languages
+            age_check (callable): Called with (user, min_age), returns whether
+                a rated module suits the user; age ratings are ignored if None
+
+        Raises:
+            ValueError: If a prerequisite is unknown or the modules form a cycle
+        """
+        by_id = {module['id']: module for module in modules}
+        for module in modules:
+            for required in module.get('requires', []):
+                if required not in by_id:
+                    raise ValueError(f"Module {module['id']} requires unknown module {required}")
+
+        order = self._topological_order(modules)
+
+        self.modules = []
+        self.positions = {}
+        for position, module_id in enumerate(order):
+            module = by_id[module_id]
+            self.positions[module_id] = position
+            self.modules.append(Module(
+                id=module_id,
+                title=module.get('title', module_id),
+                requires=tuple(module.get('requires', [])),
+                min_age=module.get('min_age', 0),
+                languages=frozenset(module.get('languages', [])),
+                position=position
+            ))
+
+        # Direct prerequisites, all ancestors, and direct dependents per position
+        self.requires_mask = []
+        self.ancestors_mask = []
+        self.unlocks = [[] for _ in self.modules]
+        for module in self.modules:
+            requires = 0
+            ancestors = 0
+            for required in module.requires:
+                required_position = self.positions[required]
+                requires |= 1 << required_position
+                ancestors |= self.ancestors_mask[required_position] | (1 << required_position)
+                self.unlocks[required_position].append(module.position)
+            self.requires_mask.append(requires)
+            self.ancestors_mask.append(ancestors)
+
+        self.roots = [module.position for module in self.modules if not module.requires]
+        self.age_check = age_check
+
+    @staticmethod
+    def _topological_order(modules):
+        """Kahn's algorithm, keeping file order among modules that are ready together"""
+        pending = {module['id']: len(set(module.get('requires', []))) for module in modules}
+        dependents = {module['id']: [] for module in modules}
+        for module in modules:
+            for required in set(module.get('requires', [])):
+                dependents[required].append(module['id'])
+
+        file_order = {module['id']: index for index, module in enumerate(modules)}
+        ready = sorted((module_id for module_id, count in pending.items() if count == 0), key=file_order.get)
+        order = []
+        while ready:
+            module_id = ready.pop(0)
+            order.append(module_id)
+            for dependent in dependents[module_id]:
+                pending[dependent] -= 1
+                if pending[dependent] == 0:
+                    ready.append(dependent)
+                    ready.sort(key=file_order.get)
+
+        if len(order) != len(modules):
+            raise ValueError("Curriculum prerequisites contain a cycle")
+        return order
+
+    def __contains__(self, module_id):
+        return module_id in self.positions
+
+    def get(self, module_id):
+        """The Module with this ID, or None"""
+        position = self.positions.get(module_id)
+        return self.modules[position] if position is not None else None
+
+    def mask(self, module_ids):
+        """Bitset of the given module IDs, ignoring IDs not in the curriculum"""
+        mask = 0
+        for module_id in module_ids:
+            position = self.positions.get(module_id)
+            if position is not None:
+                mask |= 1 << position
+        return mask
+
+    def is_available(self, module, user=None, language=None):
+        """
+        Check a module's age rating and language against a user
+
+        Unrated modules (min_age 0) are open to everyone. Rated ones go
+        through the age check.
+        """
+        if user is not None and module.min_age > 0 and self.age_check and not self.age_check(user, module.min_age):
+            return False
+        if language is not None and module.languages and language not in module.languages:
+            return False
+        return True
+
+    def next_modules(self, completed_ids, user=None, language=None, limit=None):
+        """
+        Modules whose prerequisites are all completed, in curriculum order
+
+        Only the roots and the dependents of completed modules are
+        examined, so the cost follows the user's frontier rather than the
+        size of the curriculum.
+
+        Args:
+            completed_ids (iterable): IDs of the modules the user has completed
+            user (User): Filters out modules that are not age appropriate
+            language (str): Filters out modules not offered in this language
+            limit (int): Maximum number of modules to return
+
+        Returns:
+            list: Module IDs
+        """
+        completed = self.mask(completed_ids)
+        candidates = set(self.roots)
+        remaining = completed
+        while remaining:
+            lowest = remaining & -remaining
+            candidates.update(self.unlocks[lowest.bit_length() - 1])
+            remaining ^= lowest
+
+        frontier = []
+        for position in sorted(candidates):
+            if completed >> position & 1 or self.requires_mask[position] & ~completed:
+                continue
+            module = self.modules[position]
+            if self.is_available(module, user, language):
+                frontier.append(module.id)
+                if limit is not None and len(frontier) >= limit:
+                    break
+        return frontier
+
+    def next_after(self, module_id, completed_ids, user=None, language=None):
+        """
+        The module to take after finishing one
+
+        Prefers modules the finished one unlocks, then anything else on the
+        frontier.
+
+        Returns:
+            str: Module ID, or None if nothing is left to take
+        """
+        completed_ids = set(completed_ids) | {module_id}
+        frontier = self.next_modules(completed_ids, user, language)
+        position = self.positions.get(module_id)
+        if position is not None:
+            unlocked = {self.modules[dependent].id for dependent in self.unlocks[position]}
+            for candidate in frontier:
+                if candidate in unlocked:
+                    return candidate
+        return frontier[0] if frontier else None
+
+    def learning_path(self, completed_ids, user=None, language=None):
+        """
+        Every module still to take, in an order that respects prerequisites
+
+        Modules that are not available to the user are left out, together
+        with everything that depends on them.
+
+        Args:
+            completed_ids (iterable): IDs of the modules the user has completed
+            user (User): Filters out modules that are not age appropriate
+            language (str): Filters out modules not offered in this language
+
+        Returns:
+            list: Module IDs
+        """
+        completed = self.mask(completed_ids)
+        blocked = 0
+        path = []
+        for module in self.modules:
+            bit = 1 << module.position
+            if completed & bit:
+                continue
+            if self.ancestors_mask[module.position] & blocked or not self.is_available(module, user, language):
+                blocked |= bit
+                continue
+            path.append(module.id)
+        return path
+
+
+def load_curriculum(path=CURRICULUM_FILE, age_check=None):
+    """Read a Curriculum from a JSON file with a top-level "modules" list"""
+    with open(path, 'r') as f:
+        return Curriculum(json.load(f)['modules'], age_check=age_check)
+
+
+# Loaded on first use and shared by every request
+_curriculum = None
+
+def get_curriculum():
+    """
+    The application's curriculum, loaded once from CURRICULUM_FILE
+
+    Age ratings are checked with AccessControl.is_age_appropriate, which
+    refuses rated modules to users of unknown age.
+    """
+    global _curriculum
+    if _curriculum is None:
+        # Imported here so Curriculum itself can be used without the models
+        from backend.ai_backend.security.access_control import AccessControl
+        _curriculum = load_curriculum(age_check=AccessControl.is_age_appropriate)
+    return _curriculum
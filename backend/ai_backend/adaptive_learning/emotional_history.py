@@ -0,0 +1,192 @@
+# backend/ai_backend/adaptive_learning/emotional_history.py
+
+import re
+
+from backend.extensions import db
+from backend.ai_backend.models.emotional_event import EmotionalEvent, EmotionalStateRollup, EmotionalStateName
+from backend.ai_backend.models.upsert import increment_counters
+from datetime import datetime, timedelta
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
+
+# Emotional states by code. Codes are stored, so only ever append to this list.
+EMOTIONAL_STATES = [
+    'other',
+    'anxious', 'worried', 'scared', 'nervous',
+    'sad', 'upset', 'depressed',
+    'confused', 'uncertain',
+    'confident', 'empowered',
+    'interested', 'curious',
+    # States offered by the journal's mood selector
+    'happy', 'angry', 'okay'
+]
+STATE_CODES = {state: code for code, state in enumerate(EMOTIONAL_STATES)}
+
+# Other states get codes from EmotionalStateName, starting here so the
+# list above can keep growing
+CUSTOM_STATE_CODE_START = 1000
+
+# Distinct other states stored; later ones are recorded as 'other'
+MAX_CUSTOM_STATES = 1000
+
+# Longest state name stored, as in EmotionalStateName.name
+MAX_STATE_NAME_LENGTH = 50
+
+# Words of a state name, without emoji, punctuation or digits
+STATE_WORD = re.compile(r'[^\W\d_]+')
+
+# Rollup resolutions and the start of the bucket a timestamp falls in
+RESOLUTIONS = {
+    'hour': lambda ts: ts.replace(minute=0, second=0, microsecond=0),
+    'day': lambda ts: ts.replace(hour=0, minute=0, second=0, microsecond=0)
+}
+
+def state_name(emotional_state):
+    """
+    Normalize a reported state, e.g. the client's '😊 Happy' to 'happy'
+
+    Returns:
+        str: Lowercase words of the state separated by spaces, '' if it has none
+    """
+    words = STATE_WORD.findall((emotional_state or '').lower())
+    return ' '.join(words)[:MAX_STATE_NAME_LENGTH]
+
+def _custom_state_code(name):
+    """Code of a state outside EMOTIONAL_STATES, added to EmotionalStateName if new"""
+    code = db.session.query(EmotionalStateName.code).filter_by(name=name).scalar()
+    if code is None:
+        next_code = db.session.query(func.max(EmotionalStateName.code)).scalar()
+        next_code = CUSTOM_STATE_CODE_START if next_code is None else next_code + 1
+        if next_code >= CUSTOM_STATE_CODE_START + MAX_CUSTOM_STATES:
+            return 0
+
+        # Another request may add the same name or code first; then use its row
+        try:
+            with db.session.begin_nested():
+                db.session.add(EmotionalStateName(code=next_code, name=name))
+            code = next_code
+        except IntegrityError:
+            code = db.session.query(EmotionalStateName.code).filter_by(name=name).scalar()
+            if code is None:
+                return 0
+    return code
+
+def state_code(emotional_state):
+    """
+    Code for a reported state
+
+    States in EMOTIONAL_STATES use their index. Others are stored in
+    EmotionalStateName, in the caller's transaction; states without
+    letters, or beyond MAX_CUSTOM_STATES, are 'other'.
+    """
+    name = state_name(emotional_state)
+    if name in STATE_CODES:
+        return STATE_CODES[name]
+    if not name:
+        return 0
+    return _custom_state_code(name)
+
+def state_names(codes):
+    """
+    Names of state codes, with one lookup for the custom ones
+
+    Returns:
+        dict: Name keyed by code
+    """
+    names = {code: EMOTIONAL_STATES[code] for code in codes if code < len(EMOTIONAL_STATES)}
+    custom = set(codes) - set(names)
+    if custom:
+        names.update(db.session.query(EmotionalStateName.code, EmotionalStateName.name).filter(
+            EmotionalStateName.code.in_(custom)
+        ))
+    return names
+
+def record_emotional_event(user_id, module_id, emotional_state, timestamp=None):
+    """
+    Append an emotional event and add it to the hourly and daily rollups
+
+    Runs in the caller's transaction.
+
+    Args:
+        user_id (int): The user reporting the state
+        module_id (str): The module being studied
+        emotional_state (str): The reported state
+        timestamp (datetime): When it was reported, now if not given
+    """
+    timestamp = timestamp or datetime.utcnow()
+    code = state_code(emotional_state)
+
+    db.session.add(EmotionalEvent(user_id=user_id, module_id=module_id, timestamp=timestamp, state=code))
+
+    increment_counters(
+        EmotionalStateRollup,
+        ['user_id', 'resolution', 'bucket_start', 'state'],
+        ['count'],
+        [
+            {
+                'user_id': user_id,
+                'resolution': resolution,
+                'bucket_start': bucket_start(timestamp),
+                'state': code,
+                'count': 1
+            }
+            for resolution, bucket_start in RESOLUTIONS.items()
+        ]
+    )
+
+def emotional_history(user_id, since, until=None, resolution='day'):
+    """
+    Get a user's emotional state counts per bucket from the rollups
+
+    Args:
+        user_id (int): The user
+        since (datetime): Start of the first bucket to include
+        until (datetime): Exclusive end, now if not given
+        resolution (str): 'hour' or 'day'
+
+    Returns:
+        list: {'bucket_start', 'counts'} dicts, oldest first, for buckets with events
+    """
+    if resolution not in RESOLUTIONS:
+        raise ValueError(f"Unknown resolution: {resolution}")
+
+    rollups = EmotionalStateRollup.query.filter(
+        EmotionalStateRollup.user_id == user_id,
+        EmotionalStateRollup.resolution == resolution,
+        EmotionalStateRollup.bucket_start >= RESOLUTIONS[resolution](since),
+        EmotionalStateRollup.bucket_start < (until or datetime.utcnow())
+    ).order_by(EmotionalStateRollup.bucket_start, EmotionalStateRollup.state).all()
+
+    names = state_names({rollup.state for rollup in rollups})
+
+    history = []
+    for rollup in rollups:
+        if not history or history[-1]['bucket_start'] != rollup.bucket_start:
+            history.append({'bucket_start': rollup.bucket_start, 'counts': {}})
+        history[-1]['counts'][names.get(rollup.state, 'other')] = rollup.count
+    return history
+
+def compact_emotional_history(event_retention_days, hourly_retention_days):
+    """
+    Delete raw events and hourly rollups that have aged out
+
+    Daily rollups are kept indefinitely, so history stays available at day
+    resolution after the finer data is gone. Commits.
+
+    Args:
+        event_retention_days (int): Days of raw events to keep
+        hourly_retention_days (int): Days of hourly rollups to keep
+
+    Returns:
+        dict: Number of events and hourly rollups deleted
+    """
+    now = datetime.utcnow()
+    events = EmotionalEvent.query.filter(
+        EmotionalEvent.timestamp < now - timedelta(days=event_retention_days)
+    ).delete(synchronize_session=False)
+    hourly = EmotionalStateRollup.query.filter(
+        EmotionalStateRollup.resolution == 'hour',
+        EmotionalStateRollup.bucket_start < now - timedelta(days=hourly_retention_days)
+    ).delete(synchronize_session=False)
+    db.session.commit()
+    return {'events': events, 'hourly_rollups': hourly}
@@ -2,8 +2,11 @@
 
 from backend.extensions import db
 from backend.ai_backend.models.progress import Progress
-from ai_backend.models.interaction import Interaction
-from ai_backend.models.user import User
+from backend.ai_backend.adaptive_learning.progress_aggregates import progress_values, record_progress_change
+from backend.ai_backend.adaptive_learning.sentiment_counts import recent_sentiment_counts
+from backend.ai_backend.adaptive_learning.emotional_history import emotional_history, record_emotional_event
+from backend.ai_backend.adaptive_learning.result_cache import bump_data_versions
+from backend.ai_backend.models.user import User
 from datetime import datetime, timedelta
 import re
 
@@ -32,6 +35,7 @@ class EmotionalTracker:
             user_id=self.user_id,
             module_id=module_id
         ).first()
+        before = progress_values(progress) if progress else None
         
         if not progress:
             progress = Progress(
@@ -46,6 +50,14 @@ class EmotionalTracker:
         # Update emotional state
         progress.emotional_state = emotional_state
         progress.last_activity = datetime.utcnow()
+        
+        # Keep the history too, since the progress row only holds the latest state
+        record_emotional_event(self.user_id, module_id, emotional_state, progress.last_activity)
+        
+        # Keep the user's summary in step and invalidate cached results,
+        # in the same transaction
+        record_progress_change(self.user_id, before, progress)
+        bump_data_versions([self.user_id])
         db.session.commit()
         
         # Generate appropriate response based on emotional state
@@ -64,21 +76,16 @@ class EmotionalTracker:
         Returns:
             dict: Analysis of emotional trends and recommendations
         """
-        # Get recent interactions (last 7 days)
-        week_ago = datetime.utcnow() - timedelta(days=7)
-        recent_interactions = Interaction.query.filter_by(
-            user_id=self.user_id
-        ).filter(
-            Interaction.timestamp >= week_ago
-        ).all()
-        
-        # Extract sentiment data
-        sentiments = [interaction.sentiment for interaction in recent_interactions if interaction.sentiment]
+        # Get per-day sentiment counts for the last 7 days (at most 7 rows),
+        # kept up to date as interactions are stored
+        daily_counts = recent_sentiment_counts(self.user_id)
         
         # Count occurrences of each sentiment
         sentiment_counts = {}
-        for sentiment in sentiments:
-            sentiment_counts[sentiment] = sentiment_counts.get(sentiment, 0) + 1
+        for counts in daily_counts:
+            for sentiment, count in counts.items():
+                if count:
+                    sentiment_counts[sentiment] = sentiment_counts.get(sentiment, 0) + count
         
         # Determine dominant sentiment
         dominant_sentiment = max(sentiment_counts.items(), key=lambda x: x[1])[0] if sentiment_counts else 'neutral'
@@ -89,13 +96,46 @@ class EmotionalTracker:
         return {
             'sentiment_counts': sentiment_counts,
             'dominant_sentiment': dominant_sentiment,
-            'trend': self._determine_trend(sentiments),
+            'trend': self._determine_trend(daily_counts),
             'recommendations': recommendations
         }
     
-    def _determine_trend(self, sentiments):
-        """Determine if emotional state is improving, worsening, or stable"""
-        if not sentiments or len(sentiments) < 3:
+    def get_emotional_history(self, days=30, resolution='day'):
+        """
+        Get counts of self-reported emotional states over time
+        
+        Read from the hourly or daily rollups, never from the raw events.
+        
+        Args:
+            days (int): How many days back to go
+            resolution (str): 'hour' or 'day'
+        
+        Returns:
+            dict: State counts per bucket, oldest first
+        """
+        history = emotional_history(self.user_id, datetime.utcnow() - timedelta(days=days), resolution=resolution)
+        
+        return {
+            'resolution': resolution,
+            'history': [
+                {'bucket_start': bucket['bucket_start'].isoformat(), 'counts': bucket['counts']}
+                for bucket in history
+            ]
+        }
+    
+    def _determine_trend(self, daily_counts):
+        """
+        Determine if emotional state is improving, worsening, or stable
+        
+        Compares the first half of the window's interactions with the second
+        half. Interactions within a day are not ordered, so a day that
+        straddles the midpoint is split in proportion to its counts.
+        
+        Args:
+            daily_counts (list): Per-day {sentiment: count} dicts, oldest first
+        """
+        total = sum(sum(counts.values()) for counts in daily_counts)
+        if total < 3:
             return "insufficient_data"
         
         # Simplified trend analysis - in a real system, use more sophisticated methods
@@ -106,16 +146,28 @@ class EmotionalTracker:
             'urgent': -2
         }
         
-        # Convert sentiments to numerical values
-        values = [sentiment_values.get(s, 0) for s in sentiments]
+        # Sum the values of the first total // 2 interactions and of the rest
+        half = total // 2
+        taken = 0
+        first_half = 0.0
+        total_value = 0
+        for counts in daily_counts:
+            day_total = sum(counts.values())
+            day_value = sum(sentiment_values.get(s, 0) * count for s, count in counts.items())
+            total_value += day_value
+            if taken < half:
+                share = min(day_total, half - taken)
+                first_half += day_value * share / day_total
+                taken += share
+        second_half = total_value - first_half
         
         # Calculate trend (positive slope = improving, negative = worsening)
-        if sum(values[:len(values)//2]) < sum(values[len(values)//2:]):
+        if abs(first_half - second_half) < 1e-9:
+            return "stable"
+        elif first_half < second_half:
             return "improving"
-        elif sum(values[:len(values)//2]) > sum(values[len(values)//2:]):
-            return "worsening"
         else:
-            return "stable"
+            return "worsening"
     
     def _generate_emotional_support(self, emotional_state):
         """Generate supportive response based on emotional state"""
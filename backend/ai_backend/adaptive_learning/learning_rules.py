@@ -0,0 +1,160 @@
+# backend/ai_backend/adaptive_learning/learning_rules.py
+
+import json
+from collections import namedtuple
+
+from backend.ai_backend.adaptive_learning.curriculum import get_curriculum
+
+# Learning paths and recommendations computed from a user's progress rows.
+# These functions do not touch the database, so the trackers and the offline
+# snapshot job share them. Progress rows need module_id, completion_percentage
+# and quiz_score; the user needs age and language_preference.
+
+def learning_path(progress_records, user, curriculum=None):
+    """
+    Generate a personalized learning path from a user's progress
+
+    Args:
+        progress_records (list): The user's progress rows
+        user: The user the path is for
+        curriculum (Curriculum): Module graph, the shipped one if not given
+
+    Returns:
+        list: Ordered list of module IDs representing recommended path
+    """
+    if curriculum is None:
+        curriculum = get_curriculum()
+
+    # Create dictionary of module completion percentages
+    module_completion = {record.module_id: record.completion_percentage for record in progress_records}
+
+    # Get all incomplete modules (less than 80% complete), in curriculum order
+    incomplete_modules = sorted(
+        (module_id for module_id, percentage in module_completion.items() if percentage < 80.0),
+        key=lambda module_id: curriculum.positions.get(module_id, len(curriculum.modules))
+    )
+    completed_modules = [
+        module_id for module_id, percentage in module_completion.items()
+        if percentage >= 80.0
+    ]
+
+    # Modules not started yet, ordered by prerequisites and limited to
+    # those suitable for the user's age and language
+    unstarted_modules = [
+        module_id for module_id in curriculum.learning_path(
+            completed_modules,
+            user=user,
+            language=user.language_preference
+        )
+        if module_id not in module_completion
+    ]
+
+    # First incomplete modules, then unstarted ones
+    return incomplete_modules + unstarted_modules
+
+def learning_recommendations(progress_records, user, curriculum=None):
+    """
+    Generate personalized learning recommendations from a user's progress
+
+    Args:
+        progress_records (list): The user's progress rows
+        user: The user the recommendations are for
+        curriculum (Curriculum): Module graph, the shipped one if not given
+
+    Returns:
+        list: Recommended modules and content
+    """
+    recommendations = []
+    if curriculum is None:
+        curriculum = get_curriculum()
+    language = user.language_preference
+
+    # If user has no progress yet, recommend starting modules
+    if not progress_records:
+        for module_id in curriculum.next_modules([], user=user, language=language, limit=1):
+            recommendations.append({
+                'type': 'module',
+                'id': module_id,
+                'reason': 'recommended_starting_point'
+            })
+        return recommendations
+
+    # Check for incomplete modules
+    incomplete_modules = [p for p in progress_records if p.completion_percentage < 100.0]
+    if incomplete_modules:
+        # Sort by completion percentage (highest first) to recommend most nearly complete modules first
+        incomplete_modules.sort(key=lambda p: p.completion_percentage, reverse=True)
+        for module in incomplete_modules[:3]:  # Recommend up to 3 incomplete modules
+            recommendations.append({
+                'type': 'module',
+                'id': module.module_id,
+                'completion_percentage': module.completion_percentage,
+                'reason': 'continue_progress'
+            })
+
+    # Check for modules with low quiz scores that might need review
+    low_score_modules = [
+        p for p in progress_records
+        if p.quiz_score is not None and p.quiz_score < 70.0 and p.completion_percentage >= 100.0
+    ]
+    if low_score_modules:
+        # Sort by quiz score (lowest first) to prioritize modules with lowest scores
+        low_score_modules.sort(key=lambda p: p.quiz_score)
+        for module in low_score_modules[:2]:  # Recommend up to 2 modules to review
+            recommendations.append({
+                'type': 'review',
+                'id': module.module_id,
+                'quiz_score': module.quiz_score,
+                'reason': 'review_material'
+            })
+
+    # Check for next logical module in sequence
+    completed_modules = [p.module_id for p in progress_records if p.completion_percentage >= 100.0]
+    if completed_modules:
+        # First unlocked module the user has not started or been recommended
+        skip = {r['id'] for r in recommendations} | {p.module_id for p in progress_records}
+        for module_id in curriculum.next_modules(completed_modules, user=user, language=language):
+            if module_id not in skip:
+                recommendations.append({
+                    'type': 'module',
+                    'id': module_id,
+                    'reason': 'next_in_sequence'
+                })
+                break
+
+    return recommendations
+
+
+# Plain rows used by the snapshot job, so chunks can be sent to worker processes
+ProgressRow = namedtuple('ProgressRow', 'module_id completion_percentage quiz_score')
+LearnerInfo = namedtuple('LearnerInfo', 'age language_preference')
+
+# Curriculum of a snapshot worker process, set by init_worker
+_worker_curriculum = None
+
+def init_worker(curriculum):
+    """Pool initializer: use the parent's curriculum instead of loading it again"""
+    global _worker_curriculum
+    _worker_curriculum = curriculum
+
+def compute_learning_chunk(chunk):
+    """
+    Compute learning paths and recommendations for a chunk of users
+
+    Args:
+        chunk (list): (user_id, age, language_preference, progress) tuples, where
+            progress is a list of (module_id, completion_percentage, quiz_score)
+
+    Returns:
+        list: (user_id, learning path JSON, recommendations JSON) tuples, in chunk order
+    """
+    results = []
+    for user_id, age, language_preference, progress in chunk:
+        user = LearnerInfo(age, language_preference)
+        records = [ProgressRow(*row) for row in progress]
+        results.append((
+            user_id,
+            json.dumps(learning_path(records, user, _worker_curriculum), sort_keys=True),
+            json.dumps(learning_recommendations(records, user, _worker_curriculum), sort_keys=True)
+        ))
+    return results
@@ -0,0 +1,233 @@
+# backend/ai_backend/adaptive_learning/module_stats.py
+
+import json
+import math
+from bisect import insort
+
+from sqlalchemy.exc import IntegrityError
+
+from backend.extensions import db
+from backend.ai_backend.models.module_stats import ModuleStats
+from backend.ai_backend.models.progress import Progress
+from datetime import datetime
+
+# Quantiles of time taken tracked for every module
+TIME_QUANTILES = (0.1, 0.5, 0.9)
+
+# Timed results a module needs before its own quantiles replace the defaults
+MIN_TIMED_RESULTS = 5
+
+# Used until a module has enough timed results
+DEFAULT_AVG_TIME = 120  # seconds
+
+class P2Quantile:
+    """
+    Streaming estimate of one quantile with the P² algorithm
+
+    Keeps five marker heights and positions regardless of how many values
+    are added (Jain and Chlamtac, 1985). Until five values have been seen,
+    the values themselves are kept and the quantile is interpolated.
+    """
+
+    def __init__(self, p, heights=None, positions=None):
+        """
+        Args:
+            p (float): Quantile to estimate, between 0 and 1
+            heights (list): Saved marker heights, or the values seen so far
+            positions (list): Saved marker positions, once five values are seen
+        """
+        self.p = p
+        self.heights = list(heights or [])
+        self.positions = list(positions or [])
+
+    def _desired_positions(self, count):
+        p = self.p
+        return [1, 1 + (count - 1) * p / 2, 1 + (count - 1) * p, 1 + (count - 1) * (1 + p) / 2, count]
+
+    def add(self, x):
+        """Add one value"""
+        q, n = self.heights, self.positions
+        if len(q) < 5:
+            insort(q, x)
+            if len(q) == 5:
+                n[:] = [1, 2, 3, 4, 5]
+            return
+
+        # Find the cell x falls into, stretching the outer markers if needed
+        if x < q[0]:
+            q[0] = x
+            k = 0
+        elif x >= q[4]:
+            q[4] = x
+            k = 3
+        else:
+            k = next(i for i in range(4) if q[i] <= x < q[i + 1])
+        for i in range(k + 1, 5):
+            n[i] += 1
+
+        desired = self._desired_positions(n[4])
+        for i in (1, 2, 3):
+            d = desired[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                d = 1 if d > 0 else -1
+                parabolic = q[i] + d / (n[i + 1] - n[i - 1]) * (
+                    (n[i] - n[i - 1] + d) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+                    + (n[i + 1] - n[i] - d) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+                )
+                if q[i - 1] < parabolic < q[i + 1]:
+                    q[i] = parabolic
+                else:
+                    q[i] = q[i] + d * (q[i + d] - q[i]) / (n[i + d] - n[i])
+                n[i] += d
+
+    def value(self):
+        """Current estimate, or None if no values were added"""
+        q = self.heights
+        if not q:
+            return None
+        if len(q) < 5:
+            rank = self.p * (len(q) - 1)
+            low = int(rank)
+            high = min(low + 1, len(q) - 1)
+            return q[low] + (q[high] - q[low]) * (rank - low)
+        return q[2]
+
+def _welford(count, mean, m2, x):
+    """Add x to a running (mean, m2) over count - 1 previous values"""
+    delta = x - mean
+    mean += delta / count
+    return mean, m2 + delta * (x - mean)
+
+def _stddev(count, m2):
+    return math.sqrt(m2 / (count - 1)) if count > 1 else 0.0
+
+def _load_quantiles(stats):
+    saved = json.loads(stats.time_quantiles) if stats is not None and stats.time_quantiles else {}
+    estimators = {}
+    for p in TIME_QUANTILES:
+        state = saved.get(str(p), {})
+        estimators[p] = P2Quantile(p, state.get('q'), state.get('n'))
+    return estimators
+
+def _locked_stats(module_id):
+    """The module's stats row, locked for update where the database supports it"""
+    return db.session.query(ModuleStats).filter_by(module_id=module_id).with_for_update().populate_existing().first()
+
+def record_quiz_stats(module_id, score, time_taken):
+    """
+    Add one quiz result to the module's running statistics
+
+    Runs in the caller's transaction. The stats row is locked for update
+    where the database supports it, so concurrent results are not lost.
+
+    Args:
+        module_id (str): The module identifier
+        score (float): Score as a percentage (0-100)
+        time_taken (int): Time taken in seconds, 0 if not measured
+    """
+    stats = _locked_stats(module_id)
+    if stats is None:
+        # Another request may create the row first (SQLite cannot lock a
+        # row that does not exist yet); then lock and use its row
+        try:
+            with db.session.begin_nested():
+                stats = ModuleStats(
+                    module_id=module_id,
+                    quiz_count=0,
+                    score_mean=0.0,
+                    score_m2=0.0,
+                    timed_count=0,
+                    time_mean=0.0,
+                    time_m2=0.0
+                )
+                db.session.add(stats)
+        except IntegrityError:
+            stats = _locked_stats(module_id)
+
+    stats.quiz_count += 1
+    stats.score_mean, stats.score_m2 = _welford(stats.quiz_count, stats.score_mean, stats.score_m2, score)
+
+    if time_taken > 0:
+        stats.timed_count += 1
+        stats.time_mean, stats.time_m2 = _welford(stats.timed_count, stats.time_mean, stats.time_m2, time_taken)
+
+        estimators = _load_quantiles(stats)
+        for estimator in estimators.values():
+            estimator.add(time_taken)
+        stats.time_quantiles = json.dumps({
+            str(p): {'q': estimator.heights, 'n': estimator.positions}
+            for p, estimator in estimators.items()
+        })
+
+    stats.updated_at = datetime.utcnow()
+
+def get_module_stats(module_id):
+    """
+    Get a module's quiz statistics from its stats row
+
+    Returns:
+        dict: Score and time statistics, or None if no quiz was recorded
+    """
+    stats = db.session.get(ModuleStats, module_id)
+    if stats is None:
+        return None
+
+    quantiles = {p: estimator.value() for p, estimator in _load_quantiles(stats).items()}
+    return {
+        'module_id': module_id,
+        'quiz_count': stats.quiz_count,
+        'score': {
+            'mean': stats.score_mean,
+            'stddev': _stddev(stats.quiz_count, stats.score_m2)
+        },
+        'time_taken': {
+            'count': stats.timed_count,
+            'mean': stats.time_mean if stats.timed_count else None,
+            'stddev': _stddev(stats.timed_count, stats.time_m2),
+            'percentiles': {f'p{round(p * 100)}': value for p, value in quantiles.items()}
+        },
+        'updated_at': stats.updated_at.isoformat() if stats.updated_at else None
+    }
+
+def time_thresholds(module_id):
+    """
+    Quiz times below which a result is unusually fast and above which it is unusually slow
+
+    Uses the module's 10th and 90th percentiles once it has
+    MIN_TIMED_RESULTS timed results, and half and one and a half times
+    DEFAULT_AVG_TIME before that.
+
+    Returns:
+        tuple: (fast, slow) in seconds
+    """
+    stats = db.session.get(ModuleStats, module_id)
+    if stats is None or stats.timed_count < MIN_TIMED_RESULTS:
+        return DEFAULT_AVG_TIME * 0.5, DEFAULT_AVG_TIME * 1.5
+
+    estimators = _load_quantiles(stats)
+    return estimators[0.1].value(), estimators[0.9].value()
+
+def backfill_module_stats():
+    """
+    Seed empty module statistics from the quiz results stored on progress rows
+
+    Progress keeps only each user's latest result per module, so this is a
+    starting point for existing databases; later results are added as they
+    arrive. Does nothing if any statistics exist. Commits.
+
+    Returns:
+        int: Number of quiz results added
+    """
+    if db.session.query(ModuleStats.module_id).first() is not None:
+        return 0
+
+    results = db.session.query(Progress.module_id, Progress.quiz_score, Progress.quiz_time_taken).filter(
+        Progress.quiz_score.isnot(None)
+    ).order_by(Progress.last_activity, Progress.id).all()
+
+    added = 0
+    for module_id, score, time_taken in results:
+        record_quiz_stats(module_id, score, time_taken or 0)
+        added += 1
+    db.session.commit()
+    return added
@@ -0,0 +1,141 @@
+# backend/ai_backend/adaptive_learning/path_snapshot.py
+
+import json
+import multiprocessing
+import time
+from collections import deque
+
+from backend.extensions import db
+from backend.ai_backend.models.user import User
+from backend.ai_backend.models.progress import Progress
+from backend.ai_backend.models.learning_path_snapshot import LearningPathSnapshot
+from backend.ai_backend.adaptive_learning.curriculum import get_curriculum
+from backend.ai_backend.adaptive_learning.learning_rules import compute_learning_chunk, init_worker
+
+# Rows fetched per round trip while streaming users and progress
+STREAM_BATCH_SIZE = 5000
+
+# Snapshot rows per insert statement
+INSERT_CHUNK_SIZE = 1000
+
+def _user_chunks(chunk_users):
+    """
+    Stream every user with their progress rows, in user_id order
+
+    Users and progress are read with one ordered query each and merged, so
+    the progress table is scanned once however many users there are.
+
+    Yields:
+        tuple: (chunk, progress row count), chunk as accepted by compute_learning_chunk
+    """
+    users = db.session.query(User.id, User.age, User.language_preference).order_by(
+        User.id
+    ).yield_per(STREAM_BATCH_SIZE)
+    progress = iter(db.session.query(
+        Progress.user_id, Progress.module_id, Progress.completion_percentage, Progress.quiz_score
+    ).order_by(Progress.user_id, Progress.module_id).yield_per(STREAM_BATCH_SIZE))
+
+    row = next(progress, None)
+    chunk, row_count = [], 0
+    for user_id, age, language_preference in users:
+        # Progress of users that no longer exist is skipped
+        while row is not None and row.user_id < user_id:
+            row = next(progress, None)
+
+        user_progress = []
+        while row is not None and row.user_id == user_id:
+            user_progress.append((row.module_id, row.completion_percentage, row.quiz_score))
+            row = next(progress, None)
+
+        chunk.append((user_id, age, language_preference, user_progress))
+        row_count += len(user_progress)
+        if len(chunk) >= chunk_users:
+            yield chunk, row_count
+            chunk, row_count = [], 0
+
+    if chunk:
+        yield chunk, row_count
+
+def _write_results(snapshot_id, results):
+    for start in range(0, len(results), INSERT_CHUNK_SIZE):
+        db.session.execute(db.insert(LearningPathSnapshot), [
+            {
+                'snapshot_id': snapshot_id,
+                'user_id': user_id,
+                'learning_path': path,
+                'recommendations': recommendations
+            }
+            for user_id, path, recommendations in results[start:start + INSERT_CHUNK_SIZE]
+        ])
+
+def snapshot_learning_paths(snapshot_id, workers=None, chunk_users=500):
+    """
+    Compute every user's learning path and recommendations into a snapshot
+
+    Uses the same rules as QuizAnalyzer.get_learning_path and
+    UserProgressTracker.get_learning_recommendations. Chunks of users are
+    computed in a process pool and written in user_id order, so the same
+    data always gives the same snapshot. An existing snapshot with the same
+    ID is replaced. Commits.
+
+    Args:
+        snapshot_id (str): Name of the snapshot, e.g. the date of the report
+        workers (int): Worker processes, one per CPU if not given; 1 computes inline
+        chunk_users (int): Users sent to a worker at a time
+
+    Returns:
+        dict: Users and progress rows processed, elapsed seconds and throughput
+    """
+    workers = workers or multiprocessing.cpu_count()
+    curriculum = get_curriculum()
+    started = time.perf_counter()
+    users = rows = 0
+
+    LearningPathSnapshot.query.filter_by(snapshot_id=snapshot_id).delete(synchronize_session=False)
+
+    if workers == 1:
+        init_worker(curriculum)
+        for chunk, row_count in _user_chunks(chunk_users):
+            _write_results(snapshot_id, compute_learning_chunk(chunk))
+            users += len(chunk)
+            rows += row_count
+    else:
+        # A few chunks in flight per worker keeps the pool busy while
+        # bounding memory; results are collected in submission order
+        with multiprocessing.Pool(workers, initializer=init_worker, initargs=(curriculum,)) as pool:
+            pending = deque()
+            for chunk, row_count in _user_chunks(chunk_users):
+                pending.append(pool.apply_async(compute_learning_chunk, (chunk,)))
+                users += len(chunk)
+                rows += row_count
+                if len(pending) >= 2 * workers:
+                    _write_results(snapshot_id, pending.popleft().get())
+            while pending:
+                _write_results(snapshot_id, pending.popleft().get())
+
+    db.session.commit()
+    seconds = time.perf_counter() - started
+    return {
+        'snapshot_id': snapshot_id,
+        'workers': workers,
+        'users': users,
+        'progress_rows': rows,
+        'seconds': seconds,
+        'users_per_second': users / seconds if seconds else 0.0,
+        'rows_per_second': rows / seconds if seconds else 0.0
+    }
+
+def load_learning_path_snapshot(snapshot_id, user_id):
+    """
+    Get a user's entry from a snapshot
+
+    Returns:
+        dict: learning_path and recommendations, or None if the user is not in the snapshot
+    """
+    entry = db.session.get(LearningPathSnapshot, (snapshot_id, user_id))
+    if entry is None:
+        return None
+    return {
+        'learning_path': json.loads(entry.learning_path),
+        'recommendations': json.loads(entry.recommendations)
+    }
@@ -0,0 +1,237 @@
+# backend/ai_backend/adaptive_learning/progress_aggregates.py
+
+from sqlalchemy import bindparam, case, func, update
+
+from backend.extensions import db
+from backend.ai_backend.models.progress import Progress
+from backend.ai_backend.models.progress_summary import ProgressSummary
+from datetime import datetime
+
+# Completion percentage at which a module counts as completed
+COMPLETED_THRESHOLD = 100.0
+
+# Users per aggregate query when rebuilding summaries
+REBUILD_CHUNK_SIZE = 500
+
+def progress_values(progress):
+    """
+    Values of a Progress row that feed the summary
+
+    Returns:
+        tuple: (completion_percentage, time_spent)
+    """
+    return (progress.completion_percentage or 0.0, progress.time_spent or 0)
+
+def _summary_delta(before, after):
+    """
+    Change to a summary's totals from one Progress row change
+
+    Args:
+        before (tuple): progress_values() before the change, or None if the row is new
+        after (tuple): progress_values() after the change
+
+    Returns:
+        tuple: (total_modules, completed_modules, total_time_spent, completion_sum) deltas
+    """
+    completion, time_spent = after
+    old_completion, old_time_spent = before if before is not None else (0.0, 0)
+    return (
+        1 if before is None else 0,
+        int(completion >= COMPLETED_THRESHOLD) - int(before is not None and old_completion >= COMPLETED_THRESHOLD),
+        time_spent - old_time_spent,
+        completion - old_completion
+    )
+
+def record_progress_change(user_id, before, progress):
+    """
+    Apply one Progress row change to the user's summary
+
+    Runs in the caller's transaction, so the summary commits (or rolls
+    back) together with the progress row.
+
+    Args:
+        user_id (int): Owner of the progress row
+        before (tuple): progress_values() before the change, or None if the row is new
+        progress (Progress): The row after the change
+    """
+    total, completed, time_spent, completion = _summary_delta(before, progress_values(progress))
+
+    result = db.session.execute(
+        update(ProgressSummary)
+        .where(ProgressSummary.user_id == user_id)
+        .values(
+            total_modules=ProgressSummary.total_modules + total,
+            completed_modules=ProgressSummary.completed_modules + completed,
+            total_time_spent=ProgressSummary.total_time_spent + time_spent,
+            completion_sum=ProgressSummary.completion_sum + completion,
+            updated_at=datetime.utcnow()
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+    if result.rowcount == 0:
+        # No summary yet: build it from the raw rows, which already include this change
+        db.session.flush()
+        rebuild_progress_summary(user_id)
+
+def record_progress_changes(changes):
+    """
+    Apply many Progress row changes to their users' summaries
+
+    Deltas are summed per user and applied with one executemany UPDATE.
+    Users without a summary get one built from their raw rows, which
+    already include the changes. Runs in the caller's transaction.
+
+    Args:
+        changes (list): (user_id, before, after) tuples, where before and
+            after are progress_values() and before is None for new rows
+    """
+    deltas = {}
+    for user_id, before, after in changes:
+        delta = _summary_delta(before, after)
+        summed = deltas.get(user_id)
+        deltas[user_id] = delta if summed is None else tuple(a + b for a, b in zip(summed, delta))
+    if not deltas:
+        return
+
+    existing = set()
+    user_ids = sorted(deltas)
+    for start in range(0, len(user_ids), REBUILD_CHUNK_SIZE):
+        chunk = user_ids[start:start + REBUILD_CHUNK_SIZE]
+        existing.update(
+            user_id for (user_id,) in db.session.query(ProgressSummary.user_id).filter(ProgressSummary.user_id.in_(chunk))
+        )
+
+    if existing:
+        table = ProgressSummary.__table__
+        now = datetime.utcnow()
+        db.session.execute(
+            update(table)
+            .where(table.c.user_id == bindparam('summary_user_id'))
+            .values(
+                total_modules=table.c.total_modules + bindparam('total_delta'),
+                completed_modules=table.c.completed_modules + bindparam('completed_delta'),
+                total_time_spent=table.c.total_time_spent + bindparam('time_delta'),
+                completion_sum=table.c.completion_sum + bindparam('completion_delta'),
+                updated_at=now
+            ),
+            [
+                {
+                    'summary_user_id': user_id,
+                    'total_delta': total,
+                    'completed_delta': completed,
+                    'time_delta': time_spent,
+                    'completion_delta': completion
+                }
+                for user_id, (total, completed, time_spent, completion) in deltas.items()
+                if user_id in existing
+            ]
+        )
+
+    missing = [user_id for user_id in user_ids if user_id not in existing]
+    if missing:
+        db.session.flush()
+        rebuild_progress_summaries(missing)
+
+def _aggregate_query():
+    return db.session.query(
+        Progress.user_id,
+        func.count(Progress.id),
+        func.sum(case((Progress.completion_percentage >= COMPLETED_THRESHOLD, 1), else_=0)),
+        func.coalesce(func.sum(Progress.time_spent), 0),
+        func.coalesce(func.sum(Progress.completion_percentage), 0.0)
+    ).group_by(Progress.user_id)
+
+def rebuild_progress_summary(user_id):
+    """
+    Recompute a user's summary from their Progress rows
+
+    The caller commits.
+
+    Returns:
+        ProgressSummary: The rebuilt summary
+    """
+    return rebuild_progress_summaries([user_id])[user_id]
+
+def rebuild_progress_summaries(user_ids):
+    """
+    Recompute the summaries of several users with one aggregate query
+
+    The caller commits.
+
+    Args:
+        user_ids (iterable): Users whose summaries to rebuild
+
+    Returns:
+        dict: ProgressSummary keyed by user ID
+    """
+    user_ids = sorted(set(user_ids))
+    totals = {}
+    summaries = {}
+    for start in range(0, len(user_ids), REBUILD_CHUNK_SIZE):
+        chunk = user_ids[start:start + REBUILD_CHUNK_SIZE]
+        totals.update(
+            (user_id, (total, completed or 0, time_spent, completion_sum))
+            for user_id, total, completed, time_spent, completion_sum
+            in _aggregate_query().filter(Progress.user_id.in_(chunk))
+        )
+        summaries.update(
+            (summary.user_id, summary)
+            for summary in db.session.query(ProgressSummary).filter(ProgressSummary.user_id.in_(chunk))
+        )
+
+    now = datetime.utcnow()
+    for user_id in user_ids:
+        summary = summaries.get(user_id)
+        if summary is None:
+            summary = summaries[user_id] = ProgressSummary(user_id=user_id)
+            db.session.add(summary)
+
+        total, completed, time_spent, completion_sum = totals.get(user_id, (0, 0, 0, 0.0))
+        summary.total_modules = total
+        summary.completed_modules = completed
+        summary.total_time_spent = time_spent
+        summary.completion_sum = completion_sum
+        summary.updated_at = now
+    return summaries
+
+def _matches(summary, expected):
+    total, completed, time_spent, completion_sum = expected
+    return (
+        summary.total_modules == total
+        and summary.completed_modules == completed
+        and summary.total_time_spent == time_spent
+        and abs(summary.completion_sum - completion_sum) <= 1e-6 * max(1.0, abs(completion_sum))
+    )
+
+def check_progress_summaries(repair=False):
+    """
+    Compare every summary with an aggregate over the raw Progress rows
+
+    Args:
+        repair (bool): Rebuild the summaries that are wrong or missing and commit
+
+    Returns:
+        list: IDs of users whose summary was wrong or missing
+    """
+    expected = {
+        user_id: (total, completed or 0, time_spent, completion_sum)
+        for user_id, total, completed, time_spent, completion_sum in _aggregate_query()
+    }
+    summaries = {summary.user_id: summary for summary in db.session.query(ProgressSummary)}
+
+    mismatched = [
+        user_id for user_id in expected
+        if user_id not in summaries or not _matches(summaries[user_id], expected[user_id])
+    ]
+    # Summaries left over for users whose progress rows are gone
+    mismatched += [
+        user_id for user_id, summary in summaries.items()
+        if user_id not in expected and not _matches(summary, (0, 0, 0, 0.0))
+    ]
+
+    if repair and mismatched:
+        rebuild_progress_summaries(mismatched)
+        db.session.commit()
+
+    return sorted(mismatched)
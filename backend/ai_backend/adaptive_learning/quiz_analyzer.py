@@ -2,7 +2,12 @@
 
 from backend.extensions import db
 from backend.ai_backend.models.progress import Progress
-from ai_backend.models.user import User
+from backend.ai_backend.adaptive_learning.progress_aggregates import COMPLETED_THRESHOLD, progress_values, record_progress_change
+from backend.ai_backend.adaptive_learning.curriculum import get_curriculum
+from backend.ai_backend.adaptive_learning.learning_rules import learning_path
+from backend.ai_backend.adaptive_learning.module_stats import record_quiz_stats, time_thresholds
+from backend.ai_backend.adaptive_learning.result_cache import bump_data_versions
+from backend.ai_backend.models.user import User
 from datetime import datetime
 
 class QuizAnalyzer:
@@ -31,6 +36,7 @@ class QuizAnalyzer:
             user_id=self.user_id,
             module_id=module_id
         ).first()
+        before = progress_values(progress) if progress else None
         
         if not progress:
             progress = Progress(
@@ -59,10 +65,18 @@ class QuizAnalyzer:
             # If score is low, only mark as partially completed
             progress.completion_percentage = max(progress.completion_percentage, 50.0)
         
+        # Compare the time with earlier results for this module, then add this one
+        fast_time, slow_time = time_thresholds(module_id)
+        record_quiz_stats(module_id, score, time_taken)
+        
+        # Keep the user's summary in step and invalidate cached results,
+        # in the same transaction
+        record_progress_change(self.user_id, before, progress)
+        bump_data_versions([self.user_id])
         db.session.commit()
         
         # Generate recommendations based on performance
-        recommendations = self._generate_recommendations(score, time_taken)
+        recommendations = self._generate_recommendations(score, time_taken, fast_time, slow_time)
         
         # Determine next module recommendation
         next_module = self._recommend_next_module(module_id, score)
@@ -88,10 +102,16 @@ class QuizAnalyzer:
         else:
             return "novice"
     
-    def _generate_recommendations(self, score, time_taken):
+    def _generate_recommendations(self, score, time_taken, fast_time, slow_time):
         """
         Generate learning recommendations based on quiz performance
         
+        Args:
+            score (float): Score as a percentage (0-100)
+            time_taken (int): Time taken in seconds, 0 if not measured
+            fast_time (float): Times below this are unusually fast for the module
+            slow_time (float): Times above this are unusually slow for the module
+        
         Returns:
             list: List of recommendation strings
         """
@@ -109,13 +129,12 @@ class QuizAnalyzer:
         else:
             recommendations.append("You're doing well! Consider exploring the advanced concepts")
         
-        # Recommendations based on time taken
-        # Assuming an average completion time of 120 seconds
-        avg_time = 120
-        if time_taken > (avg_time * 1.5) and score < 75:
+        # Recommendations based on time taken, compared with this module's
+        # 10th and 90th percentile quiz times (see time_thresholds)
+        if time_taken > slow_time and score < 75:
             # Took longer than expected and low score
             recommendations.append("Try breaking down the material into smaller chunks")
-        elif time_taken < (avg_time * 0.5) and score < 60:
+        elif 0 < time_taken < fast_time and score < 60:
             # Very quick but low score
             recommendations.append("Consider spending more time on each question")
         
@@ -126,27 +145,26 @@ class QuizAnalyzer:
         Recommend the next module based on current module and performance
         
         Returns:
-            str: Module ID for recommended next module
+            str: Module ID for recommended next module, or None if the
+            curriculum is finished
         """
-        # This would normally use a predefined learning path or curriculum map
-        # For demonstration, we'll use a simple module naming convention
-        
-        # Extract module number if format is like "module_1"
-        import re
-        match = re.match(r'module_(\d+)', current_module_id)
-        
-        if match:
-            module_num = int(match.group(1))
-            
-            if score < 50:
-                # If score is low, recommend staying on current module
-                return f"module_{module_num}"
-            else:
-                # Move to next module
-                return f"module_{module_num + 1}"
-        
-        # Default recommendation if module ID format doesn't match expected pattern
-        return "next_recommended_module"
+        if score < 50:
+            # If score is low, recommend staying on current module
+            return current_module_id
+        
+        # Move to a module the curriculum unlocks next
+        completed_modules = [
+            module_id for (module_id,) in db.session.query(Progress.module_id).filter(
+                Progress.user_id == self.user_id,
+                Progress.completion_percentage >= COMPLETED_THRESHOLD
+            )
+        ]
+        return get_curriculum().next_after(
+            current_module_id,
+            completed_modules,
+            user=self.user,
+            language=self.user.language_preference
+        )
     
     def get_learning_path(self):
         """
@@ -156,25 +174,6 @@ class QuizAnalyzer:
             list: Ordered list of module IDs representing recommended path
         """
         # Get all progress records for user
-        progress_records = Progress.query.filter_by(user_id=self.user_id).all()
-        
-        # Create dictionary of module completion percentages
-        module_completion = {record.module_id: record.completion_percentage for record in progress_records}
-        
-        # Get all incomplete modules (less than 80% complete)
-        incomplete_modules = [
-            module_id for module_id, percentage in module_completion.items()
-            if percentage < 80.0
-        ]
-        
-        # Get modules that haven't been started
-        # This would normally query a curriculum database
-        # For demonstration, we'll assume modules are named module_1, module_2, etc.
-        existing_modules = set(module_completion.keys())
-        all_modules = {f"module_{i}" for i in range(1, 11)}  # Assuming 10 modules
-        unstarted_modules = all_modules - existing_modules
-        
-        # Create learning path: first incomplete modules, then unstarted ones
-        learning_path = incomplete_modules + list(unstarted_modules)
+        progress_records = Progress.query.filter_by(user_id=self.user_id).order_by(Progress.module_id).all()
         
-        return learning_path
\ No newline at end of file
+        return learning_path(progress_records, self.user)
\ No newline at end of file
@@ -0,0 +1,189 @@
+# backend/ai_backend/adaptive_learning/result_cache.py
+
+import json
+import threading
+import time
+from collections import OrderedDict
+
+from backend.extensions import db
+from backend.ai_backend.models.user_data_version import UserDataVersion
+from backend.ai_backend.models.upsert import increment_counters
+
+def bump_data_versions(user_ids):
+    """
+    Mark users' cached results as stale
+
+    Runs in the caller's transaction, so the new version becomes visible
+    together with the data that changed.
+
+    Args:
+        user_ids (iterable): Users whose data was written
+    """
+    user_ids = sorted(set(user_ids))
+    if not user_ids:
+        return
+
+    increment_counters(UserDataVersion, ['user_id'], ['version'], [
+        {'user_id': user_id, 'version': 1} for user_id in user_ids
+    ])
+
+def data_version(user_id):
+    """Current data version of a user, 0 if nothing was written yet"""
+    version = db.session.query(UserDataVersion.version).filter_by(user_id=user_id).scalar()
+    return version or 0
+
+
+class LRUResultStore:
+    """Bounded in-process LRU store with per-entry expiry"""
+
+    def __init__(self, maxsize=4096, clock=time.monotonic):
+        self.maxsize = maxsize
+        self.clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if self.clock() >= expires_at:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl):
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (value, self.clock() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class RedisResultStore:
+    """
+    Store shared by every worker, kept in Redis
+
+    Needs the `redis` package, which is only imported when this store is
+    configured. Values are stored as JSON.
+    """
+
+    def __init__(self, url, prefix='shieldly:results:'):
+        try:
+            import redis
+        except ImportError:
+            raise RuntimeError("ADAPTIVE_RESULT_CACHE_BACKEND = 'redis' needs the redis package installed")
+        self.prefix = prefix
+        self._client = redis.Redis.from_url(url)
+
+    def get(self, key):
+        raw = self._client.get(self.prefix + key)
+        return json.loads(raw) if raw is not None else None
+
+    def set(self, key, value, ttl):
+        self._client.set(self.prefix + key, json.dumps(value), ex=max(1, int(ttl)))
+
+    def clear(self):
+        for key in self._client.scan_iter(match=self.prefix + '*'):
+            self._client.delete(key)
+
+    def __len__(self):
+        return sum(1 for _ in self._client.scan_iter(match=self.prefix + '*'))
+
+
+class ResultCache:
+    """
+    Per-user cache for computed adaptive learning results
+
+    Entries are keyed by the kind of result, the user and the user's data
+    version. Writes bump the version in the database, so entries from
+    before a write are never served again, by this worker or any other,
+    and simply age out of the store.
+    """
+
+    def __init__(self, store=None, ttl=600.0):
+        """
+        Args:
+            store: LRUResultStore, RedisResultStore or anything with get/set/clear
+            ttl (float): Seconds an entry stays valid
+        """
+        self.store = store if store is not None else LRUResultStore()
+        self.ttl = ttl
+        self.enabled = True
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def init_app(self, app):
+        """Choose the store and TTL from app config"""
+        backend = app.config.get('ADAPTIVE_RESULT_CACHE_BACKEND', 'memory')
+        if backend == 'memory':
+            self.store = LRUResultStore(app.config.get('ADAPTIVE_RESULT_CACHE_SIZE', 4096))
+        elif backend == 'redis':
+            self.store = RedisResultStore(app.config['ADAPTIVE_RESULT_CACHE_URL'])
+        else:
+            raise ValueError(f"Unknown ADAPTIVE_RESULT_CACHE_BACKEND: {backend}")
+
+        self.ttl = app.config.get('ADAPTIVE_RESULT_CACHE_TTL', self.ttl)
+        self.enabled = self.ttl > 0
+        app.extensions['result_cache'] = self
+
+    def get_or_compute(self, kind, user_id, compute):
+        """
+        Return the cached result for the user's current data, computing it on a miss
+
+        Args:
+            kind (str): Name of the result, including anything else it depends on
+            user_id (int): The user the result is for
+            compute (callable): Produces the result; exceptions are not cached
+
+        Returns:
+            The result
+        """
+        if not self.enabled:
+            return compute()
+
+        key = f'{kind}:{user_id}:{data_version(user_id)}'
+        value = self.store.get(key)
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        if value is None:
+            value = compute()
+            self.store.set(key, value, self.ttl)
+        return value
+
+    def clear(self):
+        """Drop every entry and reset the counters"""
+        self.store.clear()
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        """Counters for monitoring"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self.store),
+                'ttl': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0
+            }
+
+# Shared cache used by the adaptive learning routes
+result_cache = ResultCache()
@@ -1,11 +1,16 @@
 # backend/ai_backend/adaptive_learning/routes.py
 
-from flask import Blueprint, jsonify, request
-from extensions import db
+from flask import Blueprint, jsonify, request, current_app
+from datetime import datetime
+from backend.extensions import db
 
-from ai_backend.adaptive_learning.quiz_analyzer import QuizAnalyzer
-from ai_backend.adaptive_learning.emotional_tracking import EmotionalTracker
-from ai_backend.adaptive_learning.user_progress import UserProgressTracker
+from backend.ai_backend.adaptive_learning.quiz_analyzer import QuizAnalyzer
+from backend.ai_backend.adaptive_learning.emotional_tracking import EmotionalTracker
+from backend.ai_backend.adaptive_learning.user_progress import UserProgressTracker
+from backend.ai_backend.adaptive_learning.activity_batch import apply_activity_batch
+from backend.ai_backend.adaptive_learning.module_stats import get_module_stats
+from backend.ai_backend.adaptive_learning.emotional_history import RESOLUTIONS
+from backend.ai_backend.adaptive_learning.result_cache import result_cache
 
 # Create a Blueprint named 'adaptive_learning'
 adaptive_learning_bp = Blueprint('adaptive_learning', __name__)
@@ -77,13 +82,51 @@ def track_user_activity():
     except Exception as e:
         return jsonify({"error": "Failed to track activity", "details": str(e)}), 500
 
+# Batched activity tracking endpoint
+@adaptive_learning_bp.route('/track-activity/batch', methods=['POST'])
+def track_user_activity_batch():
+    """Record many activity heartbeats in one request"""
+    data = request.get_json()
+    
+    if not data or not isinstance(data.get('events'), list):
+        return jsonify({"error": "Missing required parameters"}), 400
+    
+    max_events = current_app.config.get('ADAPTIVE_MAX_ACTIVITY_BATCH', 1000)
+    if len(data['events']) > max_events:
+        return jsonify({"error": f"At most {max_events} events per request"}), 400
+    
+    events = []
+    for index, event in enumerate(data['events']):
+        try:
+            events.append((int(event['user_id']), str(event['module_id']), int(event['time_spent'])))
+        except (KeyError, TypeError, ValueError):
+            return jsonify({"error": f"Invalid event at index {index}"}), 400
+        if events[-1][2] < 0:
+            return jsonify({"error": f"Invalid event at index {index}"}), 400
+    
+    try:
+        result = apply_activity_batch(events)
+        return jsonify(result)
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({"error": "Failed to track activity", "details": str(e)}), 500
+
 # Get user progress summary endpoint
 @adaptive_learning_bp.route('/progress-summary/<int:user_id>', methods=['GET'])
 def get_progress_summary(user_id):
     """Get summary of user progress across all modules"""
     try:
         tracker = UserProgressTracker(user_id)
-        result = tracker.get_progress_summary()
+        strategy = current_app.config.get('PROGRESS_SUMMARY_STRATEGY', 'aggregate')
+        if strategy == 'aggregate':
+            result = tracker.get_aggregated_progress_summary(
+                current_app.config.get('PROGRESS_SUMMARY_RECENT_LIMIT'),
+                current_app.config.get('PROGRESS_SUMMARY_ATTENTION_LIMIT')
+            )
+        elif strategy == 'optimized':
+            result = tracker.get_optimized_progress_summary()
+        else:
+            result = tracker.get_progress_summary()
         return jsonify(result)
     except ValueError as e:
         return jsonify({"error": str(e)}), 404
@@ -106,8 +149,10 @@ def get_module_progress(user_id, module_id):
 def get_recommendations(user_id):
     """Get personalized learning recommendations"""
     try:
-        tracker = UserProgressTracker(user_id)
-        result = tracker.get_learning_recommendations()
+        result = result_cache.get_or_compute(
+            'recommendations', user_id,
+            lambda: UserProgressTracker(user_id).get_learning_recommendations()
+        )
         return jsonify(result)
     except ValueError as e:
         return jsonify({"error": str(e)}), 404
@@ -119,23 +164,65 @@ def get_recommendations(user_id):
 def get_emotional_trend(user_id):
     """Get analysis of user's emotional trends"""
     try:
-        tracker = EmotionalTracker(user_id)
-        result = tracker.analyze_emotional_trend()
+        # The trend window moves at midnight UTC, so the day is part of the key
+        result = result_cache.get_or_compute(
+            f'emotional-trend:{datetime.utcnow().date().isoformat()}', user_id,
+            lambda: EmotionalTracker(user_id).analyze_emotional_trend()
+        )
         return jsonify(result)
     except ValueError as e:
         return jsonify({"error": str(e)}), 404
     except Exception as e:
         return jsonify({"error": "Failed to get emotional trend analysis", "details": str(e)}), 500
 
+# Get emotional state history endpoint
+@adaptive_learning_bp.route('/emotional-history/<int:user_id>', methods=['GET'])
+def get_emotional_history(user_id):
+    """Get counts of self-reported emotional states per hour or day"""
+    resolution = request.args.get('resolution', 'day')
+    days = request.args.get('days', 30, type=int)
+    
+    if resolution not in RESOLUTIONS or days is None or days <= 0:
+        return jsonify({"error": "Invalid resolution or days"}), 400
+    
+    try:
+        tracker = EmotionalTracker(user_id)
+        result = tracker.get_emotional_history(days, resolution)
+        return jsonify(result)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 404
+    except Exception as e:
+        return jsonify({"error": "Failed to get emotional history", "details": str(e)}), 500
+
 # Get learning path endpoint
 @adaptive_learning_bp.route('/learning-path/<int:user_id>', methods=['GET'])
 def get_learning_path(user_id):
     """Get personalized learning path"""
     try:
-        analyzer = QuizAnalyzer(user_id)
-        result = analyzer.get_learning_path()
+        result = result_cache.get_or_compute(
+            'learning-path', user_id,
+            lambda: QuizAnalyzer(user_id).get_learning_path()
+        )
         return jsonify(result)
     except ValueError as e:
         return jsonify({"error": str(e)}), 404
     except Exception as e:
-        return jsonify({"error": "Failed to get learning path", "details": str(e)}), 500
\ No newline at end of file
+        return jsonify({"error": "Failed to get learning path", "details": str(e)}), 500
+
+# Get module quiz statistics endpoint
+@adaptive_learning_bp.route('/module-stats/<module_id>', methods=['GET'])
+def get_module_statistics(module_id):
+    """Get running quiz score and time statistics for a module"""
+    try:
+        result = get_module_stats(module_id)
+        if result is None:
+            return jsonify({"error": f"No quiz results for module {module_id}"}), 404
+        return jsonify(result)
+    except Exception as e:
+        return jsonify({"error": "Failed to get module statistics", "details": str(e)}), 500
+
+# Result cache counters endpoint
+@adaptive_learning_bp.route('/cache-stats', methods=['GET'])
+def get_result_cache_stats():
+    """Get hit and miss counters of the recommendation result cache"""
+    return jsonify(result_cache.stats())
\ No newline at end of file
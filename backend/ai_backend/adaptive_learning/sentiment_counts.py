@@ -0,0 +1,87 @@
+# backend/ai_backend/adaptive_learning/sentiment_counts.py
+
+from backend.extensions import db
+from backend.ai_backend.models.interaction import Interaction
+from backend.ai_backend.models.sentiment_daily_count import SentimentDailyCount
+from backend.ai_backend.models.upsert import increment_counters
+from datetime import datetime, timedelta
+
+# Sentiments counted, each stored in the column of the same name
+SENTIMENTS = ('neutral', 'concerned', 'urgent')
+
+# Days read by the emotional trend, including today
+TREND_WINDOW_DAYS = 7
+
+def _daily_increments(rows):
+    """Sum interaction rows into {(user_id, day): {sentiment: count}}"""
+    increments = {}
+    for row in rows:
+        sentiment = row.get('sentiment')
+        if sentiment not in SENTIMENTS:
+            continue
+        key = (row['user_id'], row['timestamp'].date())
+        counts = increments.setdefault(key, dict.fromkeys(SENTIMENTS, 0))
+        counts[sentiment] += 1
+    return increments
+
+def record_sentiment_counts(rows):
+    """
+    Add interaction rows to their users' daily sentiment counters
+
+    Each (user, day) is incremented once, with one upsert per chunk. Runs
+    in the caller's transaction, so the counters commit together with the
+    interactions.
+
+    Args:
+        rows (list): Interaction column dicts with user_id, timestamp and sentiment
+    """
+    values = [
+        {'user_id': user_id, 'day': day, **counts}
+        for (user_id, day), counts in _daily_increments(rows).items()
+    ]
+    increment_counters(SentimentDailyCount, ['user_id', 'day'], SENTIMENTS, values)
+
+def recent_sentiment_counts(user_id, days=TREND_WINDOW_DAYS):
+    """
+    Get a user's daily sentiment counts for the last `days` days, oldest first
+
+    Returns:
+        list: One {sentiment: count} dict per day that has interactions
+    """
+    first_day = datetime.utcnow().date() - timedelta(days=days - 1)
+    buckets = SentimentDailyCount.query.filter(
+        SentimentDailyCount.user_id == user_id,
+        SentimentDailyCount.day >= first_day
+    ).order_by(SentimentDailyCount.day).all()
+
+    return [
+        {sentiment: getattr(bucket, sentiment) for sentiment in SENTIMENTS}
+        for bucket in buckets
+    ]
+
+def backfill_sentiment_counts(days=TREND_WINDOW_DAYS):
+    """
+    Build empty sentiment counters from the stored interactions
+
+    Only the trend window is read, since older days are never used. Does
+    nothing if any counters exist. Commits.
+
+    Returns:
+        int: Number of interactions counted
+    """
+    if db.session.query(SentimentDailyCount.user_id).first() is not None:
+        return 0
+
+    first_day = datetime.utcnow().date() - timedelta(days=days - 1)
+    rows = [
+        {'user_id': user_id, 'timestamp': timestamp, 'sentiment': sentiment}
+        for user_id, timestamp, sentiment in db.session.query(
+            Interaction.user_id, Interaction.timestamp, Interaction.sentiment
+        ).filter(
+            Interaction.timestamp >= datetime.combine(first_day, datetime.min.time()),
+            Interaction.sentiment.isnot(None)
+        )
+    ]
+    record_sentiment_counts(rows)
+    db.session.commit()
+    return len(rows)
@@ -2,12 +2,21 @@
 
 from backend.extensions import db
 from backend.ai_backend.models.progress import Progress
-from ai_backend.models.user import User
+from backend.ai_backend.models.progress_summary import ProgressSummary
+from backend.ai_backend.adaptive_learning.progress_aggregates import progress_values, record_progress_change, rebuild_progress_summary
+from backend.ai_backend.adaptive_learning.learning_rules import learning_recommendations
+from backend.ai_backend.adaptive_learning.result_cache import bump_data_versions
+from backend.ai_backend.models.user import User
 from datetime import datetime, timedelta
+from sqlalchemy import case, func
 
 class UserProgressTracker:
     """Tracks and analyzes user progress through learning modules"""
     
+    # Size of the module lists in the optimized summary
+    RECENT_MODULES_LIMIT = 10
+    ATTENTION_MODULES_LIMIT = 5
+    
     def __init__(self, user_id):
         self.user_id = user_id
         self.user = User.query.get(user_id)
@@ -30,6 +39,7 @@ class UserProgressTracker:
             user_id=self.user_id,
             module_id=module_id
         ).first()
+        before = progress_values(progress) if progress else None
         
         if not progress:
             progress = Progress(
@@ -52,6 +62,10 @@ class UserProgressTracker:
             time_based_completion = min(100.0, (progress.time_spent / target_time) * 100)
             progress.completion_percentage = max(progress.completion_percentage, time_based_completion)
         
+        # Keep the user's summary in step and invalidate cached results,
+        # in the same transaction
+        record_progress_change(self.user_id, before, progress)
+        bump_data_versions([self.user_id])
         db.session.commit()
         
         return {
@@ -162,147 +176,101 @@ class UserProgressTracker:
             list: Recommended modules and content
         """
         # Get all progress records
-        progress_records = Progress.query.filter_by(user_id=self.user_id).all()
+        progress_records = Progress.query.filter_by(user_id=self.user_id).order_by(Progress.module_id).all()
         
-        recommendations = []
-        
-        # If user has no progress yet, recommend starting modules
-        if not progress_records:
-            recommendations.append({
-                'type': 'module',
-                'id': 'module_1',
-                'reason': 'recommended_starting_point'
-            })
-            return recommendations
+        return learning_recommendations(progress_records, self.user)
+    
+    def get_optimized_progress_summary(self):
+        """
+        Get summary of user's progress across all modules with optimized queries
         
-        # Check for incomplete modules
-        incomplete_modules = [p for p in progress_records if p.completion_percentage < 100.0]
-        if incomplete_modules:
-            # Sort by completion percentage (highest first) to recommend most nearly complete modules first
-            incomplete_modules.sort(key=lambda p: p.completion_percentage, reverse=True)
-            for module in incomplete_modules[:3]:  # Recommend up to 3 incomplete modules
-                recommendations.append({
-                    'type': 'module',
-                    'id': module.module_id,
-                    'completion_percentage': module.completion_percentage,
-                    'reason': 'continue_progress'
-                })
+        One aggregate query computes the totals in the database; the module
+        lists come from two bounded queries.
         
-        # Check for modules with low quiz scores that might need review
-        low_score_modules = [
-            p for p in progress_records 
-            if p.quiz_score is not None and p.quiz_score < 70.0 and p.completion_percentage >= 100.0
-        ]
-        if low_score_modules:
-            # Sort by quiz score (lowest first) to prioritize modules with lowest scores
-            low_score_modules.sort(key=lambda p: p.quiz_score)
-            for module in low_score_modules[:2]:  # Recommend up to 2 modules to review
-                recommendations.append({
-                    'type': 'review',
-                    'id': module.module_id,
-                    'quiz_score': module.quiz_score,
-                    'reason': 'review_material'
-                })
+        Returns:
+            dict: Summary of user progress
+        """
+        # Get total modules and completion stats in one query
+        stats = db.session.query(
+            func.count(Progress.id).label('total_modules'),
+            func.coalesce(func.sum(
+                case((Progress.completion_percentage >= 100.0, 1), else_=0)
+            ), 0).label('completed_modules'),
+            func.coalesce(func.sum(Progress.time_spent), 0).label('total_time_spent'),
+            func.coalesce(func.avg(Progress.completion_percentage), 0.0).label('avg_completion')
+        ).filter(Progress.user_id == self.user_id).one()
         
-        # Check for next logical module in sequence
-        completed_modules = [p.module_id for p in progress_records if p.completion_percentage >= 100.0]
-        if completed_modules:
-            # Simplified approach - assuming modules are named like "module_1", "module_2", etc.
-            import re
-            module_numbers = []
-            for module_id in completed_modules:
-                match = re.match(r'module_(\d+)', module_id)
-                if match:
-                    module_numbers.append(int(match.group(1)))
-            
-            if module_numbers:
-                next_module_num = max(module_numbers) + 1
-                next_module_id = f'module_{next_module_num}'
-                
-                # Check if this next module is already in recommendations
-                if not any(r['id'] == next_module_id for r in recommendations):
-                    recommendations.append({
-                        'type': 'module',
-                        'id': next_module_id,
-                        'reason': 'next_in_sequence'
-                    })
+        recent_cutoff = datetime.utcnow() - timedelta(days=7)
         
-        return recommendations
-   
-    # backend/ai_backend/adaptive_learning/user_progress.py
-
-# Add these optimized methods to your UserProgressTracker class
-
-    def get_optimized_progress_summary(self):
+        return {
+            'total_modules': stats.total_modules,
+            'completed_modules': stats.completed_modules,
+            'completion_rate': stats.completed_modules / stats.total_modules if stats.total_modules > 0 else 0,
+            'total_time_spent': stats.total_time_spent,
+            'average_completion': stats.avg_completion,
+            'recent_modules': self._recent_modules(recent_cutoff, self.RECENT_MODULES_LIMIT),
+            'needs_attention': self._attention_modules(recent_cutoff, self.ATTENTION_MODULES_LIMIT)
+        }
+    
+    def get_aggregated_progress_summary(self, recent_limit=None, attention_limit=None):
         """
-        Get summary of user's progress across all modules with optimized queries
+        Get summary of user's progress from the maintained ProgressSummary row
         
+        Totals are read from one row instead of scanning every Progress
+        record; the module lists come from two indexed queries.
+        
+        Args:
+            recent_limit (int): Longest recent_modules list, or None for all
+            attention_limit (int): Longest needs_attention list, or None for all
+            
         Returns:
             dict: Summary of user progress
         """
-        try:
-            # Use a single query with aggregate functions
-            from sqlalchemy import func
-            
-            # Get total modules and completion stats in one query
-            stats = db.session.query(
-                func.count().label('total_modules'),
-                func.sum(
-                    func.case(
-                        [(Progress.completion_percentage >= 100.0, 1)], 
-                        else_=0
-                    )
-                ).label('completed_modules'),
-                func.sum(Progress.time_spent).label('total_time_spent'),
-                func.avg(Progress.completion_percentage).label('avg_completion')
-            ).filter_by(user_id=self.user_id).first()
-            
-            # Get recent modules - use limit to avoid large result sets
-            recent_cutoff = datetime.utcnow() - timedelta(days=7)
-            recent_modules = Progress.query.filter_by(user_id=self.user_id).filter(
-                Progress.last_activity >= recent_cutoff
-            ).order_by(Progress.last_activity.desc()).limit(10).all()
-            
-            recent_module_data = [
-                {
-                    'module_id': p.module_id,
-                    'last_activity': p.last_activity.isoformat(),
-                    'completion_percentage': p.completion_percentage
-                }
-                for p in recent_modules
-            ]
-            
-            # Get modules needing attention - with efficient filters
-            attention_modules = Progress.query.filter_by(user_id=self.user_id).filter(
-                Progress.completion_percentage < 100.0,
-                Progress.last_activity < recent_cutoff
-            ).order_by(Progress.completion_percentage.asc()).limit(5).all()
-            
-            attention_module_data = [
-                {
-                    'module_id': p.module_id,
-                    'completion_percentage': p.completion_percentage,
-                    'last_activity': p.last_activity.isoformat()
-                }
-                for p in attention_modules
-            ]
-            
-            # Calculate completion rate safely
-            completion_rate = (
-                stats.completed_modules / stats.total_modules 
-                if stats.total_modules > 0 else 0
-            )
-            
-            return {
-                'total_modules': stats.total_modules,
-                'completed_modules': stats.completed_modules,
-                'completion_rate': completion_rate,
-                'total_time_spent': stats.total_time_spent,
-                'average_completion': stats.avg_completion or 0,
-                'recent_modules': recent_module_data,
-                'needs_attention': attention_module_data
+        summary = db.session.get(ProgressSummary, self.user_id)
+        if summary is None:
+            summary = rebuild_progress_summary(self.user_id)
+            db.session.commit()
+        
+        total_modules = summary.total_modules
+        recent_cutoff = datetime.utcnow() - timedelta(days=7)
+        
+        return {
+            'total_modules': total_modules,
+            'completed_modules': summary.completed_modules,
+            'completion_rate': summary.completed_modules / total_modules if total_modules > 0 else 0,
+            'total_time_spent': summary.total_time_spent,
+            'average_completion': summary.completion_sum / total_modules if total_modules > 0 else 0,
+            'recent_modules': self._recent_modules(recent_cutoff, recent_limit),
+            'needs_attention': self._attention_modules(recent_cutoff, attention_limit)
+        }
+    
+    def _recent_modules(self, recent_cutoff, limit=None):
+        """Most recently active modules first, at most `limit` of them"""
+        recent_modules = Progress.query.filter_by(user_id=self.user_id).filter(
+            Progress.last_activity >= recent_cutoff
+        ).order_by(Progress.last_activity.desc(), Progress.module_id).limit(limit).all()
+        
+        return [
+            {
+                'module_id': p.module_id,
+                'last_activity': p.last_activity.isoformat(),
+                'completion_percentage': p.completion_percentage
+            }
+            for p in recent_modules
+        ]
+    
+    def _attention_modules(self, recent_cutoff, limit=None):
+        """Least complete modules that have not been active recently, at most `limit` of them"""
+        attention_modules = Progress.query.filter_by(user_id=self.user_id).filter(
+            Progress.completion_percentage < 100.0,
+            Progress.last_activity < recent_cutoff
+        ).order_by(Progress.completion_percentage.asc(), Progress.module_id).limit(limit).all()
+        
+        return [
+            {
+                'module_id': p.module_id,
+                'completion_percentage': p.completion_percentage,
+                'last_activity': p.last_activity.isoformat()
             }
-        except Exception as e:
-            print(f"Error generating optimized progress summary: {e}")
-            # Fall back to standard method if optimization fails
-            return self.get_progress_summary()
\ No newline at end of file
+            for p in attention_modules
+        ]
\ No newline at end of file
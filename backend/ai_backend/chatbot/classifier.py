@@ -0,0 +1,142 @@
+# backend/ai_backend/chatbot/classifier.py
+
+import re
+from collections import namedtuple
+
+from backend.ai_backend.chatbot.safety_responses import KEYWORD_MAPPING
+
+# Keywords that mark a query as a safety question
+SAFETY_KEYWORDS = [
+    'abuse', 'assault', 'harassment', 'threat', 'violence', 'inappropriate',
+    'touch', 'unsafe', 'uncomfortable', 'help', 'danger', 'scared', 'afraid',
+    'consent', 'boundaries', 'protect', 'tell someone', 'report'
+]
+
+# Keywords used for the simple sentiment analysis
+NEGATIVE_WORDS = ['scared', 'afraid', 'worried', 'anxious', 'sad', 'upset',
+                  'confused', 'hurt', 'alone', 'helpless', 'threatened']
+
+NEUTRAL_WORDS = ['what', 'how', 'when', 'where', 'who', 'which', 'why',
+                 'information', 'explain', 'tell', 'know']
+
+URGENT_WORDS = ['emergency', 'help', 'now', 'dangerous', 'immediately', 'urgent']
+
+# Words are split the same way `\b` splits them in the old per-keyword regexes
+_TOKEN_RE = re.compile(r'\w+')
+
+Classification = namedtuple('Classification', ['query_type', 'sentiment', 'sentiment_counts', 'category'])
+
+
+def tokenize(text):
+    """Lowercase text and split it into word tokens"""
+    return _TOKEN_RE.findall(text.lower())
+
+
+class KeywordClassifier:
+    """
+    Precompiled keyword classifier for chatbot queries
+
+    Every keyword and phrase is indexed once by its first token, so a query
+    is classified with a single scan over its tokens instead of one regex
+    search per keyword.
+    """
+
+    def __init__(self, safety_keywords, negative_words, neutral_words, urgent_words, keyword_mapping):
+        self.categories = list(keyword_mapping)
+        self._phrases = {}
+
+        for keyword in safety_keywords:
+            self._entry(keyword)['safety'] = True
+        for label, words in (('negative', negative_words), ('neutral', neutral_words), ('urgent', urgent_words)):
+            for word in words:
+                self._entry(word)['sentiment'].add(label)
+        for rank, keywords in enumerate(keyword_mapping.values()):
+            for keyword in keywords:
+                entry = self._entry(keyword)
+                entry['category'] = min(entry['category'], rank)
+
+        # Index phrases by their first token; longer phrases are tried first
+        self._by_head = {}
+        for tokens, entry in self._phrases.items():
+            self._by_head.setdefault(tokens[0], []).append((tokens[1:], entry))
+        for candidates in self._by_head.values():
+            candidates.sort(key=lambda c: len(c[0]), reverse=True)
+
+    def _entry(self, phrase):
+        tokens = tuple(tokenize(phrase))
+        if tokens not in self._phrases:
+            self._phrases[tokens] = {
+                'tokens': tokens,
+                'safety': False,
+                'sentiment': set(),
+                'category': len(self.categories)
+            }
+        return self._phrases[tokens]
+
+    def match(self, tokens):
+        """
+        Find every indexed keyword or phrase present in a token list
+
+        Args:
+            tokens (list): Lowercased word tokens
+
+        Returns:
+            list: Matched entries, each keyword reported once
+        """
+        matched = {}
+        by_head = self._by_head
+        for i, token in enumerate(tokens):
+            candidates = by_head.get(token)
+            if not candidates:
+                continue
+            for tail, entry in candidates:
+                end = i + 1 + len(tail)
+                if not tail or tuple(tokens[i + 1:end]) == tail:
+                    matched[entry['tokens']] = entry
+        return list(matched.values())
+
+    def classify(self, query):
+        """
+        Classify a query in one pass over its tokens
+
+        Args:
+            query (str): The (English) user query
+
+        Returns:
+            Classification: Query type, sentiment, sentiment counts and the
+            matching KEYWORD_MAPPING category (or None)
+        """
+        counts = {'negative': 0, 'neutral': 0, 'urgent': 0}
+        is_safety = False
+        category_rank = len(self.categories)
+
+        for entry in self.match(tokenize(query)):
+            is_safety = is_safety or entry['safety']
+            for label in entry['sentiment']:
+                counts[label] += 1
+            category_rank = min(category_rank, entry['category'])
+
+        if counts['urgent'] > 0:
+            sentiment = 'urgent'
+        elif counts['negative'] > counts['neutral']:
+            sentiment = 'concerned'
+        else:
+            sentiment = 'neutral'
+
+        category = self.categories[category_rank] if category_rank < len(self.categories) else None
+
+        return Classification(
+            query_type='safety_question' if is_safety else 'general',
+            sentiment=sentiment,
+            sentiment_counts=counts,
+            category=category
+        )
+
+
+# Built once at import and shared by every request
+classifier = KeywordClassifier(SAFETY_KEYWORDS, NEGATIVE_WORDS, NEUTRAL_WORDS, URGENT_WORDS, KEYWORD_MAPPING)
+
+
+def classify_query(query):
+    """Classify a query with the shared precompiled classifier"""
+    return classifier.classify(query)
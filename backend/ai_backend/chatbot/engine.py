@@ -1,21 +1,41 @@
 # backend/ai_backend/chatbot/engine.py
 
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, current_app
 import json
-import re
+import time
 from datetime import datetime
 
-from backend.extensions import db
-from ai_backend.models.interaction import Interaction
-from ai_backend.models.user import User
-from ai_backend.chatbot.safety_responses import get_safety_response
-from ai_backend.chatbot.multilingual import translate_text, detect_language
+from backend.ai_backend.models.user import User
+from backend.ai_backend.chatbot.safety_responses import find_safety_response, response_catalog
+from backend.ai_backend.chatbot.general_responses import GENERAL_RESPONSES, select_general_response
+from backend.ai_backend.chatbot.translated_catalog import localize_safety_response, localize_general_response
+from backend.ai_backend.chatbot.classifier import classify_query
+from backend.ai_backend.chatbot.multilingual import (
+    SUPPORTED_LANGUAGES, translate_text, detect_language, detect_languages, get_dictionary_version
+)
+from backend.ai_backend.chatbot.persistence import interaction_writer
+from backend.ai_backend.chatbot.response_cache import ResponseCache, normalize_query
+from backend.ai_backend.chatbot.urgent import answer_urgent_query
+from backend.ai_backend.chatbot.metrics import LatencyHistogram
 
 chatbot_bp = Blueprint('chatbot', __name__)
 
+def _content_version(key, result):
+    """Versions of the catalog and dictionary an answer was built from"""
+    language = result['language']
+    dictionary_version = get_dictionary_version(language) if language != 'en' else 0
+    return (response_catalog.version, dictionary_version)
+
+# Answers keyed by (normalized query, requested language)
+response_cache = ResponseCache(_content_version)
+
+# Time spent answering urgent queries on the fast lane
+urgent_latency = LatencyHistogram()
+
 @chatbot_bp.route('/response', methods=['POST'])
 def get_response():
     """Process user query and return appropriate response"""
+    started = time.perf_counter()
     data = request.get_json()
     
     if not data or 'query' not in data or 'user_id' not in data:
@@ -24,49 +44,37 @@ def get_response():
     user_query = data['query']
     user_id = data['user_id']
     
+    # Both lanes use the request's language when it is a supported one, and
+    # detect the query's language otherwise
+    language = data.get('language')
+    if not isinstance(language, str) or language not in SUPPORTED_LANGUAGES:
+        language = None
+    
+    # Urgent queries get the crisis response straight away; the user lookup
+    # and persistence happen after the response has been sent
+    urgent = answer_urgent_query(user_query, language)
+    if urgent is not None:
+        interaction_writer.defer([_interaction_row(user_id, user_query, urgent, datetime.utcnow())])
+        response = jsonify({
+            "response": urgent['response'],
+            "query_type": urgent['query_type'],
+            "sentiment": urgent['sentiment']
+        })
+        urgent_latency.observe(time.perf_counter() - started)
+        return response
+    
     # Find user or return error
     user = User.query.get(user_id)
     if not user:
         return jsonify({"error": "User not found"}), 404
     
-    # Detect language if not specified
-    lang = data.get('language', user.language_preference)
-    
-    # If input is not in English, translate for processing
-    original_language = detect_language(user_query)
-    if original_language != 'en':
-        query_for_processing = translate_text(user_query, source=original_language, target='en')
-    else:
-        query_for_processing = user_query
-    
-    # Determine query type and sentiment
-    query_type = determine_query_type(query_for_processing)
-    sentiment = analyze_sentiment(query_for_processing)
-    
-    # Get appropriate response
-    if query_type == 'safety_question':
-        response_text = get_safety_response(query_for_processing)
-    else:
-        response_text = get_general_response(query_for_processing)
-    
-    # Translate response back if needed
-    if original_language != 'en':
-        response_text = translate_text(response_text, source='en', target=original_language)
-    
-    # Store interaction in database
-    new_interaction = Interaction(
-        user_id=user_id,
-        query=user_query,
-        response=response_text,
-        query_type=query_type,
-        sentiment=sentiment
-    )
-    db.session.add(new_interaction)
-    db.session.commit()
+    result = answer_query(user_query, language)
+    response_text = result['response']
+    query_type = result['query_type']
+    sentiment = result['sentiment']
     
-    # Update user's last active timestamp
-    user.last_active = datetime.utcnow()
-    db.session.commit()
+    # Store interaction and update the user's last active timestamp
+    interaction_writer.record([_interaction_row(user_id, user_query, result, datetime.utcnow())])
     
     return jsonify({
         "response": response_text,
@@ -74,57 +82,135 @@ def get_response():
         "sentiment": sentiment
     })
 
-def determine_query_type(query):
-    """Determine the type of query based on content analysis"""
-    # List of keywords related to safety questions
-    safety_keywords = [
-        'abuse', 'assault', 'harassment', 'threat', 'violence', 'inappropriate',
-        'touch', 'unsafe', 'uncomfortable', 'help', 'danger', 'scared', 'afraid',
-        'consent', 'boundaries', 'protect', 'tell someone', 'report'
-    ]
+@chatbot_bp.route('/responses', methods=['POST'])
+def get_responses():
+    """Process a batch of queries from one user and return responses in order"""
+    data = request.get_json()
     
-    # Check if query contains safety keywords
-    for keyword in safety_keywords:
-        if re.search(r'\b' + keyword + r'\b', query.lower()):
-            return 'safety_question'
+    if not data or 'queries' not in data or 'user_id' not in data:
+        return jsonify({"error": "Missing required parameters"}), 400
     
-    return 'general'
-
-def analyze_sentiment(query):
-    """Basic sentiment analysis to detect user emotional state"""
-    # Simplified sentiment analysis - in a real app, use a proper NLP library
-    negative_words = ['scared', 'afraid', 'worried', 'anxious', 'sad', 'upset', 
-                      'confused', 'hurt', 'alone', 'helpless', 'threatened']
+    queries = data['queries']
+    if not isinstance(queries, list) or not all(isinstance(q, str) for q in queries):
+        return jsonify({"error": "queries must be a list of strings"}), 400
     
-    neutral_words = ['what', 'how', 'when', 'where', 'who', 'which', 'why', 
-                     'information', 'explain', 'tell', 'know']
+    max_batch_size = current_app.config.get('CHATBOT_MAX_BATCH_SIZE', 50)
+    if len(queries) > max_batch_size:
+        return jsonify({"error": f"At most {max_batch_size} queries per request"}), 400
     
-    urgent_words = ['emergency', 'help', 'now', 'dangerous', 'immediately', 'urgent']
+    # Find user once for the whole batch
+    user = User.query.get(data['user_id'])
+    if not user:
+        return jsonify({"error": "User not found"}), 404
     
-    # Count occurrences of each type of word
-    negative_count = sum(1 for word in negative_words if re.search(r'\b' + word + r'\b', query.lower()))
-    neutral_count = sum(1 for word in neutral_words if re.search(r'\b' + word + r'\b', query.lower()))
-    urgent_count = sum(1 for word in urgent_words if re.search(r'\b' + word + r'\b', query.lower()))
+    # Detect all languages in one vectorized pass
+    languages = detect_languages(queries)
+    results = [answer_query(query, language) for query, language in zip(queries, languages)]
     
-    # Determine sentiment based on counts
-    if urgent_count > 0:
-        return 'urgent'
-    elif negative_count > neutral_count:
-        return 'concerned'
-    else:
-        return 'neutral'
+    # Store every interaction in one batch
+    now = datetime.utcnow()
+    interaction_writer.record([
+        _interaction_row(user.id, query, result, now)
+        for query, result in zip(queries, results)
+    ])
+    
+    return jsonify({
+        "responses": [
+            {
+                "response": result['response'],
+                "query_type": result['query_type'],
+                "sentiment": result['sentiment']
+            }
+            for result in results
+        ]
+    })
 
-def get_general_response(query):
-    """Generate general responses for non-safety queries"""
-    # In a real application, this would use a more sophisticated NLP model
-    if 'hello' in query.lower() or 'hi' in query.lower():
-        return "Hello! I'm here to provide information and support. How can I help you today?"
+def _interaction_row(user_id, query, result, timestamp):
+    """Build the Interaction column values for one answered query"""
+    return {
+        'user_id': user_id,
+        'query': query,
+        'response': result['response'],
+        'query_type': result['query_type'],
+        'sentiment': result['sentiment'],
+        'timestamp': timestamp
+    }
+
+@chatbot_bp.route('/cache-stats', methods=['GET'])
+def get_cache_stats():
+    """Hit/miss counters of the response cache"""
+    return jsonify(response_cache.stats())
+
+@chatbot_bp.route('/metrics', methods=['GET'])
+def get_metrics():
+    """Latency of the urgent fast lane against its p99 budget"""
+    return jsonify({
+        "urgent_latency": urgent_latency.snapshot(),
+        "urgent_p99_budget_ms": current_app.config.get('CHATBOT_URGENT_P99_BUDGET_MS')
+    })
+
+def answer_query(user_query, original_language=None):
+    """
+    Answer a single query, served from the response cache when possible
+    
+    Args:
+        user_query (str): The query as typed by the user
+        original_language (str): Language of the query, detected if not given
+        
+    Returns:
+        dict: Response text, query type, sentiment and language
+    """
+    # The pipeline ignores case and spacing, so answers are shared by
+    # every query that normalizes to the same text
+    normalized = normalize_query(user_query)
+    result = response_cache.get_or_compute(
+        (normalized, original_language),
+        lambda: _answer_query(normalized, original_language)
+    )
+    return dict(result)
+
+def _answer_query(user_query, original_language=None):
+    """Run the classification, response and translation pipeline"""
+    urgent = answer_urgent_query(user_query, original_language)
+    if urgent is not None:
+        return urgent
     
-    elif 'who are you' in query.lower() or 'what is shieldly' in query.lower():
-        return "I'm an AI assistant from Shieldly. We're dedicated to providing education and support around sexual abuse awareness."
+    if original_language is None:
+        original_language = detect_language(user_query)
     
-    elif 'how does this work' in query.lower() or 'what can you do' in query.lower():
-        return "You can ask me questions about personal safety, boundaries, and related topics. I can provide information, resources, and support."
+    # If input is not in English, translate for processing
+    if original_language != 'en':
+        query_for_processing = translate_text(user_query, source=original_language, target='en')
+    else:
+        query_for_processing = user_query
     
+    # Determine query type, sentiment and safety category in one pass
+    classification = classify_query(query_for_processing)
+    
+    # Get appropriate response, pre-translated into the user's language
+    if classification.query_type == 'safety_question':
+        match = find_safety_response(query_for_processing, category=classification.category)
+        response_text = localize_safety_response(match, original_language)
     else:
-        return "I'm not sure I understand your question. Could you try rephrasing it? If you need information about personal safety or resources, please let me know."
\ No newline at end of file
+        key = select_general_response(query_for_processing)
+        response_text = localize_general_response(key, original_language)
+    
+    return {
+        'response': response_text,
+        'query_type': classification.query_type,
+        'sentiment': classification.sentiment,
+        'language': original_language
+    }
+
+def determine_query_type(query):
+    """Determine the type of query based on content analysis"""
+    return classify_query(query).query_type
+
+def analyze_sentiment(query):
+    """Basic sentiment analysis to detect user emotional state"""
+    # Simplified sentiment analysis - in a real app, use a proper NLP library
+    return classify_query(query).sentiment
+
+def get_general_response(query):
+    """Generate general responses for non-safety queries"""
+    return GENERAL_RESPONSES[select_general_response(query)]
\ No newline at end of file
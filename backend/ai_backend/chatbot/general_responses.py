@@ -0,0 +1,22 @@
+# backend/ai_backend/chatbot/general_responses.py
+
+# Canned answers for queries that are not safety questions
+GENERAL_RESPONSES = {
+    "greeting": "Hello! I'm here to provide information and support. How can I help you today?",
+    "about": "I'm an AI assistant from Shieldly. We're dedicated to providing education and support around sexual abuse awareness.",
+    "capabilities": "You can ask me questions about personal safety, boundaries, and related topics. I can provide information, resources, and support.",
+    "unknown": "I'm not sure I understand your question. Could you try rephrasing it? If you need information about personal safety or resources, please let me know."
+}
+
+def select_general_response(query):
+    """Pick the GENERAL_RESPONSES key for a non-safety query"""
+    # In a real application, this would use a more sophisticated NLP model
+    query_lower = query.lower()
+    if 'hello' in query_lower or 'hi' in query_lower:
+        return "greeting"
+    elif 'who are you' in query_lower or 'what is shieldly' in query_lower:
+        return "about"
+    elif 'how does this work' in query_lower or 'what can you do' in query_lower:
+        return "capabilities"
+    else:
+        return "unknown"
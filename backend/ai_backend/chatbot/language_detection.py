@@ -0,0 +1,313 @@
+# backend/ai_backend/chatbot/language_detection.py
+
+import re
+import struct
+from operator import itemgetter
+
+import numpy as np
+
+# Number of hash buckets per n-gram profile
+PROFILE_SIZE = 1 << 14
+
+# Character n-gram lengths used for the profiles
+NGRAM_ORDERS = (1, 2, 3)
+
+# Separator between texts in a batch
+_SEPARATOR = '\x00'
+
+# Letter lookup for code points below this bound; anything above (CJK,
+# emoji planes, ...) is treated as a letter
+_LETTER_TABLE_SIZE = 0x3000
+_IS_LETTER = np.array([chr(code).isalpha() for code in range(_LETTER_TABLE_SIZE)] + [True])
+
+# Bucket for n-grams that straddle two texts; its profile weights are zero
+_NULL_BUCKET = PROFILE_SIZE
+
+# 32-bit multiplicative hashing of code point sequences
+_HASH_MULTIPLIER = np.uint32(0x9E3779B1)
+_HASH_STEP = np.uint32(0x01000193)
+_HASH_SHIFT = np.uint32(32 - PROFILE_SIZE.bit_length() + 1)
+
+# Single texts up to this many characters are scored in pure Python
+FAST_PATH_MAX_LENGTH = 1000
+
+# Whitespace-separated tokens whose summed weights are kept for the fast path
+TOKEN_CACHE_SIZE = 50000
+
+# Recently detected single texts whose language is kept
+TEXT_CACHE_SIZE = 4096
+
+# Fast path scores are fixed-point integers, one 64-bit lane per language.
+# Profile weights are float32 log-probabilities of magnitude above 1/2, so
+# scaled by 2**24 they are exact integers; the offset keeps every lane
+# positive and, being added for every language, does not change the ranking.
+_FIXED_POINT_SCALE = 1 << 24
+_FIXED_POINT_OFFSET = 32
+_LANE_BITS = 64
+
+_token_sum = itemgetter(0)
+_token_first = itemgetter(1)
+_token_crossings = itemgetter(2)
+
+
+def _letter_run_pattern():
+    """Regex for runs of the characters _normalized_codes keeps as letters"""
+    ranges = []
+    for code in np.flatnonzero(_IS_LETTER[:_LETTER_TABLE_SIZE]).tolist():
+        if ranges and ranges[-1][1] == code - 1:
+            ranges[-1][1] = code
+        else:
+            ranges.append([code, code])
+    ranges.append([_LETTER_TABLE_SIZE, 0x10FFFF])
+    return re.compile('[' + ''.join(f'{re.escape(chr(first))}-{re.escape(chr(last))}' for first, last in ranges) + ']+')
+
+# Words of a lowercased text, as separated by _normalized_codes
+_LETTER_RUN = _letter_run_pattern()
+
+
+def _normalized_codes(texts):
+    """
+    Lowercase and join texts into one array of code points
+
+    Every run of non-letters becomes a single space; each text is padded
+    with spaces and terminated by a 0 separator.
+    """
+    joined = ' ' + f' {_SEPARATOR} '.join(texts) + f' {_SEPARATOR}'
+    if joined.count(_SEPARATOR) != len(texts):
+        joined = ' ' + f' {_SEPARATOR} '.join(t.replace(_SEPARATOR, ' ') for t in texts) + f' {_SEPARATOR}'
+
+    codes = np.frombuffer(joined.lower().encode('utf-32-le'), dtype='<u4')
+    is_letter = np.take(_IS_LETTER, np.minimum(codes, _LETTER_TABLE_SIZE))
+    codes = np.where(is_letter | (codes == 0), codes, np.uint32(32))
+
+    # Collapse runs of spaces
+    is_space = codes == 32
+    keep = np.ones(len(codes), dtype=bool)
+    keep[1:] = ~(is_space[1:] & is_space[:-1])
+    return codes[keep]
+
+
+def _ngram_buckets(texts):
+    """
+    Hash the character n-grams of a batch of texts
+
+    All texts are hashed together with array operations. Every position of
+    the joined text yields one n-gram of each order; n-grams crossing into
+    the next text fall into the null bucket.
+
+    Returns:
+        tuple: (list of bucket arrays, one per order and all aligned by
+        position, start position of each text)
+    """
+    codes = _normalized_codes(texts)
+    length = len(codes)
+    is_separator = codes == 0
+
+    buckets = []
+    gram_hash = np.zeros(length, dtype=np.uint32)
+    crosses = np.zeros(length, dtype=bool)
+    for offset in range(max(NGRAM_ORDERS)):
+        # Extend every n-gram by the character `offset` places after its start
+        head = gram_hash[:length - offset]
+        np.multiply(head, _HASH_STEP, out=head)
+        np.add(head, codes[offset:], out=head)
+        np.logical_or(crosses[:length - offset], is_separator[offset:], out=crosses[:length - offset])
+        crosses[length - offset:] = True
+
+        order = offset + 1
+        if order in NGRAM_ORDERS:
+            bucket = (gram_hash + np.uint32(order)) * _HASH_MULTIPLIER
+            np.right_shift(bucket, _HASH_SHIFT, out=bucket)
+            bucket = bucket.astype(np.intp)
+            bucket[crosses] = _NULL_BUCKET
+            buckets.append(bucket)
+
+    # Each text starts right after the previous separator
+    starts = np.concatenate(([0], np.flatnonzero(is_separator)[:-1] + 1))
+    return buckets, starts
+
+
+def _gram_bucket(gram):
+    """Hash bucket of one n-gram, the same as _ngram_buckets computes"""
+    gram_hash = 0
+    for char in gram:
+        gram_hash = (gram_hash * int(_HASH_STEP) + ord(char)) & 0xFFFFFFFF
+    return (((gram_hash + len(gram)) * int(_HASH_MULTIPLIER)) & 0xFFFFFFFF) >> int(_HASH_SHIFT)
+
+
+class NGramLanguageDetector:
+    """
+    Naive Bayes language detector over hashed character n-grams
+
+    Each language profile holds the log-probability of every n-gram bucket
+    and all profiles live in one (languages x PROFILE_SIZE) array, so
+    scoring a text is a dot product of its n-gram counts with that array.
+
+    A single short text is scored without numpy instead: the summed weights
+    of each whitespace-separated token are looked up in a dict filled on
+    first use, packed into one integer so a text's scores are a single sum.
+    Only the n-grams crossing from one token into the next are added apart.
+    """
+
+    def __init__(self, samples, default_language='en', smoothing=0.5):
+        """
+        Args:
+            samples (dict): Seed text keyed by language code
+            default_language (str): Returned for texts without letters
+            smoothing (float): Additive smoothing for unseen n-grams
+        """
+        self.languages = list(samples)
+        self.default_language = default_language
+        self._language_array = np.array(self.languages, dtype=object)
+
+        counts = np.zeros((len(self.languages), PROFILE_SIZE + 1), dtype=np.float64)
+        buckets, starts = _ngram_buckets([samples[lang] for lang in self.languages])
+        owners = np.repeat(np.arange(len(self.languages)), np.diff(np.append(starts, len(buckets[0]))))
+        for bucket in buckets:
+            np.add.at(counts, (owners, bucket), 1.0)
+        counts = counts[:, :PROFILE_SIZE]
+
+        totals = counts.sum(axis=1, keepdims=True)
+        self.profiles = np.log((counts + smoothing) / (totals + smoothing * PROFILE_SIZE)).astype(np.float32)
+
+        # Bucket-major copy, plus a zero row for the null bucket, so one
+        # gather fetches the weights of all languages per n-gram
+        self._columns = np.ascontiguousarray(
+            np.vstack((self.profiles.T, np.zeros((1, len(self.languages)), dtype=np.float32)))
+        )
+
+        # Fixed-point weights, bucket-major, for the pure Python fast path
+        self._fixed = np.rint(
+            (self._columns[:PROFILE_SIZE].astype(np.float64) + _FIXED_POINT_OFFSET) * _FIXED_POINT_SCALE
+        ).astype(np.int64)
+        self._lane_shifts = [_LANE_BITS * lane for lane in range(len(self.languages))]
+        self._unpack_lanes = struct.Struct(f'<{len(self.languages)}Q').unpack
+        self._lanes_size = _LANE_BITS // 8 * len(self.languages)
+        self._space = self._pack([' '])
+
+        self._tokens = {}
+        self._crossings = {}
+        self._texts = {}
+
+    def score(self, texts):
+        """
+        Score a batch of texts against every profile
+
+        Args:
+            texts (list): Texts to score
+
+        Returns:
+            tuple: (scores array of shape (len(texts), languages),
+            normalized length of each text including padding)
+        """
+        buckets, starts = _ngram_buckets(texts)
+
+        weights = np.take(self._columns, buckets[0], axis=0)
+        for bucket in buckets[1:]:
+            weights += np.take(self._columns, bucket, axis=0)
+
+        # Each text's positions form one contiguous run summed by reduceat
+        scores = np.add.reduceat(weights, starts, axis=0)
+        lengths = np.diff(np.append(starts, len(weights)))
+        return scores, lengths
+
+    def detect_languages(self, texts):
+        """
+        Detect the language of each text in a batch
+
+        Args:
+            texts (list): Texts to classify
+
+        Returns:
+            list: Language code per text, in input order
+        """
+        if not texts:
+            return []
+
+        scores, lengths = self.score(texts)
+        best = scores.argmax(axis=1)
+
+        # Only the padding space and separator are left: no letters to go on
+        detected = self._language_array[best]
+        detected[lengths <= 2] = self.default_language
+        return detected.tolist()
+
+    def _pack(self, grams):
+        """Summed fixed-point weights of n-grams, packed into one integer"""
+        sums = self._fixed[[_gram_bucket(gram) for gram in grams]].sum(axis=0).tolist()
+        return sum(weight << shift for weight, shift in zip(sums, self._lane_shifts))
+
+    def _token_weights(self, token):
+        """
+        Packed weights of a whitespace-separated token
+
+        A token stands for the n-grams of its words within ' word ' that
+        start before the trailing space, plus the 'd w' n-grams between
+        its words.
+
+        Returns:
+            tuple: (packed weights, first letter, dict of the packed weight
+            of the n-gram crossing into the next token keyed by that token's
+            first letter, last letter), or () if the token has no letters
+        """
+        words = _LETTER_RUN.findall(token.lower())
+        if not words:
+            entry = ()
+        else:
+            grams = [f'{left[-1]} {right[0]}' for left, right in zip(words, words[1:])]
+            for word in words:
+                padded = f' {word} '
+                grams.extend(
+                    padded[start:start + order]
+                    for start in range(len(padded) - 1)
+                    for order in NGRAM_ORDERS
+                    if start + order <= len(padded)
+                )
+            last = words[-1][-1]
+            entry = (self._pack(grams), words[0][0], self._crossings.setdefault(last, {}), last)
+
+        if len(self._tokens) >= TOKEN_CACHE_SIZE:
+            self._tokens.clear()
+        self._tokens[token] = entry
+        return entry
+
+    def _crossing_weights(self, entries):
+        """Packed weights of the n-grams crossing between consecutive tokens"""
+        try:
+            return sum(map(dict.__getitem__, map(_token_crossings, entries), map(_token_first, entries[1:])))
+        except KeyError:
+            for left, right in zip(entries, entries[1:]):
+                if right[1] not in left[2]:
+                    left[2][right[1]] = self._pack([f'{left[3]} {right[1]}'])
+            return self._crossing_weights(entries)
+
+    def detect_language(self, text):
+        """Detect the language of a single text"""
+        language = self._texts.get(text)
+        if language is not None:
+            return language
+
+        # U+3000 is whitespace to str.split but a letter to the n-grams
+        if len(text) > FAST_PATH_MAX_LENGTH or max(NGRAM_ORDERS) > 3 or '\u3000' in text:
+            language = self.detect_languages([text])[0]
+        else:
+            tokens = text.split()
+            entries = list(map(self._tokens.get, tokens))
+            if None in entries:
+                entries = [self._token_weights(token) if entry is None else entry for token, entry in zip(tokens, entries)]
+            if () in entries:
+                entries = [entry for entry in entries if entry]
+
+            if not entries:
+                language = self.default_language
+            else:
+                # With n-grams of at most 3 characters, only 'd w' crosses from
+                # one word into the next; the final space is the last n-gram
+                total = sum(map(_token_sum, entries), self._space) + self._crossing_weights(entries)
+                scores = self._unpack_lanes(total.to_bytes(self._lanes_size, 'little'))
+                language = self.languages[scores.index(max(scores))]
+
+        if len(self._texts) >= TEXT_CACHE_SIZE:
+            self._texts.clear()
+        self._texts[text] = language
+        return language
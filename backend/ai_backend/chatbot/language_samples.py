@@ -0,0 +1,95 @@
+# backend/ai_backend/chatbot/language_samples.py
+
+# Seed text used to build the character n-gram profiles for language
+# detection. Each sample mixes everyday phrasing with the vocabulary users
+# bring to the chatbot. To support a new language, add it to
+# SUPPORTED_LANGUAGES in multilingual.py and add a sample here.
+
+LANGUAGE_SAMPLES = {
+    'en': (
+        "Sometimes it is hard to put into words what we are feeling, and that is completely normal. "
+        "After school we usually do our homework, eat dinner together and then watch a movie. "
+        "Hello, how are you today? I have a question about something that happened at school. "
+        "What should I do if someone makes me feel uncomfortable or unsafe? "
+        "Who can I talk to when I feel scared and alone? I want to tell someone but I am afraid. "
+        "My friend told me a secret and I think she needs help. How do I report abuse? "
+        "Is it okay to say no when an adult asks me to keep a secret from my parents? "
+        "Thank you for listening to me. I don't know what to do and I feel really worried. "
+        "Can you explain what personal boundaries are and why they matter? "
+        "Where can I find a trusted adult, a teacher or a counselor who will believe me? "
+        "Please help me understand the difference between a safe touch and an unsafe touch. "
+        "Am I in danger if I stay? I am in danger at home and I do not know who I can call. "
+        "If you are ever in danger, or a situation seems dangerous, call for help right away. "
+        "I think my brother is being bullied online and nobody is doing anything about it. "
+        "The weather is nice this morning, so we went to the park with the whole family. "
+        "It was the first time that they had ever seen anything like that in their lives. "
+        "We should always listen to our feelings, because they tell us when something is wrong. "
+        "This week I learned that my body belongs to me and nobody has the right to hurt me. "
+        "There are people who want to help you, and you are never to blame for what happened. "
+        "Would you like some information about how to stay safe when you are on the internet? "
+        "They were walking home through the neighborhood when the rain started falling heavily."
+    ),
+    'es': (
+        "A veces es difícil poner en palabras lo que sentimos, y eso es completamente normal. "
+        "Después de la escuela solemos hacer los deberes, cenar juntos y luego ver una película. "
+        "Hola, ¿cómo estás hoy? Tengo una pregunta sobre algo que pasó en la escuela. "
+        "¿Qué debo hacer si alguien me hace sentir incómodo o inseguro? "
+        "¿Con quién puedo hablar cuando me siento asustado y solo? Quiero decírselo a alguien pero tengo miedo. "
+        "Mi amiga me contó un secreto y creo que necesita ayuda. ¿Cómo puedo denunciar el abuso? "
+        "¿Está bien decir que no cuando un adulto me pide que guarde un secreto de mis padres? "
+        "Gracias por escucharme. No sé qué hacer y estoy muy preocupada. "
+        "¿Puedes explicarme qué son los límites personales y por qué son importantes? "
+        "¿Dónde puedo encontrar un adulto de confianza, un maestro o un consejero que me crea? "
+        "Por favor, ayúdame a entender la diferencia entre un contacto seguro y uno que no lo es. "
+        "Creo que mi hermano está sufriendo acoso en internet y nadie hace nada al respecto. "
+        "El tiempo está muy bonito esta mañana, así que fuimos al parque con toda la familia. "
+        "Era la primera vez que habían visto algo así en toda su vida. "
+        "Siempre debemos escuchar nuestros sentimientos, porque nos dicen cuando algo está mal. "
+        "Esta semana aprendí que mi cuerpo me pertenece y que nadie tiene derecho a hacerme daño. "
+        "Hay personas que quieren ayudarte, y nunca tienes la culpa de lo que pasó. "
+        "¿Te gustaría recibir información sobre cómo mantenerte seguro cuando usas internet? "
+        "Estaban caminando hacia su casa por el barrio cuando empezó a llover con mucha fuerza."
+    ),
+    'fr': (
+        "Parfois, il est difficile de mettre des mots sur ce que l'on ressent, et c'est tout à fait normal. "
+        "Après l'école, nous faisons d'habitude nos devoirs, nous dînons ensemble puis nous regardons un film. "
+        "Bonjour, comment vas-tu aujourd'hui ? J'ai une question sur quelque chose qui s'est passé à l'école. "
+        "Que dois-je faire si quelqu'un me met mal à l'aise ou si je ne me sens pas en sécurité ? "
+        "À qui puis-je parler quand j'ai peur et que je me sens seul ? Je veux le dire à quelqu'un mais j'ai peur. "
+        "Mon amie m'a confié un secret et je pense qu'elle a besoin d'aide. Comment signaler un abus ? "
+        "Est-ce que j'ai le droit de dire non quand un adulte me demande de garder un secret pour mes parents ? "
+        "Merci de m'écouter. Je ne sais pas quoi faire et je suis vraiment inquiète. "
+        "Peux-tu m'expliquer ce que sont les limites personnelles et pourquoi elles sont importantes ? "
+        "Où puis-je trouver un adulte de confiance, un professeur ou un conseiller qui me croira ? "
+        "S'il te plaît, aide-moi à comprendre la différence entre un contact sûr et un contact dangereux. "
+        "Je crois que mon frère est harcelé sur internet et personne ne fait rien pour l'aider. "
+        "Il fait très beau ce matin, alors nous sommes allés au parc avec toute la famille. "
+        "C'était la première fois qu'ils voyaient une chose pareille de toute leur vie. "
+        "Nous devons toujours écouter nos sentiments, parce qu'ils nous disent quand quelque chose ne va pas. "
+        "Cette semaine, j'ai appris que mon corps m'appartient et que personne n'a le droit de me faire du mal. "
+        "Il y a des personnes qui veulent t'aider, et tu n'es jamais responsable de ce qui est arrivé. "
+        "Veux-tu des informations sur la façon de rester en sécurité quand tu utilises internet ? "
+        "Ils rentraient à la maison à travers le quartier quand la pluie a commencé à tomber très fort."
+    ),
+    'de': (
+        "Manchmal ist es schwer, in Worte zu fassen, was wir fühlen, und das ist völlig normal. "
+        "Nach der Schule machen wir meistens unsere Hausaufgaben, essen zusammen zu Abend und schauen dann einen Film. "
+        "Hallo, wie geht es dir heute? Ich habe eine Frage zu etwas, das in der Schule passiert ist. "
+        "Was soll ich tun, wenn mir jemand ein ungutes Gefühl gibt oder ich mich nicht sicher fühle? "
+        "Mit wem kann ich reden, wenn ich Angst habe und mich allein fühle? Ich will es jemandem sagen, aber ich habe Angst. "
+        "Meine Freundin hat mir ein Geheimnis erzählt und ich glaube, sie braucht Hilfe. Wie kann ich Missbrauch melden? "
+        "Darf ich nein sagen, wenn ein Erwachsener mich bittet, ein Geheimnis vor meinen Eltern zu bewahren? "
+        "Danke, dass du mir zuhörst. Ich weiß nicht, was ich machen soll, und ich mache mir große Sorgen. "
+        "Kannst du mir erklären, was persönliche Grenzen sind und warum sie wichtig sind? "
+        "Wo finde ich einen Erwachsenen, dem ich vertrauen kann, eine Lehrerin oder einen Berater, der mir glaubt? "
+        "Bitte hilf mir, den Unterschied zwischen einer sicheren und einer unsicheren Berührung zu verstehen. "
+        "Ich glaube, mein Bruder wird im Internet gemobbt, und niemand unternimmt etwas dagegen. "
+        "Das Wetter ist heute Morgen schön, deshalb sind wir mit der ganzen Familie in den Park gegangen. "
+        "Es war das erste Mal, dass sie so etwas in ihrem ganzen Leben gesehen hatten. "
+        "Wir sollten immer auf unsere Gefühle hören, weil sie uns sagen, wenn etwas nicht stimmt. "
+        "Diese Woche habe ich gelernt, dass mein Körper mir gehört und niemand das Recht hat, mir wehzutun. "
+        "Es gibt Menschen, die dir helfen wollen, und du bist niemals schuld an dem, was passiert ist. "
+        "Möchtest du Informationen darüber, wie du im Internet sicher bleiben kannst? "
+        "Sie gingen gerade durch die Nachbarschaft nach Hause, als es plötzlich stark zu regnen begann."
+    ),
+}
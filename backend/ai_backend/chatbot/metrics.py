@@ -0,0 +1,87 @@
+# backend/ai_backend/chatbot/metrics.py
+
+import bisect
+import threading
+
+
+def _default_bounds():
+    """Bucket upper bounds from 10us to ~10s, four buckets per factor of ten"""
+    bounds = []
+    value = 1e-5
+    while value < 10.0:
+        for step in (1.0, 1.8, 3.2, 5.6):
+            bounds.append(value * step)
+        value *= 10
+    return bounds
+
+
+class LatencyHistogram:
+    """
+    Fixed-bucket latency histogram
+
+    Recording is a bisect and a counter increment, so it is cheap enough
+    for hot request paths. Percentiles are reported as the upper bound of
+    the bucket they fall in, which over- rather than under-estimates.
+    """
+
+    def __init__(self, bounds=None):
+        """
+        Args:
+            bounds (list): Increasing bucket upper bounds in seconds
+        """
+        self.bounds = list(bounds) if bounds is not None else _default_bounds()
+        self._counts = [0] * (len(self.bounds) + 1)
+        self._total = 0.0
+        self._max = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, seconds):
+        """Record one latency sample"""
+        index = bisect.bisect_left(self.bounds, seconds)
+        with self._lock:
+            self._counts[index] += 1
+            self._total += seconds
+            if seconds > self._max:
+                self._max = seconds
+
+    @property
+    def count(self):
+        return sum(self._counts)
+
+    def percentile(self, fraction):
+        """
+        Latency below which `fraction` of the samples fall
+
+        Args:
+            fraction (float): Between 0 and 1, e.g. 0.99
+
+        Returns:
+            float: Bucket upper bound in seconds, or None without samples
+        """
+        with self._lock:
+            counts = list(self._counts)
+            largest = self._max
+        total = sum(counts)
+        if not total:
+            return None
+
+        rank = fraction * total
+        seen = 0
+        for index, count in enumerate(counts):
+            seen += count
+            if seen >= rank and count:
+                return min(self.bounds[index], largest) if index < len(self.bounds) else largest
+        return largest
+
+    def snapshot(self):
+        """Summary for monitoring, with latencies in milliseconds"""
+        count = self.count
+        to_ms = lambda seconds: round(seconds * 1e3, 3) if seconds is not None else None
+        return {
+            'count': count,
+            'mean_ms': to_ms(self._total / count) if count else None,
+            'p50_ms': to_ms(self.percentile(0.5)),
+            'p90_ms': to_ms(self.percentile(0.9)),
+            'p99_ms': to_ms(self.percentile(0.99)),
+            'max_ms': to_ms(self._max) if count else None
+        }
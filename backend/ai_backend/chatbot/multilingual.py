@@ -3,6 +3,11 @@
 import re
 import json
 import os
+import threading
+
+from backend.ai_backend.chatbot.watched_file import WatchedFile
+from backend.ai_backend.chatbot.language_detection import NGramLanguageDetector
+from backend.ai_backend.chatbot.language_samples import LANGUAGE_SAMPLES
 
 # In a production environment, you would use a proper translation API
 # This is a simplified implementation for demonstration purposes
@@ -18,36 +23,37 @@ SUPPORTED_LANGUAGES = {
     'de': 'German'
 }
 
+# Seconds between checks of a language file for changes
+DICTIONARY_CHECK_INTERVAL = 2.0
+
 # Ensure language directory exists
 os.makedirs(LANGUAGE_DIR, exist_ok=True)
 
+# N-gram profiles for every supported language, built once at import
+_detector = NGramLanguageDetector({
+    code: LANGUAGE_SAMPLES[code] for code in SUPPORTED_LANGUAGES if code in LANGUAGE_SAMPLES
+})
+
 def detect_language(text):
     """
     Detect the language of the input text
-    In a real implementation, use a language detection library
-    """
-    # Very simple language detection based on common words
-    # In a real app, use a proper language detection library like langdetect
-    
-    text_lower = text.lower()
     
-    # Spanish indicators
-    spanish_words = ['como', 'qué', 'por qué', 'cómo', 'ayuda', 'hola', 'gracias']
-    if any(word in text_lower for word in spanish_words):
-        return 'es'
-    
-    # French indicators
-    french_words = ['comment', 'pourquoi', 'bonjour', 'merci', 'aide', 'je suis']
-    if any(word in text_lower for word in french_words):
-        return 'fr'
-    
-    # German indicators
-    german_words = ['wie', 'warum', 'hallo', 'danke', 'hilfe', 'ich bin']
-    if any(word in text_lower for word in german_words):
-        return 'de'
+    Scores the text's character n-grams against a profile for each
+    supported language; texts without letters default to English.
+    """
+    return _detector.detect_language(text)
+
+def detect_languages(texts):
+    """
+    Detect the language of many texts at once
     
-    # Default to English
-    return 'en'
+    Args:
+        texts (list): Texts to classify
+        
+    Returns:
+        list: Language code per text, in input order
+    """
+    return _detector.detect_languages(list(texts))
 
 def load_translation_dictionary(language_code):
     """Load translation dictionary for a specific language"""
@@ -109,6 +115,99 @@ def load_translation_dictionary(language_code):
         # If file is corrupted, return empty dict
         return {}
 
+def _trie_pattern(node):
+    """Build a regex fragment matching every phrase stored in a character trie"""
+    terminal = '' in node
+    branches = []
+    for char in sorted(ch for ch in node if ch):
+        branches.append(re.escape(char) + _trie_pattern(node[char]))
+
+    if not branches:
+        return ''
+    if len(branches) == 1 and not terminal:
+        return branches[0]
+
+    body = '(?:' + '|'.join(branches) + ')'
+    # Greedy optional group: the longer phrase is tried before the shorter one
+    return body + '?' if terminal else body
+
+def compile_phrase_pattern(phrases):
+    """
+    Compile phrases into a single case-insensitive regex
+
+    The phrases are merged into a character trie so the regex engine only
+    follows the branch matching the current text, whatever the number of
+    phrases. At any position the longest phrase ending on a word boundary
+    wins, like the longest-first ordering of the old per-phrase loop.
+    """
+    trie = {}
+    for phrase in phrases:
+        node = trie
+        for char in phrase.lower():
+            node = node.setdefault(char, {})
+        node[''] = True
+
+    return re.compile(r'\b(?:' + _trie_pattern(trie) + r')\b', flags=re.IGNORECASE)
+
+class Translator:
+    """Dictionary translator for one language, compiled once"""
+    
+    def __init__(self, translation_dict):
+        # Keys are matched case-insensitively; the first spelling wins
+        self.translations = {}
+        for source, target in translation_dict.items():
+            if source:
+                self.translations.setdefault(source.lower(), target)
+        
+        self.pattern = compile_phrase_pattern(self.translations) if self.translations else None
+    
+    def _replace(self, match):
+        text = match.group(0)
+        return self.translations.get(text.lower(), text)
+    
+    def translate(self, text):
+        """Replace every known phrase/word in a single pass over the text"""
+        if self.pattern is None:
+            return text
+        return self.pattern.sub(self._replace, text)
+
+def _load_translator(file_path):
+    """Build a Translator from a language file"""
+    language_code = os.path.splitext(os.path.basename(file_path))[0]
+    
+    # Let load_translation_dictionary create the sample file on first use
+    if not os.path.exists(file_path):
+        return Translator(load_translation_dictionary(language_code))
+    
+    # Raise on a corrupt file so the last good translator stays in use
+    with open(file_path, 'r') as f:
+        return Translator(json.load(f))
+
+# Cached translators, one per language, rebuilt when the file changes
+_translators = {}
+_translators_lock = threading.Lock()
+
+def _watched_translator(language_code):
+    watched = _translators.get(language_code)
+    if watched is None:
+        with _translators_lock:
+            watched = _translators.get(language_code)
+            if watched is None:
+                file_path = os.path.join(LANGUAGE_DIR, f'{language_code}.json')
+                watched = WatchedFile(file_path, _load_translator,
+                                      check_interval=DICTIONARY_CHECK_INTERVAL,
+                                      fallback=Translator({}))
+                _translators[language_code] = watched
+    return watched
+
+def get_translator(language_code):
+    """Get the cached Translator for a language"""
+    return _watched_translator(language_code).value
+
+def get_dictionary_version(language_code):
+    """Version of a language's dictionary, bumped whenever it is reloaded"""
+    return _watched_translator(language_code).version
+
 def translate_text(text, source='en', target='es'):
     """
     Translate text from source language to target language
@@ -124,22 +223,9 @@ def translate_text(text, source='en', target='es'):
     if target == 'en':
         return text
     
-    # Load translation dictionary
-    translation_dict = load_translation_dictionary(target)
-    
     # For demonstration, we'll do a simple word-by-word replacement
     # This is NOT how real translation works, but serves for demonstration
-    result = text
-    
-    # Sort translations by length (descending) to handle phrases before single words
-    sorted_translations = sorted(translation_dict.items(), key=lambda x: len(x[0]), reverse=True)
-    
-    # Replace each known phrase/word with its translation
-    for eng, trans in sorted_translations:
-        pattern = r'\b' + re.escape(eng) + r'\b'
-        result = re.sub(pattern, trans, result, flags=re.IGNORECASE)
-    
-    return result
+    return get_translator(target).translate(text)
 
 def get_supported_languages():
     """Return list of supported languages"""
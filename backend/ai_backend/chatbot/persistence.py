@@ -0,0 +1,230 @@
+# backend/ai_backend/chatbot/persistence.py
+
+import atexit
+import queue
+import threading
+import time
+
+from flask import current_app, after_this_request
+
+from backend.extensions import db
+from backend.ai_backend.models.interaction import Interaction
+from backend.ai_backend.models.user import User
+from backend.ai_backend.adaptive_learning.sentiment_counts import record_sentiment_counts
+from backend.ai_backend.adaptive_learning.result_cache import bump_data_versions
+
+# Queue item telling the writer thread to flush and exit
+_STOP = object()
+
+class InteractionWriter:
+    """
+    Persists chatbot interactions and user last-active timestamps
+
+    In 'sync' mode (the default) rows are written and committed before the
+    response is returned. In 'write_behind' mode they go onto a bounded
+    in-process queue that a background thread drains in batches: one bulk
+    insert per batch, with last-active updates coalesced to one per user.
+    When the queue is full, callers wait up to CHATBOT_WRITE_QUEUE_TIMEOUT
+    seconds and then write synchronously, so rows are never dropped.
+    """
+
+    def __init__(self, app=None):
+        self.app = None
+        self.mode = 'sync'
+        self.batch_size = 200
+        self.flush_interval = 0.5
+        self.put_timeout = 1.0
+        self._queue = None
+        self._thread = None
+
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        """Configure the writer from app config and start it if needed"""
+        self.app = app
+        self.mode = app.config.get('CHATBOT_PERSISTENCE_MODE', 'sync')
+        self.batch_size = app.config.get('CHATBOT_WRITE_BATCH_SIZE', 200)
+        self.flush_interval = app.config.get('CHATBOT_WRITE_FLUSH_INTERVAL', 0.5)
+        self.put_timeout = app.config.get('CHATBOT_WRITE_QUEUE_TIMEOUT', 1.0)
+
+        if self.mode not in ('sync', 'write_behind'):
+            raise ValueError(f"Unknown CHATBOT_PERSISTENCE_MODE: {self.mode}")
+
+        if self.mode == 'write_behind' and self._thread is None:
+            self._queue = queue.Queue(maxsize=app.config.get('CHATBOT_WRITE_QUEUE_SIZE', 10000))
+            self._thread = threading.Thread(target=self._run, name='interaction-writer', daemon=True)
+            self._thread.start()
+            atexit.register(self.shutdown)
+
+        app.extensions['interaction_writer'] = self
+
+    def record(self, rows):
+        """
+        Persist interaction rows
+
+        Args:
+            rows (list): Interaction column dicts; each needs user_id and timestamp
+        """
+        if self.mode != 'write_behind' or self._thread is None:
+            self._write(rows)
+            return
+
+        for index, row in enumerate(rows):
+            try:
+                self._queue.put(row, timeout=self.put_timeout)
+            except queue.Full:
+                # Backpressure: the writer is behind, so pay for the write here
+                self._write(rows[index:])
+                return
+
+    def defer(self, rows):
+        """
+        Persist interaction rows without delaying the response
+
+        Rows go onto the write-behind queue if there is room, otherwise they
+        are written once the response has been sent. The users are not
+        assumed to exist; rows for unknown users are dropped.
+
+        Args:
+            rows (list): Interaction column dicts; each needs user_id and timestamp
+        """
+        if self.mode == 'write_behind' and self._thread is not None:
+            try:
+                for index, row in enumerate(rows):
+                    self._queue.put_nowait(row)
+                return
+            except queue.Full:
+                rows = rows[index:]
+
+        app = current_app._get_current_object()
+
+        @after_this_request
+        def write_after_response(response):
+            response.call_on_close(lambda: self._write_in_context(app, rows))
+            return response
+
+    def flush(self, timeout=None):
+        """Block until every queued row has been written"""
+        if self._queue is None:
+            return
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._queue.unfinished_tasks:
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+            time.sleep(0.01)
+
+    def shutdown(self, timeout=10.0):
+        """Flush the queue and stop the background thread"""
+        if self._thread is None:
+            return
+
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+        self._thread = None
+
+    def _write(self, rows, verify_users=False):
+        """Insert rows, bump last_active, count sentiments and invalidate cached results in one commit"""
+        if verify_users and rows:
+            user_ids = {row['user_id'] for row in rows}
+            known = {user_id for (user_id,) in db.session.query(User.id).filter(User.id.in_(user_ids))}
+            rows = [row for row in rows if row['user_id'] in known]
+
+        if not rows:
+            return
+
+        last_active = {}
+        for row in rows:
+            user_id = row['user_id']
+            if user_id not in last_active or row['timestamp'] > last_active[user_id]:
+                last_active[user_id] = row['timestamp']
+
+        db.session.bulk_insert_mappings(Interaction, rows)
+        db.session.bulk_update_mappings(User, [
+            {'id': user_id, 'last_active': timestamp}
+            for user_id, timestamp in last_active.items()
+        ])
+        record_sentiment_counts(rows)
+        bump_data_versions(last_active)
+        db.session.commit()
+
+    def _write_in_context(self, app, rows):
+        """Write rows outside of a request, logging instead of raising"""
+        with app.app_context():
+            self._write_or_split(app, rows)
+
+    def _write_or_split(self, app, rows):
+        """
+        Write a batch; if it fails, retry each half on its own
+
+        Halving isolates the rows that cannot be written, so only those are
+        dropped and logged; the rest of the batch is kept.
+        """
+        try:
+            self._write(rows, verify_users=True)
+        except Exception:
+            db.session.rollback()
+            if len(rows) <= 1:
+                app.logger.exception(
+                    "Dropped interaction for user %s", rows[0]['user_id'] if rows else None
+                )
+                return
+
+            app.logger.warning("Failed to write %d interactions, retrying in halves", len(rows))
+            middle = len(rows) // 2
+            self._write_or_split(app, rows[:middle])
+            self._write_or_split(app, rows[middle:])
+
+    def _next_batch(self):
+        """Collect up to batch_size rows, waiting at most flush_interval"""
+        first = self._queue.get()
+        if first is _STOP:
+            return [], True
+
+        batch = [first]
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is _STOP:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _drain(self):
+        """Take everything left on the queue without blocking"""
+        rows = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return rows
+            if item is not _STOP:
+                rows.append(item)
+            else:
+                self._queue.task_done()
+
+    def _run(self):
+        stopping = False
+        while not stopping:
+            batch, stopping = self._next_batch()
+            if stopping:
+                batch += self._drain()
+
+            # Deferred rows reach the queue without a user lookup
+            self._write_in_context(self.app, batch)
+
+            for _ in batch:
+                self._queue.task_done()
+
+        # Account for the stop marker itself
+        self._queue.task_done()
+
+# Shared writer used by the chatbot routes
+interaction_writer = InteractionWriter()
@@ -0,0 +1,131 @@
+# backend/ai_backend/chatbot/response_cache.py
+
+import threading
+import time
+from collections import OrderedDict
+
+
+def normalize_query(text):
+    """Lowercase a query and collapse its whitespace"""
+    return ' '.join(text.lower().split())
+
+
+class ResponseCache:
+    """
+    Bounded LRU cache with a TTL for chatbot answers
+
+    Every entry is stored with the content version it was computed from.
+    `version_of(key, value)` returns the current version for an entry; when
+    it no longer matches (the response catalog or a translation dictionary
+    was reloaded) the entry is dropped on lookup and counted as invalidated.
+    """
+
+    def __init__(self, version_of, maxsize=1024, ttl=3600.0, clock=time.monotonic):
+        """
+        Args:
+            version_of (callable): Returns the current content version for a (key, value)
+            maxsize (int): Maximum number of entries; 0 disables the cache
+            ttl (float): Seconds an entry stays valid
+            clock (callable): Monotonic time source
+        """
+        self.version_of = version_of
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clock = clock
+
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._reset_counters()
+
+    def init_app(self, app):
+        """Configure size and TTL from app config"""
+        with self._lock:
+            self.maxsize = app.config.get('CHATBOT_RESPONSE_CACHE_SIZE', self.maxsize)
+            self.ttl = app.config.get('CHATBOT_RESPONSE_CACHE_TTL', self.ttl)
+            self._entries.clear()
+        app.extensions['response_cache'] = self
+
+    def _reset_counters(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def get(self, key):
+        """
+        Look up a cached value
+
+        Returns:
+            The cached value, or None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            value, version, expires_at = entry
+            if self.clock() >= expires_at:
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+        # Computed outside the lock: it may stat files on disk
+        if self.version_of(key, value) != version:
+            with self._lock:
+                if self._entries.get(key) is entry:
+                    del self._entries[key]
+                    self.invalidations += 1
+                self.misses += 1
+            return None
+
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+            self.hits += 1
+        return value
+
+    def put(self, key, value):
+        """Store a value, evicting the least recently used entry if full"""
+        if self.maxsize <= 0:
+            return
+
+        version = self.version_of(key, value)
+        with self._lock:
+            self._entries[key] = (value, version, self.clock() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_compute(self, key, compute):
+        """Return the cached value for key, computing and storing it on a miss"""
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        """Drop every entry and reset the counters"""
+        with self._lock:
+            self._entries.clear()
+            self._reset_counters()
+
+    def stats(self):
+        """Counters for monitoring"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+                'ttl': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'invalidations': self.invalidations
+            }
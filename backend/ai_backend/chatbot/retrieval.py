@@ -0,0 +1,151 @@
+# backend/ai_backend/chatbot/retrieval.py
+
+import re
+from collections import namedtuple
+
+import numpy as np
+
+_TOKEN_RE = re.compile(r'\w+')
+
+# Function words carry no topic and would otherwise favour short responses
+STOP_WORDS = frozenset('''
+    a an and are as at be been but by can could do does for from had has have
+    how i if in is it its me my of on or our so that the their them there they
+    this to was we were what when where which who will with would you your
+'''.split())
+
+# Best response for a query: `index` is its position in the category's
+# response list and `score` the cosine similarity in [0, 1]
+Match = namedtuple('Match', ['category', 'index', 'text', 'score'])
+
+
+def _tokenize(text):
+    return [token for token in _TOKEN_RE.findall(text.lower()) if token not in STOP_WORDS]
+
+
+class ResponseRetriever:
+    """
+    TF-IDF retrieval over the safety response catalog
+
+    Every response and every keyword phrase is a document. Documents are
+    stored as term-major postings (a CSC sparse matrix), so ranking a query
+    against the whole catalog is one gather of the postings of its terms
+    and one `np.bincount`, whatever the size of the catalog.
+    """
+
+    def __init__(self, responses, keyword_mapping=None, exclude=('fallback',)):
+        """
+        Args:
+            responses (dict): Lists of responses keyed by category
+            keyword_mapping (dict): Keyword phrases keyed by category; a
+                matching phrase selects the best response of its category
+            exclude (tuple): Categories left out of the index
+        """
+        self.responses = {
+            category: texts for category, texts in responses.items()
+            if category not in exclude and isinstance(texts, list)
+        }
+        self.categories = list(self.responses)
+        category_ids = {category: i for i, category in enumerate(self.categories)}
+
+        # Documents: (category id, response index or -1 for a keyword phrase, text)
+        documents = [
+            (category_ids[category], index, text)
+            for category, texts in self.responses.items()
+            for index, text in enumerate(texts)
+        ]
+        for category, phrases in (keyword_mapping or {}).items():
+            if category in category_ids:
+                documents.extend((category_ids[category], -1, phrase) for phrase in phrases)
+
+        self.doc_category = np.array([d[0] for d in documents], dtype=np.intp)
+        self.doc_index = np.array([d[1] for d in documents], dtype=np.intp)
+        self.doc_count = len(documents)
+
+        # Term ids of every document, flattened
+        self.vocabulary = {}
+        doc_ids, term_ids = [], []
+        for doc_id, (_, _, text) in enumerate(documents):
+            for token in _tokenize(text):
+                term_ids.append(self.vocabulary.setdefault(token, len(self.vocabulary)))
+                doc_ids.append(doc_id)
+        term_count = len(self.vocabulary)
+
+        # Term frequencies per (term, document), sorted term-major
+        keys, tf = np.unique(
+            np.array(term_ids, dtype=np.int64) * max(self.doc_count, 1) + np.array(doc_ids, dtype=np.int64),
+            return_counts=True
+        )
+        post_terms = keys // max(self.doc_count, 1)
+        post_docs = keys % max(self.doc_count, 1)
+
+        document_frequency = np.bincount(post_terms, minlength=term_count)
+        self.idf = np.log((1.0 + self.doc_count) / (1.0 + document_frequency)) + 1.0
+
+        weights = (1.0 + np.log(tf)) * self.idf[post_terms]
+        norms = np.sqrt(np.bincount(post_docs, weights=weights * weights, minlength=self.doc_count))
+        weights /= np.where(norms > 0, norms, 1.0)[post_docs]
+
+        self.indptr = np.concatenate(([0], np.cumsum(document_frequency)))
+        self.post_docs = post_docs.astype(np.intp)
+        self.post_weights = weights.astype(np.float32)
+
+    def score(self, query):
+        """
+        Cosine similarity of a query with every document
+
+        Returns:
+            numpy.ndarray: One score per document
+        """
+        term_ids = [self.vocabulary[t] for t in _tokenize(query) if t in self.vocabulary]
+        if not term_ids:
+            return np.zeros(self.doc_count, dtype=np.float64)
+
+        terms, tf = np.unique(np.array(term_ids, dtype=np.intp), return_counts=True)
+        query_weights = (1.0 + np.log(tf)) * self.idf[terms]
+        query_weights /= np.sqrt(np.dot(query_weights, query_weights))
+
+        # Gather the postings of all query terms in one go
+        starts = self.indptr[terms]
+        lengths = self.indptr[terms + 1] - starts
+        offsets = np.repeat(starts - (np.cumsum(lengths) - lengths), lengths)
+        positions = np.arange(lengths.sum()) + offsets
+
+        contributions = self.post_weights[positions] * np.repeat(query_weights, lengths)
+        return np.bincount(self.post_docs[positions], weights=contributions, minlength=self.doc_count)
+
+    def best_match(self, query, category=None):
+        """
+        Find the response that best matches a query
+
+        Args:
+            query (str): The (English) user query
+            category (str): Only consider responses of this category
+
+        Returns:
+            Match: The best response, or None if nothing matched
+        """
+        scores = self.score(query)
+
+        if category is None:
+            if not self.doc_count or scores.max() <= 0:
+                return None
+            category_id = self.doc_category[scores.argmax()]
+        elif category in self.responses:
+            category_id = self.categories.index(category)
+        else:
+            return None
+
+        in_category = self.doc_category == category_id
+        confidence = float(scores[in_category].max()) if in_category.any() else 0.0
+
+        # A matching keyword phrase picks the category; the response within
+        # it is the best scoring one, or the first if none overlap the query
+        is_response = in_category & (self.doc_index >= 0)
+        if not is_response.any():
+            return None
+        candidates = np.flatnonzero(is_response)
+        index = int(self.doc_index[candidates[scores[candidates].argmax()]])
+
+        name = self.categories[category_id]
+        return Match(name, index, self.responses[name][index], min(confidence, 1.0))
@@ -3,10 +3,22 @@
 import re
 import json
 import os
+from collections import namedtuple
+from types import MappingProxyType
+
+from backend.ai_backend.chatbot.watched_file import WatchedFile
+from backend.ai_backend.chatbot.retrieval import ResponseRetriever, Match
 
 # Path to the responses JSON file
 RESPONSES_FILE = os.path.join(os.path.dirname(__file__), 'data', 'safety_responses.json')
 
+# Seconds between checks of the responses file for changes
+CATALOG_CHECK_INTERVAL = 2.0
+
+# Minimum similarity for a retrieved response to be used when no keyword
+# matched; weaker queries fall back to the pattern rules
+RETRIEVAL_MIN_SCORE = 0.2
+
 # Load responses from JSON file
 def load_responses():
     # Create directory if it doesn't exist
@@ -63,25 +75,90 @@ KEYWORD_MAPPING = {
     "prevention": ["prevent abuse", "stop abuse", "education", "training", "awareness"]
 }
 
-def get_safety_response(query):
-    """Get appropriate safety response based on query content"""
-    # Load responses
-    responses = load_responses()
+# Responses as loaded and the retrieval index built from them, published
+# together so a request never pairs one catalog's text with another's index
+CatalogSnapshot = namedtuple('CatalogSnapshot', ['responses', 'retriever'])
+
+def build_snapshot(responses):
+    """Build a read-only catalog snapshot from responses keyed by category"""
+    return CatalogSnapshot(MappingProxyType(responses), ResponseRetriever(responses, KEYWORD_MAPPING))
+
+class ResponseCatalog(WatchedFile):
+    """
+    Process-wide, in-memory safety response catalog
+
+    Responses are parsed once and served from memory. The JSON file is
+    re-read only when it changes on disk; `version` is bumped on every
+    reload so callers and caches can detect new content. The value is a
+    CatalogSnapshot, so the retrieval index is rebuilt with each reload
+    and swapped in together with the responses.
+    """
+
+    def __init__(self, path=RESPONSES_FILE, check_interval=CATALOG_CHECK_INTERVAL):
+        super().__init__(path, self._read, check_interval=check_interval, fallback=build_snapshot({}))
+
+    def _read(self, path):
+        # Let load_responses create the default file on first use
+        if not os.path.exists(path):
+            return build_snapshot(load_responses())
+
+        # Unlike load_responses, raise on a corrupt file so a half-written
+        # update never replaces the catalog already in memory
+        with open(path, 'r') as f:
+            return build_snapshot(json.load(f))
+
+    @property
+    def responses(self):
+        """All responses keyed by category"""
+        return self.value.responses
+
+    def get_category(self, category):
+        """Get the list of responses for a category"""
+        return self.value.responses.get(category) or []
+
+# Shared catalog used by every request
+response_catalog = ResponseCatalog()
+
+def get_retriever():
+    """Get the retrieval index of the current catalog"""
+    return response_catalog.value.retriever
+
+def find_safety_response(query, category=None):
+    """
+    Find the best safety response for a query
+    
+    Args:
+        query (str): The (English) user query
+        category (str): KEYWORD_MAPPING category already matched by the
+            classifier, if any; skips the keyword scan
+    
+    Returns:
+        Match: Category, response index, response text and confidence score
+    """
+    # Responses and index come from one snapshot, even if the file is
+    # reloaded while this query is answered
+    responses, retriever = response_catalog.value
+    
+    # Rank every response in the catalog against the query
+    match = retriever.best_match(query, category)
+    if match is not None and (category or match.score >= RETRIEVAL_MIN_SCORE):
+        return match
     
     # Lowercase the query for easier matching
     query_lower = query.lower()
     
     # Find matching category
-    selected_category = None
+    selected_category = category
     
     # Check for exact category matches first
-    for category, keywords in KEYWORD_MAPPING.items():
-        for keyword in keywords:
-            if keyword in query_lower:
-                selected_category = category
+    if not selected_category:
+        for candidate, keywords in KEYWORD_MAPPING.items():
+            for keyword in keywords:
+                if keyword in query_lower:
+                    selected_category = candidate
+                    break
+            if selected_category:
                 break
-        if selected_category:
-            break
     
     # If no exact match, try more general pattern matching
     if not selected_category:
@@ -98,10 +175,23 @@ def get_safety_response(query):
         else:
             selected_category = "fallback"
     
-    # Get response from selected category
+    # Get the closest response from the selected category
     if selected_category in responses and responses[selected_category]:
-        # Select first response in the category (in a more advanced system, you could rotate responses)
-        return responses[selected_category][0]
+        match = retriever.best_match(query, selected_category)
+        if match is not None:
+            return match
+        return Match(selected_category, 0, responses[selected_category][0], 0.0)
     else:
         # Fallback response if category not found
-        return "I'm here to provide information about personal safety. Could you please be more specific about what you'd like to know?"
\ No newline at end of file
+        return Match(None, None, "I'm here to provide information about personal safety. Could you please be more specific about what you'd like to know?", 0.0)
+
+def get_safety_response(query, category=None):
+    """
+    Get appropriate safety response based on query content
+    
+    Args:
+        query (str): The (English) user query
+        category (str): KEYWORD_MAPPING category already matched by the
+            classifier, if any; skips the keyword scan
+    """
+    return find_safety_response(query, category).text
\ No newline at end of file
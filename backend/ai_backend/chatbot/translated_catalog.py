@@ -0,0 +1,159 @@
+# backend/ai_backend/chatbot/translated_catalog.py
+#
+# Pre-translated variants of every catalog and general response. Print the
+# translation coverage report from the repository root with:
+#
+#     python -m backend.ai_backend.chatbot.translated_catalog
+
+import argparse
+import re
+import threading
+from collections import Counter, namedtuple
+
+from backend.ai_backend.chatbot.general_responses import GENERAL_RESPONSES
+from backend.ai_backend.chatbot.safety_responses import response_catalog
+from backend.ai_backend.chatbot.multilingual import (
+    SUPPORTED_LANGUAGES, get_translator, get_dictionary_version, translate_text
+)
+
+_WORD_RE = re.compile(r'\w+')
+
+# Translation coverage of one language: `untranslated` counts the runs of
+# consecutive words that no dictionary entry covered
+Coverage = namedtuple('Coverage', ['language', 'words', 'translated_words', 'untranslated'])
+
+
+class LanguageCatalog:
+    """Every catalog and general response translated into one language"""
+
+    def __init__(self, language, responses, translator):
+        """
+        Args:
+            language (str): Target language code
+            responses (dict): Safety responses keyed by category
+            translator (Translator): Compiled dictionary for the language
+        """
+        self.language = language
+        self.translator = translator
+        self.words = 0
+        self.translated_words = 0
+        self.untranslated = Counter()
+
+        # Both map to (English text, translated text)
+        self.safety = {
+            (category, index): (text, self._translate(text))
+            for category, texts in responses.items() if isinstance(texts, list)
+            for index, text in enumerate(texts)
+        }
+        self.general = {
+            key: (text, self._translate(text))
+            for key, text in GENERAL_RESPONSES.items()
+        }
+
+    def _translate(self, text):
+        """Translate text, recording which of its words the dictionary covered"""
+        pattern = self.translator.pattern
+        spans = [m.span() for m in pattern.finditer(text)] if pattern is not None else []
+
+        run = []
+        span_index = 0
+        for word in _WORD_RE.finditer(text):
+            while span_index < len(spans) and spans[span_index][1] <= word.start():
+                span_index += 1
+            covered = span_index < len(spans) and spans[span_index][0] <= word.start()
+
+            self.words += 1
+            if covered:
+                self.translated_words += 1
+                if run:
+                    self.untranslated[' '.join(run)] += 1
+                    run = []
+            else:
+                run.append(word.group(0).lower())
+        if run:
+            self.untranslated[' '.join(run)] += 1
+
+        return self.translator.translate(text)
+
+    def coverage(self):
+        """Translation coverage of this catalog"""
+        return Coverage(self.language, self.words, self.translated_words, self.untranslated)
+
+
+# Built catalogs with the (catalog, dictionary) versions they came from
+_catalogs = {}
+_catalogs_lock = threading.Lock()
+
+def get_language_catalog(language):
+    """Get the translated catalog for a language, rebuilding it if its sources changed"""
+    catalog, catalog_version = response_catalog.snapshot()
+    versions = (catalog_version, get_dictionary_version(language))
+
+    entry = _catalogs.get(language)
+    if entry is None or entry[0] != versions:
+        with _catalogs_lock:
+            entry = _catalogs.get(language)
+            if entry is None or entry[0] != versions:
+                entry = (versions, LanguageCatalog(language, catalog.responses, get_translator(language)))
+                _catalogs[language] = entry
+    return entry[1]
+
+def build_catalogs(languages=None):
+    """
+    Build the translated catalogs up front
+
+    Args:
+        languages (list): Language codes, every supported non-English language by default
+
+    Returns:
+        dict: LanguageCatalog keyed by language code
+    """
+    if languages is None:
+        languages = [code for code in SUPPORTED_LANGUAGES if code != 'en']
+    return {language: get_language_catalog(language) for language in languages}
+
+def localize_safety_response(match, language):
+    """
+    Get a safety response in the user's language
+
+    Args:
+        match (Match): Response chosen by find_safety_response
+        language (str): Target language code
+    """
+    if language == 'en':
+        return match.text
+
+    variant = get_language_catalog(language).safety.get((match.category, match.index))
+    if variant is not None and variant[0] == match.text:
+        return variant[1]
+
+    # Not from the current catalog: translate the free-form text
+    return translate_text(match.text, source='en', target=language)
+
+def localize_general_response(key, language):
+    """Get a GENERAL_RESPONSES entry in the user's language"""
+    if language == 'en':
+        return GENERAL_RESPONSES[key]
+    return get_language_catalog(language).general[key][1]
+
+def coverage_report(languages=None):
+    """Translation coverage for each language"""
+    return [catalog.coverage() for catalog in build_catalogs(languages).values()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Report translation coverage of the response catalog')
+    parser.add_argument('languages', nargs='*', help='Language codes (default: all supported)')
+    parser.add_argument('--top', type=int, default=10, help='Untranslated phrases to list per language')
+    args = parser.parse_args()
+
+    for coverage in coverage_report(args.languages or None):
+        percent = 100.0 * coverage.translated_words / coverage.words if coverage.words else 100.0
+        print(f"{coverage.language}: {coverage.translated_words}/{coverage.words} words translated ({percent:.1f}%), "
+              f"{len(coverage.untranslated)} untranslated phrases")
+        for phrase, count in coverage.untranslated.most_common(args.top):
+            print(f"  {count:>4}  {phrase}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+# backend/ai_backend/chatbot/urgent.py
+
+from backend.ai_backend.chatbot.classifier import tokenize
+from backend.ai_backend.chatbot.multilingual import detect_language
+
+# Words and phrases that make a query urgent, per language. Only strong
+# signals belong here: weak words such as 'help', 'now' or 'aide' also
+# appear in questions about helping others or about reporting, and stay
+# sentiment markers in the classifier's URGENT_WORDS. The lists only flag
+# urgency; several entries ('urgent', 'emergency') belong to more than one
+# language.
+URGENT_WORDS_BY_LANGUAGE = {
+    'en': ['emergency', 'urgent', 'help me', 'please help', 'in danger', 'hurting me', 'save me'],
+    'es': ['emergencia', 'urgente', 'ayúdame', 'ayudame', 'socorro', 'auxilio', 'en peligro'],
+    'fr': ['urgence', 'urgent', 'aidez moi', 'aide moi', 'au secours', 'en danger'],
+    'de': ['notfall', 'dringend', 'hilf mir', 'helft mir', 'in gefahr']
+}
+
+# Crisis answers written directly in each language, never machine-translated
+CRISIS_RESPONSES = {
+    'en': (
+        "If you are in danger right now, please call emergency services (like 911 in the US) immediately. "
+        "You can also call the National Sexual Assault Hotline at 1-800-656-HOPE (4673), any time, day or night. "
+        "You are not alone, and what is happening is not your fault. I'm here with you."
+    ),
+    'es': (
+        "Si estás en peligro ahora mismo, llama de inmediato a los servicios de emergencia (como el 911 en EE. UU.). "
+        "También puedes llamar a la Línea Nacional de Agresión Sexual al 1-800-656-HOPE (4673), a cualquier hora del día o de la noche. "
+        "No estás solo y lo que está pasando no es tu culpa. Estoy aquí contigo."
+    ),
+    'fr': (
+        "Si tu es en danger en ce moment, appelle immédiatement les services d'urgence (comme le 911 aux États-Unis). "
+        "Tu peux aussi appeler la ligne nationale d'aide contre les agressions sexuelles au 1-800-656-HOPE (4673), à toute heure du jour ou de la nuit. "
+        "Tu n'es pas seul, et ce qui se passe n'est pas de ta faute. Je suis là avec toi."
+    ),
+    'de': (
+        "Wenn du gerade in Gefahr bist, ruf bitte sofort den Notruf an (zum Beispiel 911 in den USA). "
+        "Du kannst auch jederzeit, Tag und Nacht, die nationale Hotline bei sexueller Gewalt unter 1-800-656-HOPE (4673) anrufen. "
+        "Du bist nicht allein, und was passiert, ist nicht deine Schuld. Ich bin für dich da."
+    )
+}
+
+
+class UrgencyDetector:
+    """
+    Finds urgent words in raw user text, in any supported language
+
+    Runs before language detection and translation, so urgent queries can
+    be answered without any of the slower pipeline.
+    """
+
+    def __init__(self, words_by_language):
+        """
+        Args:
+            words_by_language (dict): Urgent words and phrases keyed by language code
+        """
+        self._words = {}
+        self._phrases = []
+        for language, words in words_by_language.items():
+            for word in words:
+                tokens = tuple(tokenize(word))
+                if len(tokens) == 1:
+                    self._words.setdefault(tokens[0], set()).add(language)
+                elif tokens:
+                    self._phrases.append((' '.join(tokens), language))
+
+    def match(self, text):
+        """
+        Find the languages whose urgent words appear in the text
+
+        Returns:
+            set: Language codes, empty if the text is not urgent
+        """
+        tokens = tokenize(text)
+        languages = set()
+        for token in tokens:
+            found = self._words.get(token)
+            if found:
+                languages |= found
+
+        if self._phrases:
+            joined = f" {' '.join(tokens)} "
+            for phrase, language in self._phrases:
+                if f' {phrase} ' in joined:
+                    languages.add(language)
+        return languages
+
+
+# Built once at import and shared by every request
+urgency_detector = UrgencyDetector(URGENT_WORDS_BY_LANGUAGE)
+
+
+def answer_urgent_query(query, language=None):
+    """
+    Answer a query with the crisis response if it is urgent
+
+    Args:
+        query (str): The query as typed by the user
+        language (str): Language of the query, if known
+
+    Returns:
+        dict: Response, query type, sentiment and language, or None if the
+        query is not urgent
+    """
+    if not urgency_detector.match(query):
+        return None
+
+    if language not in CRISIS_RESPONSES:
+        language = detect_language(query)
+        if language not in CRISIS_RESPONSES:
+            language = 'en'
+
+    return {
+        'response': CRISIS_RESPONSES[language],
+        'query_type': 'safety_question',
+        'sentiment': 'urgent',
+        'language': language
+    }
@@ -0,0 +1,90 @@
+# backend/ai_backend/chatbot/watched_file.py
+
+import os
+import threading
+import time
+
+
+class WatchedFile:
+    """
+    File-backed value that is loaded once and kept in memory
+
+    The file's inode, mtime and size are checked at most once per
+    `check_interval` seconds; the value is reloaded only when they change.
+    Readers always see a complete (value, version) pair because the pair is
+    swapped in with a single assignment.
+    """
+
+    def __init__(self, path, loader, check_interval=2.0, fallback=None):
+        """
+        Args:
+            path (str): File to watch
+            loader (callable): Called with the path, returns the parsed value
+            check_interval (float): Minimum seconds between file checks
+            fallback: Value used if the very first load fails
+        """
+        self.path = path
+        self.loader = loader
+        self.check_interval = check_interval
+        self.fallback = fallback
+
+        self._lock = threading.Lock()
+        self._state = (fallback, 0)
+        self._signature = None
+        self._next_check = 0.0
+
+    @property
+    def value(self):
+        """Current value, reloaded first if the file changed"""
+        return self.snapshot()[0]
+
+    @property
+    def version(self):
+        """Counter bumped every time new content is loaded"""
+        return self.snapshot()[1]
+
+    def snapshot(self):
+        """
+        Get the current value together with its version
+
+        Returns:
+            tuple: (value, version)
+        """
+        if time.monotonic() >= self._next_check:
+            self._refresh()
+        return self._state
+
+    def reload(self):
+        """Force a reload on the next access"""
+        self._next_check = 0.0
+        self._signature = None
+
+    def _file_signature(self):
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    def _refresh(self):
+        with self._lock:
+            now = time.monotonic()
+            if now < self._next_check:
+                # Another thread refreshed while we waited for the lock
+                return
+            self._next_check = now + self.check_interval
+
+            signature = self._file_signature()
+            if self._state[1] and signature is not None and signature == self._signature:
+                return
+
+            try:
+                value = self.loader(self.path)
+            except Exception as e:
+                # Keep serving the last good value and retry on the next check
+                print(f"Failed to load {self.path}: {e}")
+                return
+
+            # The loader may have created the file
+            self._signature = signature if signature is not None else self._file_signature()
+            self._state = (value, self._state[1] + 1)
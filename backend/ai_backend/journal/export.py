@@ -0,0 +1,74 @@
+# backend/ai_backend/journal/export.py
+
+import json
+
+from backend.extensions import db
+from backend.ai_backend.models.journal import JournalEntry
+from sqlalchemy import select
+
+def entries_data(entries, encryptor):
+    """
+    Entries as returned by the API, decrypting sensitive content in one batch
+
+    Args:
+        entries (list): JournalEntry objects
+        encryptor (DataEncryption): Decrypts sensitive content
+
+    Returns:
+        list: id, date, mood and content dicts, in the same order
+    """
+    encrypted = [entry for entry in entries if entry.is_sensitive and entry.encrypted_content]
+    decrypted = dict(zip(
+        (entry.id for entry in encrypted),
+        encryptor.decrypt_many(entry.encrypted_content for entry in encrypted)
+    ))
+
+    result = []
+    for entry in entries:
+        entry_data = {
+            'id': entry.id,
+            'date': entry.entry_date.isoformat(),
+            'mood': entry.mood
+        }
+
+        if entry.is_sensitive:
+            if entry.encrypted_content:
+                entry_data['content'] = decrypted[entry.id]
+            else:
+                entry_data['content'] = '[Encrypted content not available]'
+        else:
+            entry_data['content'] = entry.content
+
+        result.append(entry_data)
+
+    return result
+
+def export_lines(user_id, encryptor, chunk_size=500):
+    """
+    Stream a user's journal entries as newline-delimited JSON, oldest first
+
+    Rows are fetched from a server-side cursor chunk_size at a time, each
+    chunk is decrypted in one batch and released before the next is read,
+    so memory use does not grow with the number of entries.
+
+    Args:
+        user_id (int): The user whose journal is exported
+        encryptor (DataEncryption): Decrypts sensitive content
+        chunk_size (int): Entries fetched and decrypted at a time
+
+    Yields:
+        str: One chunk of lines, each line one entry as JSON
+    """
+    result = db.session.execute(
+        select(JournalEntry).where(JournalEntry.user_id == user_id).order_by(
+            JournalEntry.entry_date, JournalEntry.id
+        ).execution_options(yield_per=chunk_size)
+    )
+    try:
+        for entries in result.scalars().partitions():
+            lines = ''.join(json.dumps(entry_data) + '\n' for entry_data in entries_data(entries, encryptor))
+            for entry in entries:
+                db.session.expunge(entry)
+            yield lines
+    finally:
+        result.close()
@@ -0,0 +1,123 @@
+# backend/ai_backend/journal/mood_counts.py
+
+from backend.extensions import db
+from backend.ai_backend.models.journal import JournalEntry
+from backend.ai_backend.models.mood_daily_count import MoodDailyCount
+from backend.ai_backend.models.upsert import increment_counters
+from datetime import timedelta
+from sqlalchemy import func
+
+# Start of the bucket a day falls in; weeks start on Monday
+RESOLUTIONS = {
+    'day': lambda day: day,
+    'week': lambda day: day - timedelta(days=day.weekday()),
+    'month': lambda day: day.replace(day=1)
+}
+
+def _apply_increments(increments):
+    """Add {(user_id, day, mood): delta} to the counters"""
+    values = [
+        {'user_id': user_id, 'day': day, 'mood': mood, 'count': count}
+        for (user_id, day, mood), count in increments.items()
+        if count
+    ]
+    increment_counters(MoodDailyCount, ['user_id', 'day', 'mood'], ['count'], values)
+
+def record_mood_change(user_id, entry_date, old_mood, new_mood):
+    """
+    Move one journal entry's mood in its user's daily mood counters
+
+    Pass old_mood None for a new entry and new_mood None for a deleted one.
+    Runs in the caller's transaction, so the counters commit together with
+    the entry.
+
+    Args:
+        user_id (int): The entry's user
+        entry_date (datetime): The entry's date
+        old_mood (str): Mood counted so far, if any
+        new_mood (str): Mood to count from now on, if any
+    """
+    if old_mood == new_mood:
+        return
+
+    day = entry_date.date()
+    increments = {}
+    if old_mood:
+        increments[(user_id, day, old_mood)] = -1
+    if new_mood:
+        increments[(user_id, day, new_mood)] = 1
+    _apply_increments(increments)
+
+def mood_summary(user_id):
+    """
+    Count a user's entries per mood with one GROUP BY over the mood column
+
+    Returns:
+        dict: mood_summary ({mood: count}) and total_entries
+    """
+    counts = db.session.query(JournalEntry.mood, func.count()).filter(
+        JournalEntry.user_id == user_id,
+        JournalEntry.mood.isnot(None),
+        JournalEntry.mood != ''
+    ).group_by(JournalEntry.mood).all()
+    total = db.session.query(func.count(JournalEntry.id)).filter(JournalEntry.user_id == user_id).scalar()
+
+    return {
+        'mood_summary': {mood: count for mood, count in counts},
+        'total_entries': total
+    }
+
+def mood_timeseries(user_id, since, resolution='day'):
+    """
+    Get a user's mood counts per bucket from the daily mood counters
+
+    Args:
+        user_id (int): The user
+        since (date): First day to include
+        resolution (str): 'day', 'week' or 'month'
+
+    Returns:
+        list: {'start', 'counts'} dicts, oldest first, for buckets with moods
+    """
+    if resolution not in RESOLUTIONS:
+        raise ValueError(f"Unknown resolution: {resolution}")
+
+    rows = db.session.query(MoodDailyCount.day, MoodDailyCount.mood, MoodDailyCount.count).filter(
+        MoodDailyCount.user_id == user_id,
+        MoodDailyCount.day >= since,
+        MoodDailyCount.count > 0
+    ).order_by(MoodDailyCount.day, MoodDailyCount.mood).all()
+
+    buckets = []
+    for day, mood, count in rows:
+        start = RESOLUTIONS[resolution](day).isoformat()
+        if not buckets or buckets[-1]['start'] != start:
+            buckets.append({'start': start, 'counts': {}})
+        counts = buckets[-1]['counts']
+        counts[mood] = counts.get(mood, 0) + count
+    return buckets
+
+def backfill_mood_counts():
+    """
+    Build empty mood counters from the stored journal entries
+
+    Only the user, date and mood columns are read. Does nothing if any
+    counters exist. Commits.
+
+    Returns:
+        int: Number of entries counted
+    """
+    if db.session.query(MoodDailyCount.user_id).first() is not None:
+        return 0
+
+    increments = {}
+    counted = 0
+    for user_id, entry_date, mood in db.session.query(
+        JournalEntry.user_id, JournalEntry.entry_date, JournalEntry.mood
+    ).filter(JournalEntry.mood.isnot(None), JournalEntry.mood != '', JournalEntry.entry_date.isnot(None)):
+        key = (user_id, entry_date.date(), mood)
+        increments[key] = increments.get(key, 0) + 1
+        counted += 1
+    _apply_increments(increments)
+    db.session.commit()
+    return counted
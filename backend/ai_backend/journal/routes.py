@@ -1,15 +1,43 @@
 # backend/ai_backend/journal/routes.py
 
-from flask import Blueprint, request, jsonify
-from extensions import db
-from ai_backend.models.journal import JournalEntry
-from ai_backend.models.user import User
-from ai_backend.security.access_control import AccessControl
-from ai_backend.security.data_encryption import DataEncryption
+import base64
+import binascii
+from datetime import datetime, timedelta
+
+from flask import Blueprint, Response, request, jsonify, current_app, stream_with_context
+from sqlalchemy import tuple_
+from sqlalchemy.orm import load_only
+from backend.extensions import db
+from backend.ai_backend.models.journal import JournalEntry
+from backend.ai_backend.journal.export import entries_data, export_lines
+from backend.ai_backend.journal.mood_counts import RESOLUTIONS, mood_summary, mood_timeseries, record_mood_change
+from backend.ai_backend.journal.search_index import index_entry, search_query, unindex_entry
+from backend.ai_backend.models.user import User
+from backend.ai_backend.security.access_control import AccessControl
+from backend.ai_backend.security.data_encryption import DataEncryption
 
 journal_bp = Blueprint('journal', __name__)
 encryptor = DataEncryption()
 
+def _encode_cursor(entry_date, entry_id):
+    """Opaque cursor pointing just past an entry"""
+    raw = f'{entry_date.isoformat()}|{entry_id}'.encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+def _decode_cursor(cursor):
+    """
+    (entry_date, id) of the entry a cursor points past
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)).decode()
+        entry_date, entry_id = raw.split('|')
+        return datetime.fromisoformat(entry_date), int(entry_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise ValueError("Invalid cursor") from e
+
 @journal_bp.route('/entries', methods=['POST'])
 @AccessControl.token_required
 def create_entry(current_user):
@@ -32,12 +60,15 @@ def create_entry(current_user):
     new_entry = JournalEntry(
         user_id=current_user.id,
         mood=data.get('mood'),
-        content=content if not is_sensitive else None,
+        content=content if not is_sensitive else '',
         is_sensitive=is_sensitive,
         encrypted_content=encrypted_content
     )
     
     db.session.add(new_entry)
+    db.session.flush()
+    record_mood_change(current_user.id, new_entry.entry_date, None, new_entry.mood)
+    index_entry(new_entry, content, encryptor)
     db.session.commit()
     
     return jsonify({
@@ -48,29 +79,88 @@ def create_entry(current_user):
 @journal_bp.route('/entries', methods=['GET'])
 @AccessControl.token_required
 def get_entries(current_user):
-    """Get all journal entries for current user"""
-    entries = JournalEntry.query.filter_by(user_id=current_user.id).all()
-    
-    result = []
-    for entry in entries:
-        entry_data = {
-            'id': entry.id,
-            'date': entry.entry_date.isoformat(),
-            'mood': entry.mood
-        }
-        
-        if entry.is_sensitive:
-            # Decrypt content
-            if entry.encrypted_content:
-                entry_data['content'] = encryptor.decrypt(entry.encrypted_content)
-            else:
-                entry_data['content'] = '[Encrypted content not available]'
-        else:
-            entry_data['content'] = entry.content
-        
-        result.append(entry_data)
+    """
+    Get a page of the current user's journal entries, newest first
+    
+    Query parameters: `limit` (entries per page, capped at
+    JOURNAL_MAX_PAGE_SIZE), `cursor` (from the previous page's
+    X-Next-Cursor header) and `headers_only` (return id, date and mood
+    without loading or decrypting content). X-Next-Cursor is only set when
+    there are more entries.
+    """
+    max_page_size = current_app.config.get('JOURNAL_MAX_PAGE_SIZE', 100)
+    limit = request.args.get('limit', current_app.config.get('JOURNAL_PAGE_SIZE', 20), type=int)
+    if limit is None or limit <= 0:
+        return jsonify({'error': 'Invalid limit'}), 400
+    limit = min(limit, max_page_size)
+    
+    headers_only = request.args.get('headers_only', '').lower() in ('1', 'true', 'yes')
+    
+    if headers_only:
+        query = db.session.query(JournalEntry.id, JournalEntry.entry_date, JournalEntry.mood)
+    else:
+        query = db.session.query(JournalEntry)
+    query = query.filter(JournalEntry.user_id == current_user.id)
+    
+    cursor = request.args.get('cursor')
+    if cursor:
+        try:
+            entry_date, entry_id = _decode_cursor(cursor)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        # Keyset on (entry_date, id), answered from idx_journal_user_date
+        query = query.filter(tuple_(JournalEntry.entry_date, JournalEntry.id) < (entry_date, entry_id))
+    
+    # One extra row tells whether there is a next page
+    entries = query.order_by(JournalEntry.entry_date.desc(), JournalEntry.id.desc()).limit(limit + 1).all()
+    has_more = len(entries) > limit
+    entries = entries[:limit]
+    
+    if headers_only:
+        result = [
+            {'id': entry.id, 'date': entry.entry_date.isoformat(), 'mood': entry.mood}
+            for entry in entries
+        ]
+    else:
+        result = entries_data(entries, encryptor)
     
-    return jsonify(result)
+    response = jsonify(result)
+    if has_more:
+        last = entries[-1]
+        response.headers['X-Next-Cursor'] = _encode_cursor(last.entry_date, last.id)
+    return response
+
+@journal_bp.route('/search', methods=['GET'])
+@AccessControl.token_required
+def search_entries(current_user):
+    """
+    Search the current user's journal entries, newest first
+    
+    Query parameters: `q` (entries must contain every term), `limit`
+    (capped at JOURNAL_MAX_PAGE_SIZE) and `headers_only`. Only the
+    matching entries returned are decrypted.
+    """
+    max_page_size = current_app.config.get('JOURNAL_MAX_PAGE_SIZE', 100)
+    limit = request.args.get('limit', current_app.config.get('JOURNAL_PAGE_SIZE', 20), type=int)
+    if limit is None or limit <= 0:
+        return jsonify({'error': 'Invalid limit'}), 400
+    limit = min(limit, max_page_size)
+    
+    query = search_query(current_user.id, request.args.get('q', ''), encryptor)
+    if query is None:
+        return jsonify({'error': 'Missing search terms'}), 400
+    
+    headers_only = request.args.get('headers_only', '').lower() in ('1', 'true', 'yes')
+    if headers_only:
+        query = query.options(load_only(JournalEntry.id, JournalEntry.entry_date, JournalEntry.mood))
+    entries = query.order_by(JournalEntry.entry_date.desc(), JournalEntry.id.desc()).limit(limit).all()
+    
+    if headers_only:
+        return jsonify([
+            {'id': entry.id, 'date': entry.entry_date.isoformat(), 'mood': entry.mood}
+            for entry in entries
+        ])
+    return jsonify(entries_data(entries, encryptor))
 
 @journal_bp.route('/entries/<int:entry_id>', methods=['GET'])
 @AccessControl.token_required
@@ -81,22 +171,7 @@ def get_entry(current_user, entry_id):
     if not entry:
         return jsonify({'error': 'Entry not found'}), 404
     
-    entry_data = {
-        'id': entry.id,
-        'date': entry.entry_date.isoformat(),
-        'mood': entry.mood
-    }
-    
-    if entry.is_sensitive:
-        # Decrypt content
-        if entry.encrypted_content:
-            entry_data['content'] = encryptor.decrypt(entry.encrypted_content)
-        else:
-            entry_data['content'] = '[Encrypted content not available]'
-    else:
-        entry_data['content'] = entry.content
-    
-    return jsonify(entry_data)
+    return jsonify(entries_data([entry], encryptor)[0])
 
 @journal_bp.route('/entries/<int:entry_id>', methods=['PUT'])
 @AccessControl.token_required
@@ -114,6 +189,7 @@ def update_entry(current_user, entry_id):
     
     # Update fields if provided
     if 'mood' in data:
+        record_mood_change(current_user.id, entry.entry_date, entry.mood, data['mood'])
         entry.mood = data['mood']
     
     if 'content' in data:
@@ -122,12 +198,13 @@ def update_entry(current_user, entry_id):
         if is_sensitive:
             # Encrypt content
             entry.encrypted_content = encryptor.encrypt(data['content'])
-            entry.content = None
+            entry.content = ''
         else:
             entry.content = data['content']
             entry.encrypted_content = None
         
         entry.is_sensitive = is_sensitive
+        index_entry(entry, data['content'], encryptor)
     
     db.session.commit()
     
@@ -142,23 +219,47 @@ def delete_entry(current_user, entry_id):
     if not entry:
         return jsonify({'error': 'Entry not found'}), 404
     
+    record_mood_change(current_user.id, entry.entry_date, entry.mood, None)
+    unindex_entry(entry.id)
     db.session.delete(entry)
     db.session.commit()
     
     return jsonify({'message': 'Entry deleted successfully'})
 
+@journal_bp.route('/export', methods=['GET'])
+@AccessControl.token_required
+def export_entries(current_user):
+    """Download all of the current user's journal entries as newline-delimited JSON"""
+    chunk_size = current_app.config.get('JOURNAL_EXPORT_CHUNK_SIZE', 500)
+    return Response(
+        stream_with_context(export_lines(current_user.id, encryptor, chunk_size)),
+        mimetype='application/x-ndjson',
+        headers={'Content-Disposition': 'attachment; filename=journal.ndjson'}
+    )
+
 @journal_bp.route('/moods', methods=['GET'])
 @AccessControl.token_required
 def get_mood_summary(current_user):
     """Get summary of user moods over time"""
-    entries = JournalEntry.query.filter_by(user_id=current_user.id).all()
+    return jsonify(mood_summary(current_user.id))
+
+@journal_bp.route('/moods/timeseries', methods=['GET'])
+@AccessControl.token_required
+def get_mood_timeseries(current_user):
+    """Get counts of the user's moods per day, week or month"""
+    resolution = request.args.get('resolution', 'day')
+    try:
+        days = int(request.args.get('days', 365))
+    except ValueError:
+        days = None
+    max_days = current_app.config.get('JOURNAL_MAX_TIMESERIES_DAYS', 3660)
     
-    mood_counts = {}
-    for entry in entries:
-        if entry.mood:
-            mood_counts[entry.mood] = mood_counts.get(entry.mood, 0) + 1
+    if resolution not in RESOLUTIONS or days is None or not 0 < days <= max_days:
+        return jsonify({'error': 'Invalid resolution or days'}), 400
     
+    since = datetime.utcnow().date() - timedelta(days=days - 1)
     return jsonify({
-        'mood_summary': mood_counts,
-        'total_entries': len(entries)
-    })
\ No newline at end of file
+        'resolution': resolution,
+        'since': since.isoformat(),
+        'buckets': mood_timeseries(current_user.id, since, resolution)
+    })
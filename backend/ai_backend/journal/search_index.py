@@ -0,0 +1,148 @@
+# backend/ai_backend/journal/search_index.py
+
+import re
+
+from backend.extensions import db
+from backend.ai_backend.models.journal import CREATE_JOURNAL_FTS, JournalEntry
+from backend.ai_backend.models.journal_blind_index import JournalBlindIndex
+from sqlalchemy import func, literal_column, select, table, text
+
+# Terms are runs of letters and digits, matching the FTS5 unicode61 tokenizer
+TERM_PATTERN = re.compile(r'[^\W_]+')
+
+# Terms used from one search query
+MAX_QUERY_TERMS = 10
+
+# Sensitive entries decrypted at a time while backfilling the blind index
+BACKFILL_CHUNK_SIZE = 500
+
+def search_terms(content):
+    """Distinct lowercase terms of a text, in order of first appearance"""
+    return list(dict.fromkeys(term.lower() for term in TERM_PATTERN.findall(content or '')))
+
+def _fts_enabled():
+    return db.session.get_bind().dialect.name == 'sqlite'
+
+def _blind_tokens(encryptor, user_id, terms):
+    return [encryptor.blind_token(term, scope=user_id) for term in terms]
+
+def unindex_entry(entry_id):
+    """Remove an entry from both search indexes. Runs in the caller's transaction."""
+    if _fts_enabled():
+        db.session.execute(text("DELETE FROM journal_fts WHERE rowid = :entry_id"), {'entry_id': entry_id})
+    JournalBlindIndex.query.filter_by(entry_id=entry_id).delete(synchronize_session=False)
+
+def index_entry(entry, content, encryptor):
+    """
+    (Re-)index an entry's content for search
+
+    Non-sensitive entries go into the journal_fts full-text table.
+    Sensitive entries only store blind tokens of their terms, so the index
+    holds no plaintext. Runs in the caller's transaction; the entry must
+    have been flushed so it has an ID.
+
+    Args:
+        entry (JournalEntry): The entry
+        content (str): The entry's plaintext content
+        encryptor (DataEncryption): Computes the blind tokens
+    """
+    unindex_entry(entry.id)
+
+    if entry.is_sensitive:
+        tokens = _blind_tokens(encryptor, entry.user_id, search_terms(content))
+        if tokens:
+            db.session.execute(db.insert(JournalBlindIndex), [
+                {'user_id': entry.user_id, 'token': token, 'entry_id': entry.id}
+                for token in tokens
+            ])
+    elif _fts_enabled() and content:
+        db.session.execute(
+            text("INSERT INTO journal_fts (rowid, content, user_id) VALUES (:entry_id, :content, :user_id)"),
+            {'entry_id': entry.id, 'content': content, 'user_id': entry.user_id}
+        )
+
+def search_query(user_id, query, encryptor):
+    """
+    Build a query for a user's entries containing every term of a search
+
+    Non-sensitive entries are matched with journal_fts, or with LIKE on
+    databases without FTS5. Sensitive entries are matched by their blind
+    tokens and are never decrypted.
+
+    Args:
+        user_id (int): The user whose journal is searched
+        query (str): The search text
+        encryptor (DataEncryption): Computes the blind tokens
+
+    Returns:
+        Query: JournalEntry query, or None if the search has no terms
+    """
+    terms = search_terms(query)[:MAX_QUERY_TERMS]
+    if not terms:
+        return None
+
+    if _fts_enabled():
+        # Every term quoted, which FTS5 combines with AND
+        match = ' '.join(f'"{term}"' for term in terms)
+        plain_ids = select(literal_column('rowid')).select_from(table('journal_fts')).where(
+            text("journal_fts MATCH :match AND user_id = :user_id")
+        ).params(match=match, user_id=user_id)
+        plain_match = JournalEntry.id.in_(plain_ids)
+    else:
+        plain_match = db.and_(
+            JournalEntry.is_sensitive.isnot(True),
+            *(func.lower(JournalEntry.content).contains(term, autoescape=True) for term in terms)
+        )
+
+    tokens = _blind_tokens(encryptor, user_id, terms)
+    sensitive_ids = select(JournalBlindIndex.entry_id).where(
+        JournalBlindIndex.user_id == user_id,
+        JournalBlindIndex.token.in_(tokens)
+    ).group_by(JournalBlindIndex.entry_id).having(func.count() == len(tokens))
+
+    return JournalEntry.query.filter(
+        JournalEntry.user_id == user_id,
+        db.or_(plain_match, JournalEntry.id.in_(sensitive_ids))
+    )
+
+def backfill_search_index(encryptor):
+    """
+    Index every stored journal entry if both search indexes are empty
+
+    Sensitive entries are decrypted once, in chunks, to compute their blind
+    tokens. Commits.
+
+    Returns:
+        int: Number of entries indexed
+    """
+    if _fts_enabled():
+        db.session.execute(text(CREATE_JOURNAL_FTS))
+        if db.session.execute(text("SELECT rowid FROM journal_fts LIMIT 1")).first() is not None:
+            return 0
+    if db.session.query(JournalBlindIndex.entry_id).first() is not None:
+        return 0
+
+    indexed = 0
+    last_id = 0
+    while True:
+        entries = JournalEntry.query.filter(JournalEntry.id > last_id).order_by(
+            JournalEntry.id
+        ).limit(BACKFILL_CHUNK_SIZE).all()
+        if not entries:
+            break
+
+        sensitive = [entry for entry in entries if entry.is_sensitive and entry.encrypted_content]
+        plaintexts = dict(zip(
+            (entry.id for entry in sensitive),
+            encryptor.decrypt_many(entry.encrypted_content for entry in sensitive)
+        ))
+        for entry in entries:
+            content = plaintexts.get(entry.id) if entry.is_sensitive else entry.content
+            index_entry(entry, content, encryptor)
+            indexed += 1
+
+        last_id = entries[-1].id
+        db.session.expunge_all()
+
+    db.session.commit()
+    return indexed
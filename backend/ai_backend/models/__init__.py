@@ -1,5 +1,14 @@
 # backend/ai_backend/models/__init__.py
 
 from .user import User
+from .journal import JournalEntry
 from .interaction import Interaction
-from .progress import Progress
\ No newline at end of file
+from .progress import Progress
+from .progress_summary import ProgressSummary
+from .module_stats import ModuleStats
+from .sentiment_daily_count import SentimentDailyCount
+from .emotional_event import EmotionalEvent, EmotionalStateRollup, EmotionalStateName
+from .user_data_version import UserDataVersion
+from .learning_path_snapshot import LearningPathSnapshot
+from .mood_daily_count import MoodDailyCount
+from .journal_blind_index import JournalBlindIndex
\ No newline at end of file
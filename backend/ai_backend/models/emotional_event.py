@@ -0,0 +1,46 @@
+# backend/ai_backend/models/emotional_event.py
+
+from backend.extensions import db
+
+class EmotionalEvent(db.Model):
+    """Append-only log of self-reported emotional states"""
+    __tablename__ = 'emotional_events'
+    
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), primary_key=True)
+    module_id = db.Column(db.String(50), primary_key=True)
+    timestamp = db.Column(db.DateTime, primary_key=True)
+    
+    # Code from EMOTIONAL_STATES in adaptive_learning/emotional_history.py
+    state = db.Column(db.SmallInteger, nullable=False)
+    
+    # Compaction deletes events by age across all users
+    __table_args__ = (
+        db.Index('idx_emotional_event_time', 'timestamp'),
+    )
+    
+    def __repr__(self):
+        return f'<EmotionalEvent {self.state} for User {self.user_id} on Module {self.module_id}>'
+
+class EmotionalStateRollup(db.Model):
+    """Count of emotional events per user, state and hour or day"""
+    __tablename__ = 'emotional_state_rollups'
+    
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), primary_key=True)
+    resolution = db.Column(db.String(4), primary_key=True)  # 'hour' or 'day'
+    bucket_start = db.Column(db.DateTime, primary_key=True)
+    state = db.Column(db.SmallInteger, primary_key=True)
+    
+    count = db.Column(db.Integer, nullable=False, default=0)
+    
+    def __repr__(self):
+        return f'<EmotionalStateRollup {self.resolution} {self.bucket_start} for User {self.user_id}>'
+
+class EmotionalStateName(db.Model):
+    """Codes of reported emotional states that are not in EMOTIONAL_STATES"""
+    __tablename__ = 'emotional_state_names'
+    
+    code = db.Column(db.SmallInteger, primary_key=True)
+    name = db.Column(db.String(50), nullable=False, unique=True)
+    
+    def __repr__(self):
+        return f'<EmotionalStateName {self.code} {self.name}>'
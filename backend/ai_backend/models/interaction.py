@@ -17,5 +17,10 @@ class Interaction(db.Model):
     query_type = db.Column(db.String(50), nullable=True)  # e.g., 'safety_question', 'general'
     sentiment = db.Column(db.String(20), nullable=True)   # e.g., 'neutral', 'concerned'
     
+    # Emotional trends read a user's interactions within a time window
+    __table_args__ = (
+        db.Index('idx_interaction_user_time', 'user_id', 'timestamp'),
+    )
+    
     def __repr__(self):
         return f'<Interaction {self.id} from User {self.user_id}>'
\ No newline at end of file
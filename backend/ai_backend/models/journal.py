@@ -2,6 +2,7 @@
 
 from backend.extensions import db
 from datetime import datetime
+from sqlalchemy import DDL, event
 
 class JournalEntry(db.Model):
     """Model to store user journal entries"""
@@ -19,5 +20,21 @@ class JournalEntry(db.Model):
     # Encrypted content (if sensitive)
     encrypted_content = db.Column(db.Text, nullable=True)
     
+    # Journal routes list a user's entries by date
+    __table_args__ = (
+        db.Index('idx_journal_user_date', 'user_id', 'entry_date'),
+    )
+    
     def __repr__(self):
-        return f'<JournalEntry {self.id} from User {self.user_id}>'
\ No newline at end of file
+        return f'<JournalEntry {self.id} from User {self.user_id}>'
+
+# Full-text index over the content of non-sensitive entries, keyed by entry
+# ID. SQLite only; it is kept up to date by ai_backend/journal/search_index.py.
+CREATE_JOURNAL_FTS = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS journal_fts USING fts5("
+    "content, user_id UNINDEXED, tokenize = 'unicode61 remove_diacritics 0')"
+)
+event.listen(JournalEntry.__table__, 'after_create', DDL(CREATE_JOURNAL_FTS).execute_if(dialect='sqlite'))
+event.listen(JournalEntry.__table__, 'before_drop', DDL(
+    "DROP TABLE IF EXISTS journal_fts"
+).execute_if(dialect='sqlite'))
@@ -0,0 +1,19 @@
+# backend/ai_backend/models/journal_blind_index.py
+
+from backend.extensions import db
+
+class JournalBlindIndex(db.Model):
+    """Keyed hashes of the terms in sensitive journal entries, for search without decryption"""
+    __tablename__ = 'journal_blind_index'
+    
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), primary_key=True)
+    token = db.Column(db.String(32), primary_key=True)  # DataEncryption.blind_token of a term
+    entry_id = db.Column(db.Integer, db.ForeignKey('journal_entries.id'), primary_key=True)
+    
+    # Entries are re-indexed and deleted by ID
+    __table_args__ = (
+        db.Index('idx_blind_index_entry', 'entry_id'),
+    )
+    
+    def __repr__(self):
+        return f'<JournalBlindIndex for Entry {self.entry_id}>'
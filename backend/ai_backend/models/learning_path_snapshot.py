@@ -0,0 +1,20 @@
+# backend/ai_backend/models/learning_path_snapshot.py
+
+from backend.extensions import db
+from datetime import datetime
+
+class LearningPathSnapshot(db.Model):
+    """A user's learning path and recommendations as computed by one snapshot run"""
+    __tablename__ = 'learning_path_snapshots'
+    
+    snapshot_id = db.Column(db.String(32), primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), primary_key=True)
+    
+    # JSON lists, as returned by get_learning_path and get_learning_recommendations
+    learning_path = db.Column(db.Text, nullable=False)
+    recommendations = db.Column(db.Text, nullable=False)
+    
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    
+    def __repr__(self):
+        return f'<LearningPathSnapshot {self.snapshot_id} for User {self.user_id}>'
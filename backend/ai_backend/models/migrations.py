@@ -0,0 +1,105 @@
+# backend/ai_backend/models/migrations.py
+
+from sqlalchemy import func, inspect
+
+from backend.extensions import db
+from backend.ai_backend.models.progress import Progress
+from backend.ai_backend.models.interaction import Interaction
+from backend.ai_backend.models.journal import JournalEntry
+
+# Indexes on the hot lookup columns, as declared on the models
+HOT_INDEXES = [
+    next(index for index in model.__table__.indexes if index.name == name)
+    for model, name in (
+        (Progress, 'idx_user_module'),
+        (Interaction, 'idx_interaction_user_time'),
+        (JournalEntry, 'idx_journal_user_date')
+    )
+]
+
+def _latest_with(rows, attribute):
+    """The most recently active row where an attribute is set, or None"""
+    for row in sorted(rows, key=lambda r: (r.last_activity is not None, r.last_activity, r.id), reverse=True):
+        if getattr(row, attribute) is not None:
+            return row
+    return None
+
+def merge_duplicate_progress():
+    """
+    Fold duplicate Progress rows for the same (user_id, module_id) into one
+
+    The row with the lowest ID is kept. Time spent is summed, completion
+    and last activity take the highest value, and quiz results and the
+    emotional state come from the most recently active row that has them.
+    The caller commits.
+
+    Returns:
+        list: IDs of users whose progress rows were merged
+    """
+    duplicates = db.session.query(Progress.user_id, Progress.module_id).group_by(
+        Progress.user_id, Progress.module_id
+    ).having(func.count(Progress.id) > 1).all()
+
+    for user_id, module_id in duplicates:
+        rows = Progress.query.filter_by(user_id=user_id, module_id=module_id).order_by(Progress.id).all()
+        keeper, extras = rows[0], rows[1:]
+
+        keeper.time_spent = sum(row.time_spent or 0 for row in rows)
+        keeper.completion_percentage = max(row.completion_percentage or 0.0 for row in rows)
+        keeper.last_activity = max((row.last_activity for row in rows if row.last_activity), default=None)
+
+        quiz_row = _latest_with(rows, 'quiz_score')
+        if quiz_row is not None:
+            keeper.quiz_score = quiz_row.quiz_score
+            keeper.quiz_time_taken = quiz_row.quiz_time_taken
+        emotion_row = _latest_with(rows, 'emotional_state')
+        keeper.emotional_state = emotion_row.emotional_state if emotion_row else None
+
+        for row in extras:
+            db.session.delete(row)
+
+    db.session.flush()
+    return sorted({user_id for user_id, _ in duplicates})
+
+def create_hot_indexes():
+    """
+    Create the hot lookup indexes that are missing from the database
+
+    An existing index with the right name but the wrong uniqueness (such as
+    the old non-unique idx_user_module) is dropped and recreated. Run
+    merge_duplicate_progress() and commit first, or the unique index on
+    progress cannot be built.
+
+    Returns:
+        list: Names of the indexes that were created
+    """
+    created = []
+    with db.engine.begin() as connection:
+        inspector = inspect(connection)
+        for index in HOT_INDEXES:
+            existing = {
+                found['name']: found for found in inspector.get_indexes(index.table.name)
+            }.get(index.name)
+
+            if existing is not None:
+                if bool(existing['unique']) == bool(index.unique):
+                    continue
+                index.drop(connection)
+
+            index.create(connection)
+            created.append(index.name)
+    return created
+
+def migrate_hot_indexes():
+    """
+    Deduplicate progress rows, then add the hot lookup indexes
+
+    Returns:
+        dict: Users whose progress rows were merged and the indexes created
+    """
+    merged_users = merge_duplicate_progress()
+    db.session.commit()
+    return {
+        'merged_users': merged_users,
+        'created_indexes': create_hot_indexes()
+    }
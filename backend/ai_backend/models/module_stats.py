@@ -0,0 +1,28 @@
+# backend/ai_backend/models/module_stats.py
+
+from backend.extensions import db
+from datetime import datetime
+
+class ModuleStats(db.Model):
+    """Running quiz statistics for one module, updated with every quiz result"""
+    __tablename__ = 'module_stats'
+    
+    module_id = db.Column(db.String(50), primary_key=True)
+    
+    # Quiz scores: count, running mean and sum of squared deviations (Welford)
+    quiz_count = db.Column(db.Integer, nullable=False, default=0)
+    score_mean = db.Column(db.Float, nullable=False, default=0.0)
+    score_m2 = db.Column(db.Float, nullable=False, default=0.0)
+    
+    # Quiz times, counted separately because time_taken is optional
+    timed_count = db.Column(db.Integer, nullable=False, default=0)
+    time_mean = db.Column(db.Float, nullable=False, default=0.0)
+    time_m2 = db.Column(db.Float, nullable=False, default=0.0)
+    
+    # P² estimator state per tracked quantile of time taken, as JSON
+    time_quantiles = db.Column(db.Text, nullable=True)
+    
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow)
+    
+    def __repr__(self):
+        return f'<ModuleStats for Module {self.module_id}>'
@@ -0,0 +1,15 @@
+# backend/ai_backend/models/mood_daily_count.py
+
+from backend.extensions import db
+
+class MoodDailyCount(db.Model):
+    """Per-user, per-day counts of the moods recorded in journal entries"""
+    __tablename__ = 'mood_daily_counts'
+    
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), primary_key=True)
+    day = db.Column(db.Date, primary_key=True)  # UTC date of the entries
+    mood = db.Column(db.String(20), primary_key=True)
+    count = db.Column(db.Integer, nullable=False, default=0)
+    
+    def __repr__(self):
+        return f'<MoodDailyCount {self.mood} for User {self.user_id} on {self.day}>'
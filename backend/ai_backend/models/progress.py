@@ -11,8 +11,10 @@ class Progress(db.Model):
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
     module_id = db.Column(db.String(50), nullable=False)
     
+    # Unique so concurrent writers cannot create duplicate rows and upserts
+    # can target it
     __table_args__ = (
-        db.Index('idx_user_module', 'user_id', 'module_id'),
+        db.Index('idx_user_module', 'user_id', 'module_id', unique=True),
     )
     
     # Progress tracking
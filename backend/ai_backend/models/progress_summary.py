@@ -0,0 +1,20 @@
+# backend/ai_backend/models/progress_summary.py
+
+from backend.extensions import db
+from datetime import datetime
+
+class ProgressSummary(db.Model):
+    """Running totals over a user's Progress rows, updated with every progress write"""
+    __tablename__ = 'progress_summaries'
+    
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), primary_key=True)
+    
+    total_modules = db.Column(db.Integer, nullable=False, default=0)
+    completed_modules = db.Column(db.Integer, nullable=False, default=0)
+    total_time_spent = db.Column(db.Integer, nullable=False, default=0)  # in seconds
+    completion_sum = db.Column(db.Float, nullable=False, default=0.0)    # sum of completion_percentage
+    
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow)
+    
+    def __repr__(self):
+        return f'<ProgressSummary for User {self.user_id}>'
@@ -0,0 +1,18 @@
+# backend/ai_backend/models/sentiment_daily_count.py
+
+from backend.extensions import db
+
+class SentimentDailyCount(db.Model):
+    """Per-user, per-day counts of chatbot interaction sentiments"""
+    __tablename__ = 'sentiment_daily_counts'
+    
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), primary_key=True)
+    day = db.Column(db.Date, primary_key=True)  # UTC date of the interactions
+    
+    # One column per sentiment the chatbot classifier produces
+    neutral = db.Column(db.Integer, nullable=False, default=0)
+    concerned = db.Column(db.Integer, nullable=False, default=0)
+    urgent = db.Column(db.Integer, nullable=False, default=0)
+    
+    def __repr__(self):
+        return f'<SentimentDailyCount for User {self.user_id} on {self.day}>'
@@ -0,0 +1,74 @@
+# backend/ai_backend/models/upsert.py
+
+from sqlalchemy.dialects import postgresql, sqlite
+
+from backend.extensions import db
+
+# Dialects whose INSERT supports ON CONFLICT ... DO UPDATE
+_UPSERT_INSERTS = {
+    'sqlite': sqlite.insert,
+    'postgresql': postgresql.insert
+}
+
+# Rows per upsert statement, well below SQLite's bound parameter limit
+INCREMENT_CHUNK_SIZE = 1000
+
+def upserts_supported():
+    """Whether the session's database supports `on_conflict_do_update`"""
+    return db.session.get_bind().dialect.name in _UPSERT_INSERTS
+
+def upsert_insert(model):
+    """
+    Create an INSERT for the session's database that supports
+    `on_conflict_do_update`
+
+    Args:
+        model: Mapped class or table to insert into
+
+    Returns:
+        Insert: Dialect-specific insert statement
+    """
+    dialect = db.session.get_bind().dialect.name
+    if dialect not in _UPSERT_INSERTS:
+        raise NotImplementedError(f"Upserts are not supported on {dialect}")
+    return _UPSERT_INSERTS[dialect](model)
+
+def increment_counters(model, key_columns, count_columns, rows):
+    """
+    Add rows to counter rows, creating the counters that do not exist yet
+
+    Uses one INSERT ... ON CONFLICT DO UPDATE per chunk where the database
+    supports it. Elsewhere each row is an UPDATE, followed by an INSERT if
+    no counter matched. Runs in the caller's transaction.
+
+    Args:
+        model: Mapped class of the counters
+        key_columns (list): Names of the columns of the unique key
+        count_columns (list): Names of the columns to add to
+        rows (list): Column dicts holding the key and the amounts to add
+    """
+    if not rows:
+        return
+
+    if not upserts_supported():
+        for row in rows:
+            updated = db.session.query(model).filter_by(
+                **{column: row[column] for column in key_columns}
+            ).update(
+                {column: getattr(model, column) + row[column] for column in count_columns},
+                synchronize_session=False
+            )
+            if not updated:
+                db.session.execute(db.insert(model).values(row))
+        return
+
+    for start in range(0, len(rows), INCREMENT_CHUNK_SIZE):
+        stmt = upsert_insert(model).values(rows[start:start + INCREMENT_CHUNK_SIZE])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[getattr(model, column) for column in key_columns],
+            set_={
+                column: getattr(model, column) + getattr(stmt.excluded, column)
+                for column in count_columns
+            }
+        )
+        db.session.execute(stmt)
@@ -0,0 +1,13 @@
+# backend/ai_backend/models/user_data_version.py
+
+from backend.extensions import db
+
+class UserDataVersion(db.Model):
+    """Counter bumped by every write to a user's learning or chatbot data"""
+    __tablename__ = 'user_data_versions'
+    
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0)
+    
+    def __repr__(self):
+        return f'<UserDataVersion {self.version} for User {self.user_id}>'
@@ -4,7 +4,7 @@ from functools import wraps
 from flask import request, jsonify, current_app
 import jwt
 from datetime import datetime, timedelta
-from ai_backend.models.user import User
+from backend.ai_backend.models.user import User
 
 class AccessControl:
     """Handles authentication and authorization"""
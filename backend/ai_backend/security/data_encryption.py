@@ -1,7 +1,11 @@
 # backend/ai_backend/security/data_encryption.py
 
 import base64
+import hashlib
+import hmac
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
@@ -9,8 +13,18 @@ from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 class DataEncryption:
     """Handles encryption and decryption of sensitive user data"""
     
-    def __init__(self, secret_key=None):
-        """Initialize encryption with a secret key or generate one"""
+    # Below this many values decrypt_many works inline, since handing them
+    # to threads costs more than decrypting them
+    MIN_PARALLEL_ITEMS = 16
+    
+    def __init__(self, secret_key=None, max_workers=None):
+        """
+        Initialize encryption with a secret key or generate one
+        
+        Args:
+            secret_key (str): Secret the encryption key is derived from
+            max_workers (int): Threads used by decrypt_many, up to 8 by default
+        """
         if secret_key:
             self.secret_key = secret_key
         else:
@@ -20,6 +34,14 @@ class DataEncryption:
         # Generate a key from the secret key
         self.key = self._generate_key(self.secret_key)
         self.cipher = Fernet(self.key)
+        
+        # Separate key for blind index tokens, so they reveal nothing about the encryption key
+        self.index_key = hmac.new(base64.urlsafe_b64decode(self.key), b'shieldly_blind_index', hashlib.sha256).digest()
+        
+        # Created on the first large decrypt_many and shared by later calls
+        self.max_workers = max_workers or min(8, os.cpu_count() or 1)
+        self._executor = None
+        self._executor_lock = threading.Lock()
     
     def _generate_key(self, secret_key):
         """Generate a Fernet key from a secret key"""
@@ -78,4 +100,58 @@ class DataEncryption:
         except Exception as e:
             # Log error in production
             print(f"Decryption error: {e}")
-            return None
\ No newline at end of file
+            return None
+    
+    def blind_token(self, term, scope=''):
+        """
+        Keyed hash of a search term, to find encrypted content without decrypting it
+        
+        Args:
+            term (str): The normalized term
+            scope (str): Namespace of the token, e.g. the user ID, so the same
+                term gives unrelated tokens in different namespaces
+            
+        Returns:
+            str: 32 hex characters
+        """
+        message = f'{scope}:{term}'.encode()
+        return hmac.new(self.index_key, message, hashlib.sha256).hexdigest()[:32]
+    
+    def _get_executor(self):
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix='decrypt'
+                )
+            return self._executor
+    
+    def _decrypt_chunk(self, chunk):
+        return [self.decrypt(encrypted_data) for encrypted_data in chunk]
+    
+    def decrypt_many(self, encrypted_items):
+        """
+        Decrypt many values, spread over a bounded thread pool
+        
+        The cryptography primitives release the GIL, so large batches use
+        several cores. Each value is handled like decrypt, so empty or
+        undecryptable values give None.
+        
+        Args:
+            encrypted_items (list): Encrypted values as base64 strings
+            
+        Returns:
+            list: Decrypted values, in the same order
+        """
+        encrypted_items = list(encrypted_items)
+        workers = min(self.max_workers, len(encrypted_items) // self.MIN_PARALLEL_ITEMS)
+        if workers <= 1:
+            return self._decrypt_chunk(encrypted_items)
+        
+        # One contiguous chunk per worker keeps the per-task overhead low
+        size = -(-len(encrypted_items) // workers)
+        chunks = [encrypted_items[start:start + size] for start in range(0, len(encrypted_items), size)]
+        results = []
+        for decrypted in self._get_executor().map(self._decrypt_chunk, chunks):
+            results.extend(decrypted)
+        return results
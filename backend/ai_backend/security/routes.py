@@ -1,10 +1,10 @@
 # backend/ai_backend/security/routes.py
 
 from flask import Blueprint, request, jsonify
-from ai_backend.security.data_encryption import DataEncryption
-from ai_backend.security.access_control import AccessControl
-from ai_backend.models.user import User
-from extensions import db
+from backend.ai_backend.security.data_encryption import DataEncryption
+from backend.ai_backend.security.access_control import AccessControl
+from backend.ai_backend.models.user import User
+from backend.extensions import db
 
 security_bp = Blueprint('security', __name__)
 
@@ -1,24 +1,30 @@
 # backend/app.py
 
 from flask import Flask
-from extensions import db
+from backend.extensions import db
 
 def create_app():
     app = Flask(__name__)
 
     # Load configuration settings
-    app.config.from_object('config.DevelopmentConfig')
+    app.config.from_object('backend.config.DevelopmentConfig')
 
     db.init_app(app)
 
     # Register blueprints
-    from ai_backend.chatbot.engine import chatbot_bp
+    from backend.ai_backend.chatbot.engine import chatbot_bp, response_cache
+    response_cache.init_app(app)
+    from backend.ai_backend.chatbot.persistence import interaction_writer
+    interaction_writer.init_app(app)
+    from backend.ai_backend.chatbot.translated_catalog import build_catalogs
+    build_catalogs()
     app.register_blueprint(chatbot_bp, url_prefix='/chatbot')
 
-    from ai_backend.adaptive_learning.routes import adaptive_learning_bp
+    from backend.ai_backend.adaptive_learning.routes import adaptive_learning_bp, result_cache
+    result_cache.init_app(app)
     app.register_blueprint(adaptive_learning_bp, url_prefix='/adaptive')
 
-    from ai_backend.security.routes import security_bp
+    from backend.ai_backend.security.routes import security_bp
     app.register_blueprint(security_bp, url_prefix='/security')
 
     # Add to backend/app.py where you register other blueprints
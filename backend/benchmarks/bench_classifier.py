@@ -0,0 +1,104 @@
+# backend/benchmarks/bench_classifier.py
+#
+# Per-query latency of the chatbot keyword classification, before and after
+# the precompiled classifier. Run from the repository root:
+#
+#     python -m backend.benchmarks.bench_classifier
+
+import argparse
+import re
+import timeit
+
+from backend.ai_backend.chatbot.classifier import classify_query
+from backend.ai_backend.chatbot.safety_responses import KEYWORD_MAPPING
+
+SAMPLE_QUERIES = [
+    "What should I do if I feel unsafe?",
+    "How do I report abuse at school?",
+    "What are the signs of abuse?",
+    "I'm scared and I need help now",
+    "Someone touched me and I feel uncomfortable",
+    "Can you explain personal boundaries and consent?",
+    "My friend was abused, how can I help someone like her?",
+    "Hello, who are you?",
+    "Tell me about the weather today",
+    "I am worried and sad, I feel alone and nobody listens to me at home or at school",
+]
+
+
+def legacy_determine_query_type(query):
+    """Original implementation: one regex search per keyword"""
+    safety_keywords = [
+        'abuse', 'assault', 'harassment', 'threat', 'violence', 'inappropriate',
+        'touch', 'unsafe', 'uncomfortable', 'help', 'danger', 'scared', 'afraid',
+        'consent', 'boundaries', 'protect', 'tell someone', 'report'
+    ]
+    for keyword in safety_keywords:
+        if re.search(r'\b' + keyword + r'\b', query.lower()):
+            return 'safety_question'
+    return 'general'
+
+
+def legacy_analyze_sentiment(query):
+    """Original implementation: one regex search per sentiment word"""
+    negative_words = ['scared', 'afraid', 'worried', 'anxious', 'sad', 'upset',
+                      'confused', 'hurt', 'alone', 'helpless', 'threatened']
+    neutral_words = ['what', 'how', 'when', 'where', 'who', 'which', 'why',
+                     'information', 'explain', 'tell', 'know']
+    urgent_words = ['emergency', 'help', 'now', 'dangerous', 'immediately', 'urgent']
+
+    negative_count = sum(1 for word in negative_words if re.search(r'\b' + word + r'\b', query.lower()))
+    neutral_count = sum(1 for word in neutral_words if re.search(r'\b' + word + r'\b', query.lower()))
+    urgent_count = sum(1 for word in urgent_words if re.search(r'\b' + word + r'\b', query.lower()))
+
+    if urgent_count > 0:
+        return 'urgent'
+    elif negative_count > neutral_count:
+        return 'concerned'
+    return 'neutral'
+
+
+def legacy_category(query):
+    """Original KEYWORD_MAPPING scan from get_safety_response"""
+    query_lower = query.lower()
+    for category, keywords in KEYWORD_MAPPING.items():
+        for keyword in keywords:
+            if keyword in query_lower:
+                return category
+    return None
+
+
+def legacy_pipeline(query):
+    return legacy_determine_query_type(query), legacy_analyze_sentiment(query), legacy_category(query)
+
+
+def compiled_pipeline(query):
+    result = classify_query(query)
+    return result.query_type, result.sentiment, result.category
+
+
+def per_query_us(fn, number):
+    """Average latency of fn over the sample queries, in microseconds"""
+    total = timeit.timeit(lambda: [fn(q) for q in SAMPLE_QUERIES], number=number)
+    return total / (number * len(SAMPLE_QUERIES)) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark chatbot query classification')
+    parser.add_argument('--number', type=int, default=2000, help='Passes over the sample queries')
+    args = parser.parse_args()
+
+    for query in SAMPLE_QUERIES:
+        if legacy_pipeline(query) != compiled_pipeline(query):
+            print(f"Mismatch for {query!r}: {legacy_pipeline(query)} != {compiled_pipeline(query)}")
+
+    before = per_query_us(legacy_pipeline, args.number)
+    after = per_query_us(compiled_pipeline, args.number)
+
+    print(f"legacy per-keyword regex : {before:8.2f} us/query")
+    print(f"precompiled classifier   : {after:8.2f} us/query")
+    print(f"speedup                  : {before / after:8.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+# backend/benchmarks/bench_decryption.py
+#
+# Bulk decryption throughput of DataEncryption.decrypt_many against the
+# number of worker threads, on a synthetic history of encrypted journal
+# entries. Exits non-zero if any result differs from decrypt. Run from the
+# repository root:
+#
+#     python -m backend.benchmarks.bench_decryption --entries 10000
+
+import argparse
+import os
+import random
+import sys
+import timeit
+
+from backend.ai_backend.security.data_encryption import DataEncryption
+
+WORDS = ('today', 'school', 'friend', 'felt', 'safe', 'worried', 'talked', 'teacher',
+         'home', 'happy', 'scared', 'better', 'trusted', 'adult', 'again', 'said')
+
+
+def synthetic_entries(encryptor, count, min_words, max_words, seed=0):
+    """Encrypted journal entries of random length"""
+    rng = random.Random(seed)
+    return [
+        encryptor.encrypt(' '.join(rng.choice(WORDS) for _ in range(rng.randint(min_words, max_words))))
+        for _ in range(count)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark bulk journal decryption')
+    parser.add_argument('--entries', type=int, default=10000)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8])
+    parser.add_argument('--min-words', type=int, default=20)
+    parser.add_argument('--max-words', type=int, default=600)
+    parser.add_argument('--number', type=int, default=3)
+    args = parser.parse_args()
+
+    secret = 'benchmark-secret'
+    reference = DataEncryption(secret)
+    entries = synthetic_entries(reference, args.entries, args.min_words, args.max_words)
+    expected = [reference.decrypt(entry) for entry in entries]
+    print(f"{args.entries} entries, {sum(map(len, entries)) / len(entries):.0f} bytes on average, "
+          f"{os.cpu_count()} CPUs")
+
+    mismatches = 0
+    baseline = None
+    print(f"{'workers':>8} {'entries/s':>11} {'speedup':>8}")
+    for workers in args.workers:
+        encryptor = DataEncryption(secret, max_workers=workers)
+        if encryptor.decrypt_many(entries) != expected:
+            mismatches += 1
+            print(f"  {workers} workers: results differ from decrypt")
+
+        seconds = timeit.timeit(lambda: encryptor.decrypt_many(entries), number=args.number) / args.number
+        throughput = args.entries / seconds
+        baseline = baseline or throughput
+        print(f"{workers:>8} {throughput:>11.0f} {throughput / baseline:>8.2f}")
+
+    if mismatches:
+        sys.exit(f"decrypt_many differs from decrypt for {mismatches} worker counts")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+# backend/benchmarks/bench_language_detection.py
+#
+# Accuracy and throughput of the n-gram language detector against the old
+# keyword scan, over the labeled corpus in tests/data. Fails if single texts
+# are detected differently from batches, or more slowly than --min-single-ratio
+# times the speed of the old scan. Run from the repository root:
+#
+#     python -m backend.benchmarks.bench_language_detection
+
+import argparse
+import json
+import os
+import sys
+import time
+
+from backend.ai_backend.chatbot.multilingual import detect_language, detect_languages
+
+CORPUS_FILE = os.path.join(os.path.dirname(__file__), '..', 'tests', 'data', 'language_corpus.json')
+
+
+def legacy_detect_language(text):
+    """Original implementation: substring checks against a few words"""
+    text_lower = text.lower()
+    spanish_words = ['como', 'qué', 'por qué', 'cómo', 'ayuda', 'hola', 'gracias']
+    if any(word in text_lower for word in spanish_words):
+        return 'es'
+    french_words = ['comment', 'pourquoi', 'bonjour', 'merci', 'aide', 'je suis']
+    if any(word in text_lower for word in french_words):
+        return 'fr'
+    german_words = ['wie', 'warum', 'hallo', 'danke', 'hilfe', 'ich bin']
+    if any(word in text_lower for word in german_words):
+        return 'de'
+    return 'en'
+
+
+def accuracy(predictions, labels):
+    return sum(1 for p, l in zip(predictions, labels) if p == l) / len(labels)
+
+
+def texts_per_second(fn, texts, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn(texts)
+    return len(texts) * repeat / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark language detection')
+    parser.add_argument('--batch', type=int, default=10000, help='Texts per batch')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--min-single-ratio', type=float, default=1.0,
+                        help='Lowest accepted per-text throughput as a fraction of the legacy scan')
+    args = parser.parse_args()
+
+    with open(CORPUS_FILE, 'r', encoding='utf-8') as f:
+        corpus = json.load(f)
+    texts = [sample['text'] for sample in corpus]
+    labels = [sample['language'] for sample in corpus]
+
+    print(f"accuracy  legacy scan : {accuracy([legacy_detect_language(t) for t in texts], labels):.1%}")
+    print(f"accuracy  n-gram      : {accuracy(detect_languages(texts), labels):.1%}")
+
+    workload = (texts * (args.batch // len(texts) + 1))[:args.batch]
+    legacy = texts_per_second(lambda batch: [legacy_detect_language(t) for t in batch], workload, args.repeat)
+    single = texts_per_second(lambda batch: [detect_language(t) for t in batch], workload, args.repeat)
+    batched = texts_per_second(detect_languages, workload, args.repeat)
+
+    print(f"throughput legacy scan        : {legacy:12,.0f} texts/s")
+    print(f"throughput n-gram, per text   : {single:12,.0f} texts/s")
+    print(f"throughput n-gram, batched    : {batched:12,.0f} texts/s")
+
+    mismatches = sum(1 for text, language in zip(texts, detect_languages(texts)) if detect_language(text) != language)
+    if mismatches:
+        sys.exit(f"Single-text detection differs from batched detection for {mismatches} texts")
+    if single < args.min_single_ratio * legacy:
+        sys.exit(f"Per-text throughput is {single / legacy:.2f}x the legacy scan, below {args.min_single_ratio}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,152 @@
+# backend/benchmarks/bench_progress_summary.py
+#
+# Progress summary cost on a synthetic progress table: get_progress_summary
+# (loads every row) against get_optimized_progress_summary (one SQL
+# aggregate plus two bounded queries) and get_aggregated_progress_summary
+# (maintained summary row, full module lists). Exits non-zero if either
+# summary differs from the full one or the optimized one is slower than
+# --min-speedup. Run from the repository
+# root:
+#
+#     python -m backend.benchmarks.bench_progress_summary --rows 1000000
+
+import argparse
+import math
+import os
+import random
+import sys
+import tempfile
+import timeit
+from datetime import datetime, timedelta
+
+from flask import Flask
+from sqlalchemy import insert
+
+from backend.extensions import db
+from backend.ai_backend.models.progress import Progress
+from backend.ai_backend.models.user import User
+from backend.ai_backend.models.journal import JournalEntry  # noqa: F401 - needed by User.journal_entries
+from backend.ai_backend.adaptive_learning.user_progress import UserProgressTracker
+from backend.ai_backend.adaptive_learning.progress_aggregates import check_progress_summaries
+
+CHUNK_SIZE = 100000
+
+
+def create_app(path):
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{path}'
+    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    db.init_app(app)
+    return app
+
+
+def populate(rows, modules_per_user, seed=0):
+    """Insert users and `rows` progress records spread evenly across them"""
+    rng = random.Random(seed)
+    user_count = max(1, rows // modules_per_user)
+    now = datetime.utcnow().replace(microsecond=0)
+
+    db.session.execute(insert(User), [
+        {'id': i, 'username': f'user_{i}', 'age': 12} for i in range(1, user_count + 1)
+    ])
+
+    chunk = []
+    for n in range(rows):
+        quiz_taken = rng.random() < 0.3
+        chunk.append({
+            'user_id': n // modules_per_user + 1,
+            'module_id': f'module_{n % modules_per_user + 1}',
+            'completion_percentage': 100.0 if rng.random() < 0.4 else round(rng.uniform(0, 99.9), 2),
+            'time_spent': rng.randint(0, 3600),
+            'last_activity': now - timedelta(seconds=rng.randint(0, 30 * 86400)),
+            'quiz_score': round(rng.uniform(0, 100), 1) if quiz_taken else None
+        })
+        if len(chunk) == CHUNK_SIZE:
+            db.session.execute(insert(Progress), chunk)
+            chunk = []
+    if chunk:
+        db.session.execute(insert(Progress), chunk)
+    db.session.commit()
+    return user_count
+
+
+def expected_lists(full, recent_limit, attention_limit):
+    """The full summary's lists, ordered and cut the way the module queries return them"""
+    recent = sorted(full['recent_modules'], key=lambda m: m['module_id'])
+    recent.sort(key=lambda m: m['last_activity'], reverse=True)
+    attention = sorted(full['needs_attention'], key=lambda m: m['module_id'])
+    attention.sort(key=lambda m: m['completion_percentage'])
+    return recent[:recent_limit], attention[:attention_limit]
+
+
+def differences(full, summary, recent_limit=None, attention_limit=None):
+    """Fields where a summary disagrees with the full one"""
+    diffs = [key for key in ('total_modules', 'completed_modules', 'total_time_spent') if full[key] != summary[key]]
+    diffs += [key for key in ('completion_rate', 'average_completion')
+              if not math.isclose(full[key], summary[key], rel_tol=1e-9, abs_tol=1e-9)]
+    recent, attention = expected_lists(full, recent_limit, attention_limit)
+    if summary['recent_modules'] != recent:
+        diffs.append('recent_modules')
+    if summary['needs_attention'] != attention:
+        diffs.append('needs_attention')
+    return diffs
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark progress summary strategies')
+    parser.add_argument('--rows', type=int, default=1000000)
+    parser.add_argument('--modules-per-user', type=int, default=500)
+    parser.add_argument('--users', type=int, default=20, help='Users to summarize')
+    parser.add_argument('--min-speedup', type=float, default=1.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        app = create_app(os.path.join(directory, 'bench.db'))
+        with app.app_context():
+            db.create_all()
+            started = timeit.default_timer()
+            user_count = populate(args.rows, args.modules_per_user)
+            check_progress_summaries(repair=True)
+            print(f"{args.rows} progress rows for {user_count} users built in {timeit.default_timer() - started:.1f}s")
+
+            user_ids = random.Random(1).sample(range(1, user_count + 1), min(args.users, user_count))
+            trackers = [UserProgressTracker(user_id) for user_id in user_ids]
+
+            mismatches = 0
+            for tracker in trackers:
+                full = tracker.get_progress_summary()
+                for name, summary, limits in (
+                    ('optimized', tracker.get_optimized_progress_summary(),
+                     (UserProgressTracker.RECENT_MODULES_LIMIT, UserProgressTracker.ATTENTION_MODULES_LIMIT)),
+                    ('aggregate', tracker.get_aggregated_progress_summary(), (None, None))
+                ):
+                    diffs = differences(full, summary, *limits)
+                    if diffs:
+                        mismatches += 1
+                        print(f"  user {tracker.user_id}: {name} differs in {', '.join(diffs)}")
+
+            def per_call(method):
+                def run():
+                    for tracker in trackers:
+                        getattr(tracker, method)()
+                        db.session.expire_all()
+                return timeit.timeit(run, number=3) / (3 * len(trackers)) * 1e3
+
+            full_ms = per_call('get_progress_summary')
+            optimized_ms = per_call('get_optimized_progress_summary')
+            aggregate_ms = per_call('get_aggregated_progress_summary')
+
+    speedup = full_ms / optimized_ms
+    print(f"{'strategy':>10} {'ms/user':>9} {'speedup':>8}")
+    print(f"{'full':>10} {full_ms:>9.2f} {1.0:>8.1f}")
+    print(f"{'optimized':>10} {optimized_ms:>9.2f} {speedup:>8.1f}")
+    print(f"{'aggregate':>10} {aggregate_ms:>9.2f} {full_ms / aggregate_ms:>8.1f}")
+
+    if mismatches:
+        sys.exit(f"{mismatches} summaries differ from get_progress_summary")
+    if speedup < args.min_speedup:
+        sys.exit(f"Optimized summary speedup {speedup:.1f}x is below {args.min_speedup}x")
+
+
+if __name__ == '__main__':
+    main()
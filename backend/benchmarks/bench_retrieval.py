@@ -0,0 +1,90 @@
+# backend/benchmarks/bench_retrieval.py
+#
+# Query latency of the TF-IDF response retriever against catalog size,
+# compared with a sparse dot product per response in a Python loop. Run from the
+# repository root:
+#
+#     python -m backend.benchmarks.bench_retrieval
+
+import argparse
+import random
+import timeit
+
+import numpy as np
+
+from backend.ai_backend.chatbot.retrieval import ResponseRetriever, _tokenize
+from backend.ai_backend.chatbot.safety_responses import KEYWORD_MAPPING, load_responses
+
+QUERIES = [
+    "How do I report abuse to a school counselor?",
+    "my friend was abused and I want to support her",
+    "is it okay to say no when someone touches me",
+]
+
+
+def synthetic_catalog(size, seed=0):
+    """Real default responses padded with random sentences over the same vocabulary"""
+    rng = random.Random(seed)
+    catalog = {category: list(texts) for category, texts in load_responses().items()}
+    words = sorted({word for texts in catalog.values() for text in texts for word in text.split()})
+    words += [''.join(rng.choice('abcdefghijklmnopqrstuvwxyz') for _ in range(7)) for _ in range(5000)]
+    categories = [c for c in catalog if c != 'fallback']
+
+    count = sum(len(texts) for texts in catalog.values())
+    while count < size:
+        sentence = ' '.join(rng.choice(words) for _ in range(rng.randint(8, 25)))
+        catalog[rng.choice(categories)].append(sentence)
+        count += 1
+    return catalog
+
+
+def document_vectors(retriever):
+    """Per-document {term: weight} dicts, as a pure Python implementation would keep them"""
+    vectors = [{} for _ in range(retriever.doc_count)]
+    for term in range(len(retriever.vocabulary)):
+        for position in range(retriever.indptr[term], retriever.indptr[term + 1]):
+            vectors[retriever.post_docs[position]][term] = float(retriever.post_weights[position])
+    return vectors
+
+
+def loop_best_match(retriever, vectors, query):
+    """Reference: one sparse dot product per document in a Python loop"""
+    counts = {}
+    for token in _tokenize(query):
+        if token in retriever.vocabulary:
+            term = retriever.vocabulary[token]
+            counts[term] = counts.get(term, 0) + 1
+    weights = {t: (1.0 + np.log(c)) * retriever.idf[t] for t, c in counts.items()}
+
+    scores = [sum(weight * vector.get(term, 0.0) for term, weight in weights.items()) for vector in vectors]
+    return max(range(len(scores)), key=scores.__getitem__)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark safety response retrieval')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[12, 1000, 10000])
+    parser.add_argument('--number', type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{'responses':>9} {'loop ms':>9} {'vectorized ms':>14} {'build ms':>9}")
+    for size in args.sizes:
+        catalog = synthetic_catalog(size)
+
+        build = timeit.timeit(lambda: ResponseRetriever(catalog, KEYWORD_MAPPING), number=1) * 1e3
+        retriever = ResponseRetriever(catalog, KEYWORD_MAPPING)
+        vectors = document_vectors(retriever)
+
+        for query in QUERIES:
+            if loop_best_match(retriever, vectors, query) != int(retriever.score(query).argmax()):
+                print(f"  note: best match differs for {query!r}")
+
+        loop = timeit.timeit(lambda: [loop_best_match(retriever, vectors, q) for q in QUERIES], number=5) / 5 / len(QUERIES) * 1e3
+        vectorized = timeit.timeit(
+            lambda: [retriever.best_match(q) for q in QUERIES], number=args.number
+        ) / (args.number * len(QUERIES)) * 1e3
+
+        print(f"{size:>9} {loop:>9.2f} {vectorized:>14.4f} {build:>9.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+# backend/benchmarks/bench_translation.py
+#
+# Translation cost against dictionary size, before and after the compiled
+# Translator. Run from the repository root:
+#
+#     python -m backend.benchmarks.bench_translation
+
+import argparse
+import random
+import re
+import timeit
+
+from backend.ai_backend.chatbot.multilingual import Translator, load_translation_dictionary
+
+SAMPLE_TEXT = (
+    "If you or someone you know is in immediate danger, please call emergency services. "
+    "You can also contact a trusted adult, school counselor, or call a helpline. "
+    "I'm here to help with information about personal safety and support resources."
+)
+
+
+def legacy_translate(text, translation_dict):
+    """Original implementation: sort, then one re.sub per dictionary entry"""
+    result = text
+    sorted_translations = sorted(translation_dict.items(), key=lambda x: len(x[0]), reverse=True)
+    for eng, trans in sorted_translations:
+        pattern = r'\b' + re.escape(eng) + r'\b'
+        result = re.sub(pattern, trans, result, flags=re.IGNORECASE)
+    return result
+
+
+def synthetic_dictionary(size, seed=0):
+    """Real sample entries padded with random multi-word phrases"""
+    rng = random.Random(seed)
+    alphabet = 'abcdefghijklmnopqrstuvwxyz'
+    entries = dict(load_translation_dictionary('es'))
+    while len(entries) < size:
+        words = [''.join(rng.choice(alphabet) for _ in range(rng.randint(3, 9)))
+                 for _ in range(rng.randint(1, 4))]
+        entries[' '.join(words)] = ' '.join(reversed(words))
+    return entries
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark dictionary translation')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10, 1000, 10000])
+    parser.add_argument('--number', type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'entries':>8} {'legacy ms':>10} {'compiled ms':>12} {'build ms':>9}")
+    for size in args.sizes:
+        entries = synthetic_dictionary(size)
+
+        build = timeit.timeit(lambda: Translator(entries), number=1) * 1e3
+        translator = Translator(entries)
+
+        if translator.translate(SAMPLE_TEXT) != legacy_translate(SAMPLE_TEXT, entries):
+            print(f"  note: outputs differ at {size} entries")
+
+        # The legacy path re-sorted and re-ran every pattern per call, so
+        # few iterations are enough to see its cost
+        legacy_number = max(1, args.number // 10) if size > 1000 else args.number
+        legacy = timeit.timeit(lambda: legacy_translate(SAMPLE_TEXT, entries), number=legacy_number) / legacy_number * 1e3
+        compiled = timeit.timeit(lambda: translator.translate(SAMPLE_TEXT), number=args.number * 50) / (args.number * 50) * 1e3
+
+        print(f"{size:>8} {legacy:>10.3f} {compiled:>12.4f} {build:>9.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,21 @@
+# backend/check_progress_summaries.py
+
+import sys
+
+from backend.app import create_app
+from backend.ai_backend.adaptive_learning.progress_aggregates import check_progress_summaries
+
+# Pass --repair to rebuild the summaries that do not match the progress rows
+repair = '--repair' in sys.argv[1:]
+
+app = create_app()
+with app.app_context():
+    mismatched = check_progress_summaries(repair=repair)
+    if not mismatched:
+        print("All progress summaries match the progress records.")
+    elif repair:
+        print(f"Rebuilt {len(mismatched)} progress summaries: {mismatched}")
+    else:
+        print(f"{len(mismatched)} progress summaries are out of date: {mismatched}")
+        print("Run with --repair to rebuild them.")
+        sys.exit(1)
@@ -0,0 +1,13 @@
+# backend/compact_emotional_history.py
+
+from backend.app import create_app
+from backend.ai_backend.adaptive_learning.emotional_history import compact_emotional_history
+
+# Run periodically (e.g. daily from cron) to bound the size of the event log
+app = create_app()
+with app.app_context():
+    deleted = compact_emotional_history(
+        app.config['EMOTIONAL_EVENT_RETENTION_DAYS'],
+        app.config['EMOTIONAL_HOURLY_RETENTION_DAYS']
+    )
+    print(f"Deleted {deleted['events']} emotional events and {deleted['hourly_rollups']} hourly rollups.")
@@ -10,6 +10,60 @@ class Config:
     # Database configuration
     SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL')
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    
+    # How /adaptive/progress-summary computes totals: 'aggregate' reads the
+    # maintained ProgressSummary row, 'optimized' runs one SQL aggregate,
+    # 'full' loads every progress record
+    PROGRESS_SUMMARY_STRATEGY = os.environ.get('PROGRESS_SUMMARY_STRATEGY', 'aggregate')
+    
+    # Longest recent_modules and needs_attention lists in the 'aggregate'
+    # summary; None returns every matching module, as 'full' does
+    PROGRESS_SUMMARY_RECENT_LIMIT = None
+    PROGRESS_SUMMARY_ATTENTION_LIMIT = None
+    
+    # Activity heartbeats accepted per /adaptive/track-activity/batch request
+    ADAPTIVE_MAX_ACTIVITY_BATCH = 1000
+    
+    # Cached recommendations, learning paths and emotional trends, keyed by
+    # each user's data version: 'memory' keeps them per process, 'redis'
+    # shares them between workers (needs the redis package)
+    ADAPTIVE_RESULT_CACHE_BACKEND = os.environ.get('ADAPTIVE_RESULT_CACHE_BACKEND', 'memory')
+    ADAPTIVE_RESULT_CACHE_URL = os.environ.get('ADAPTIVE_RESULT_CACHE_URL', 'redis://localhost:6379/0')
+    ADAPTIVE_RESULT_CACHE_SIZE = 4096     # entries per process, 'memory' only
+    ADAPTIVE_RESULT_CACHE_TTL = 600       # seconds; 0 disables the cache
+    
+    # Raw emotional events and hourly rollups are deleted after these many
+    # days by compact_emotional_history.py; daily rollups are kept
+    EMOTIONAL_EVENT_RETENTION_DAYS = 30
+    EMOTIONAL_HOURLY_RETENTION_DAYS = 90
+    
+    # Journal entries per GET /api/journal/entries page, by default and at most
+    JOURNAL_PAGE_SIZE = 20
+    JOURNAL_MAX_PAGE_SIZE = 100
+    
+    # Entries fetched and decrypted at a time by GET /api/journal/export
+    JOURNAL_EXPORT_CHUNK_SIZE = 500
+    
+    # Longest range GET /api/journal/moods/timeseries serves, in days
+    JOURNAL_MAX_TIMESERIES_DAYS = 3660
+    
+    # Chatbot
+    CHATBOT_MAX_BATCH_SIZE = 50  # queries per /chatbot/responses request
+    
+    # Latency budget for urgent queries, from request to crisis response
+    CHATBOT_URGENT_P99_BUDGET_MS = 5
+    
+    # Cached answers, keyed by normalized query and language
+    CHATBOT_RESPONSE_CACHE_SIZE = 1024    # entries; 0 disables the cache
+    CHATBOT_RESPONSE_CACHE_TTL = 3600     # seconds
+    
+    # Interaction persistence: 'sync' commits before responding,
+    # 'write_behind' queues rows for a background writer thread
+    CHATBOT_PERSISTENCE_MODE = os.environ.get('CHATBOT_PERSISTENCE_MODE', 'sync')
+    CHATBOT_WRITE_QUEUE_SIZE = 10000      # rows held before backpressure
+    CHATBOT_WRITE_BATCH_SIZE = 200        # rows per batched insert
+    CHATBOT_WRITE_FLUSH_INTERVAL = 0.5    # seconds to wait for a batch to fill
+    CHATBOT_WRITE_QUEUE_TIMEOUT = 1.0     # seconds to wait on a full queue before writing inline
 
 class DevelopmentConfig(Config):
     DEBUG = True
@@ -1,7 +1,7 @@
 # backend/create_db.py
 
-from app import create_app
-from extensions import db
+from backend.app import create_app
+from backend.extensions import db
 
 # Create an application context
 app = create_app()
@@ -0,0 +1,47 @@
+# backend/migrate_db.py
+
+from backend.app import create_app
+from backend.extensions import db
+from backend.ai_backend.models.migrations import migrate_hot_indexes
+from backend.ai_backend.adaptive_learning.progress_aggregates import check_progress_summaries
+from backend.ai_backend.adaptive_learning.module_stats import backfill_module_stats
+from backend.ai_backend.adaptive_learning.sentiment_counts import backfill_sentiment_counts
+from backend.ai_backend.journal.mood_counts import backfill_mood_counts
+from backend.ai_backend.journal.search_index import backfill_search_index
+from backend.ai_backend.journal.routes import encryptor
+
+def migrate_database():
+    """Bring a database created by an older version up to date with the models"""
+    # Tables added since the database was created; the steps below use them
+    db.create_all()
+
+    result = migrate_hot_indexes()
+    if result['merged_users']:
+        print(f"Merged duplicate progress rows for {len(result['merged_users'])} users.")
+        # Merging changes totals, so bring the summaries back in line
+        check_progress_summaries(repair=True)
+    if result['created_indexes']:
+        print(f"Created indexes: {', '.join(result['created_indexes'])}")
+    else:
+        print("All indexes are already up to date.")
+
+    backfilled = backfill_module_stats()
+    if backfilled:
+        print(f"Seeded module statistics from {backfilled} stored quiz results.")
+
+    backfilled = backfill_sentiment_counts()
+    if backfilled:
+        print(f"Counted sentiments of {backfilled} recent interactions.")
+
+    backfilled = backfill_mood_counts()
+    if backfilled:
+        print(f"Counted moods of {backfilled} journal entries.")
+
+    indexed = backfill_search_index(encryptor)
+    if indexed:
+        print(f"Indexed {indexed} journal entries for search.")
+
+if __name__ == '__main__':
+    app = create_app()
+    with app.app_context():
+        migrate_database()
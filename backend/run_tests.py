@@ -1,7 +1,7 @@
 # backend/run_tests.py
 
 import unittest
-from tests.test_integration import IntegrationTests
+from backend.tests.test_integration import IntegrationTests
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
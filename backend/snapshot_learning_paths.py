@@ -0,0 +1,24 @@
+# backend/snapshot_learning_paths.py
+
+import argparse
+from datetime import datetime
+
+from backend.app import create_app
+from backend.ai_backend.adaptive_learning.path_snapshot import snapshot_learning_paths
+
+# Run before the weekly teacher reports, e.g. from cron
+parser = argparse.ArgumentParser(description="Compute every user's learning path and recommendations into a snapshot")
+parser.add_argument('--snapshot', default=datetime.utcnow().strftime('%Y-%m-%d'),
+                    help="snapshot ID, today's UTC date by default; an existing snapshot with this ID is replaced")
+parser.add_argument('--workers', type=int, default=None, help='worker processes, one per CPU by default')
+parser.add_argument('--chunk-users', type=int, default=500, help='users sent to a worker at a time')
+args = parser.parse_args()
+
+app = create_app()
+with app.app_context():
+    stats = snapshot_learning_paths(args.snapshot, workers=args.workers, chunk_users=args.chunk_users)
+    print(
+        f"Snapshot {stats['snapshot_id']}: {stats['users']} users and {stats['progress_rows']} progress rows "
+        f"in {stats['seconds']:.2f}s with {stats['workers']} workers "
+        f"({stats['users_per_second']:.0f} users/s, {stats['rows_per_second']:.0f} rows/s)."
+    )
@@ -0,0 +1,125 @@
+# backend/tests/test_activity_batch.py
+
+import unittest
+from datetime import datetime
+from unittest import mock
+from flask import Flask
+from backend.config import TestingConfig
+from backend.extensions import db
+from backend.ai_backend.models.user import User
+from backend.ai_backend.models.progress import Progress
+from backend.ai_backend.models.progress_summary import ProgressSummary
+from backend.ai_backend.adaptive_learning import progress_aggregates
+from backend.ai_backend.adaptive_learning.progress_aggregates import check_progress_summaries, rebuild_progress_summaries
+from backend.ai_backend.adaptive_learning.routes import adaptive_learning_bp
+
+class TestActivityBatch(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.config.from_object(TestingConfig)
+        db.init_app(self.app)
+        self.app.register_blueprint(adaptive_learning_bp, url_prefix='/adaptive')
+        self.client = self.app.test_client()
+        self.context = self.app.app_context()
+        self.context.push()
+        db.create_all()
+        db.session.add_all([User(id=1, username='learner', age=12), User(id=2, username='other', age=12)])
+        # An existing row without a quiz, one with a quiz, and a completed one
+        db.session.add_all([
+            Progress(user_id=1, module_id='started', completion_percentage=40.0, time_spent=60,
+                     last_activity=datetime(2024, 1, 1)),
+            Progress(user_id=1, module_id='quizzed', completion_percentage=30.0, time_spent=60,
+                     quiz_score=30.0, last_activity=datetime(2024, 1, 1)),
+            Progress(user_id=1, module_id='done', completion_percentage=100.0, time_spent=900,
+                     last_activity=datetime(2024, 1, 1))
+        ])
+        db.session.flush()
+        rebuild_progress_summaries([1])
+        db.session.commit()
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.context.pop()
+
+    def post(self, events):
+        response = self.client.post('/adaptive/track-activity/batch', json={'events': events})
+        self.assertEqual(response.status_code, 200)
+        return response.get_json()
+
+    def progress(self, user_id, module_id):
+        row = Progress.query.filter_by(user_id=user_id, module_id=module_id).one()
+        db.session.refresh(row)
+        return (row.time_spent, row.completion_percentage)
+
+    def test_coalesce_and_upsert(self):
+        """Test events are summed per key and applied to new and existing rows"""
+        result = self.post([
+            {'user_id': 1, 'module_id': 'new', 'time_spent': 100},
+            {'user_id': 1, 'module_id': 'new', 'time_spent': 200},
+            {'user_id': 1, 'module_id': 'started', 'time_spent': 30},
+            {'user_id': 1, 'module_id': 'started', 'time_spent': 210},
+            {'user_id': 1, 'module_id': 'quizzed', 'time_spent': 600},
+            {'user_id': 1, 'module_id': 'done', 'time_spent': 10},
+            {'user_id': 2, 'module_id': 'long', 'time_spent': 5000}
+        ])
+        self.assertEqual(result['events'], 7)
+        self.assertEqual(result['updated'], 5)
+        self.assertEqual(result['unknown_users'], [])
+
+        # Completion grows with time up to 100% unless a quiz was taken
+        self.assertEqual(self.progress(1, 'new'), (300, 50.0))
+        self.assertEqual(self.progress(1, 'started'), (300, 50.0))
+        self.assertEqual(self.progress(1, 'quizzed'), (660, 30.0))
+        self.assertEqual(self.progress(1, 'done'), (910, 100.0))
+        self.assertEqual(self.progress(2, 'long'), (5000, 100.0))
+
+        returned = {(p['user_id'], p['module_id']): (p['time_spent_total'], p['completion_percentage'])
+                    for p in result['progress']}
+        self.assertEqual(returned[(1, 'started')], (300, 50.0))
+
+    def test_time_below_earlier_completion_keeps_it(self):
+        """Test time-based completion never lowers an existing percentage"""
+        self.post([{'user_id': 1, 'module_id': 'started', 'time_spent': 6}])
+        self.assertEqual(self.progress(1, 'started'), (66, 40.0))
+
+    def test_summaries_take_deltas(self):
+        """Test existing summaries are updated incrementally and missing ones built"""
+        with mock.patch.object(progress_aggregates, 'rebuild_progress_summaries',
+                               wraps=progress_aggregates.rebuild_progress_summaries) as rebuild:
+            self.post([
+                {'user_id': 1, 'module_id': 'new', 'time_spent': 600},
+                {'user_id': 1, 'module_id': 'started', 'time_spent': 240},
+                {'user_id': 2, 'module_id': 'first', 'time_spent': 60}
+            ])
+        rebuild.assert_called_once_with([2])
+
+        summary = db.session.get(ProgressSummary, 1)
+        db.session.refresh(summary)
+        # Modules new (100%), started (50%), quizzed (30%) and done (100%)
+        self.assertEqual((summary.total_modules, summary.completed_modules,
+                          summary.total_time_spent, summary.completion_sum), (4, 2, 1860, 280.0))
+        self.assertEqual(check_progress_summaries(), [])
+
+        self.post([{'user_id': 2, 'module_id': 'first', 'time_spent': 600}])
+        self.assertEqual(check_progress_summaries(), [])
+
+    def test_unknown_users_reported(self):
+        """Test events for users that do not exist are skipped and listed"""
+        result = self.post([
+            {'user_id': 99, 'module_id': 'm', 'time_spent': 30},
+            {'user_id': 1, 'module_id': 'm', 'time_spent': 30},
+            {'user_id': 42, 'module_id': 'm', 'time_spent': 30}
+        ])
+        self.assertEqual(result['unknown_users'], [42, 99])
+        self.assertEqual(result['updated'], 1)
+        self.assertEqual(Progress.query.filter(Progress.user_id.in_([42, 99])).count(), 0)
+
+    def test_invalid_events(self):
+        """Test malformed and negative events are rejected"""
+        for events in ([{'user_id': 1, 'module_id': 'm'}], [{'user_id': 1, 'module_id': 'm', 'time_spent': -5}]):
+            response = self.client.post('/adaptive/track-activity/batch', json={'events': events})
+            self.assertEqual(response.status_code, 400)
+
+if __name__ == '__main__':
+    unittest.main()
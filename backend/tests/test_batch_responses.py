@@ -0,0 +1,91 @@
+# backend/tests/test_batch_responses.py
+
+import unittest
+from flask import Flask
+from backend.config import TestingConfig
+from backend.extensions import db
+from backend.ai_backend.models.user import User
+from backend.ai_backend.models.interaction import Interaction
+from backend.ai_backend.chatbot import engine
+from backend.ai_backend.chatbot.persistence import interaction_writer
+
+QUERIES = [
+    "What are personal boundaries?",
+    "¿Qué son los límites personales?",
+    "How do I report abuse?",
+    "Hello there",
+    "This is an emergency, I need help",
+    "What are personal boundaries?",
+]
+
+class TestBatchResponses(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.config.from_object(TestingConfig)
+        self.app.config['CHATBOT_MAX_BATCH_SIZE'] = len(QUERIES)
+        db.init_app(self.app)
+        interaction_writer.init_app(self.app)
+        self.app.register_blueprint(engine.chatbot_bp, url_prefix='/chatbot')
+        self.client = self.app.test_client()
+        with self.app.app_context():
+            db.create_all()
+            db.session.add(User(id=1, username='learner', age=12))
+            db.session.commit()
+
+    def tearDown(self):
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+
+    def post(self, path, body):
+        # Closing the response runs any deferred write, as a server would
+        with self.client.post(path, json=body) as response:
+            return response.status_code, response.get_json()
+
+    def interaction_count(self):
+        with self.app.app_context():
+            return db.session.query(Interaction).count()
+
+    def test_invalid_requests(self):
+        """Test missing keys, wrong types and oversized batches are rejected"""
+        for body in (
+            {'user_id': 1},
+            {'queries': ["Hello"]},
+            {'queries': "Hello", 'user_id': 1},
+            {'queries': ["Hello", 42], 'user_id': 1},
+            {'queries': ["Hello"] * (len(QUERIES) + 1), 'user_id': 1},
+        ):
+            status, _ = self.post('/chatbot/responses', body)
+            self.assertEqual(status, 400, body)
+        self.assertEqual(self.interaction_count(), 0)
+
+    def test_unknown_user(self):
+        """Test a batch for a user that does not exist is a 404"""
+        status, _ = self.post('/chatbot/responses', {'queries': ["Hello"], 'user_id': 99})
+        self.assertEqual(status, 404)
+        self.assertEqual(self.interaction_count(), 0)
+
+    def test_answers_in_order_match_single_calls(self):
+        """Test every answer matches the single /response call for its query, in order"""
+        status, data = self.post('/chatbot/responses', {'queries': QUERIES, 'user_id': 1})
+        self.assertEqual(status, 200)
+        self.assertEqual(len(data['responses']), len(QUERIES))
+        self.assertEqual(self.interaction_count(), len(QUERIES))
+
+        for query, batched in zip(QUERIES, data['responses']):
+            status, single = self.post('/chatbot/response', {'query': query, 'user_id': 1})
+            self.assertEqual(status, 200)
+            self.assertEqual(batched, single, query)
+        self.assertEqual(data['responses'][0], data['responses'][5])
+        self.assertEqual(data['responses'][4]['sentiment'], 'urgent')
+
+    def test_one_interaction_per_query(self):
+        """Test each query in the batch is stored once, in order, for the user"""
+        self.post('/chatbot/responses', {'queries': QUERIES, 'user_id': 1})
+        with self.app.app_context():
+            stored = db.session.query(Interaction).order_by(Interaction.id).all()
+            self.assertEqual([row.query for row in stored], QUERIES)
+            self.assertTrue(all(row.user_id == 1 for row in stored))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+# backend/tests/test_counters.py
+
+import unittest
+from datetime import datetime
+from unittest import mock
+from flask import Flask
+from backend.config import TestingConfig
+from backend.extensions import db
+from backend.ai_backend.models import upsert
+from backend.ai_backend.models.user import User
+from backend.ai_backend.models.sentiment_daily_count import SentimentDailyCount
+from backend.ai_backend.adaptive_learning.sentiment_counts import record_sentiment_counts
+from backend.ai_backend.adaptive_learning.result_cache import bump_data_versions, data_version
+
+class TestCounterUpserts(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.config.from_object(TestingConfig)
+        db.init_app(self.app)
+        self.context = self.app.app_context()
+        self.context.push()
+        db.create_all()
+        db.session.add_all([User(id=1, username='learner', age=12), User(id=2, username='other', age=12)])
+        db.session.commit()
+    
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.context.pop()
+    
+    def write_twice(self):
+        timestamp = datetime(2024, 3, 1, 12)
+        for sentiments in (['neutral', 'urgent'], ['neutral', 'concerned']):
+            record_sentiment_counts([
+                {'user_id': user_id, 'timestamp': timestamp, 'sentiment': sentiment}
+                for user_id in (1, 2) for sentiment in sentiments
+            ])
+            bump_data_versions([1, 2])
+        db.session.commit()
+        
+        counts = {
+            row.user_id: (row.neutral, row.concerned, row.urgent)
+            for row in SentimentDailyCount.query.all()
+        }
+        return counts, [data_version(1), data_version(2)]
+    
+    def test_counters_with_upserts(self):
+        """Test counters are created and then incremented with ON CONFLICT"""
+        counts, versions = self.write_twice()
+        self.assertEqual(counts, {1: (2, 1, 1), 2: (2, 1, 1)})
+        self.assertEqual(versions, [2, 2])
+    
+    def test_counters_without_upserts(self):
+        """Test databases without ON CONFLICT fall back to update-then-insert"""
+        with mock.patch.object(upsert, 'upserts_supported', return_value=False):
+            counts, versions = self.write_twice()
+        self.assertEqual(counts, {1: (2, 1, 1), 2: (2, 1, 1)})
+        self.assertEqual(versions, [2, 2])
+
+if __name__ == '__main__':
+    unittest.main()
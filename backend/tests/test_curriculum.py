@@ -0,0 +1,56 @@
+# backend/tests/test_curriculum.py
+
+import unittest
+from types import SimpleNamespace
+from backend.ai_backend.adaptive_learning.curriculum import Curriculum, load_curriculum
+
+MODULES = [
+    {'id': 'advanced', 'requires': ['boundaries', 'adults'], 'min_age': 12, 'languages': ['en']},
+    {'id': 'body', 'requires': [], 'languages': ['en', 'es']},
+    {'id': 'boundaries', 'requires': ['body'], 'languages': ['en', 'es']},
+    {'id': 'adults', 'requires': ['body'], 'languages': ['en', 'es']},
+    {'id': 'review', 'requires': ['advanced'], 'languages': ['en', 'es']},
+]
+
+class TestCurriculum(unittest.TestCase):
+    def setUp(self):
+        # Same rule as AccessControl.is_age_appropriate
+        self.curriculum = Curriculum(MODULES, age_check=lambda user, min_age: bool(user.age) and user.age >= min_age)
+
+    def test_topological_order(self):
+        """Test every module comes after its prerequisites"""
+        order = [module.id for module in self.curriculum.modules]
+        self.assertEqual(order, ['body', 'boundaries', 'adults', 'advanced', 'review'])
+
+    def test_frontier(self):
+        """Test next modules are those whose prerequisites are all completed"""
+        self.assertEqual(self.curriculum.next_modules([]), ['body'])
+        self.assertEqual(self.curriculum.next_modules(['body']), ['boundaries', 'adults'])
+        self.assertEqual(self.curriculum.next_modules(['body', 'boundaries']), ['adults'])
+        self.assertEqual(self.curriculum.next_after('adults', ['body', 'boundaries']), 'advanced')
+
+    def test_age_and_language_filter(self):
+        """Test unsuitable modules and everything after them are left out"""
+        child = SimpleNamespace(age=9)
+        teen = SimpleNamespace(age=13)
+        done = ['body', 'boundaries', 'adults']
+        self.assertEqual(self.curriculum.next_modules(done, user=child), [])
+        self.assertEqual(self.curriculum.learning_path(['body'], user=child), ['boundaries', 'adults'])
+        self.assertEqual(self.curriculum.learning_path(done, user=teen), ['advanced', 'review'])
+        self.assertEqual(self.curriculum.learning_path(done, user=teen, language='es'), [])
+
+    def test_invalid_graphs(self):
+        """Test unknown prerequisites and cycles are rejected"""
+        with self.assertRaises(ValueError):
+            Curriculum([{'id': 'a', 'requires': ['missing']}])
+        with self.assertRaises(ValueError):
+            Curriculum([{'id': 'a', 'requires': ['b']}, {'id': 'b', 'requires': ['a']}])
+
+    def test_shipped_curriculum_loads(self):
+        """Test the bundled curriculum file is a valid DAG"""
+        curriculum = load_curriculum()
+        self.assertIn('module_1', curriculum)
+        self.assertEqual(curriculum.next_modules([]), ['module_1'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+# backend/tests/test_emotional_history.py
+
+import unittest
+from datetime import datetime, timedelta
+from flask import Flask
+from backend.config import TestingConfig
+from backend.extensions import db
+from backend.ai_backend.models.user import User
+from backend.ai_backend.models.emotional_event import EmotionalEvent
+from backend.ai_backend.adaptive_learning.emotional_history import (
+    STATE_CODES, emotional_history, record_emotional_event, state_code, state_name
+)
+
+class TestEmotionalHistory(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.config.from_object(TestingConfig)
+        db.init_app(self.app)
+        self.context = self.app.app_context()
+        self.context.push()
+        db.create_all()
+        db.session.add(User(id=1, username='learner', age=12))
+        db.session.commit()
+    
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.context.pop()
+    
+    def test_client_state_names(self):
+        """Test the mood selector's states map to their own codes, not 'other'"""
+        self.assertEqual(state_name("😊 Happy"), 'happy')
+        self.assertEqual(state_code("😊 Happy"), STATE_CODES['happy'])
+        self.assertEqual(state_code("😨 Scared"), STATE_CODES['scared'])
+        self.assertEqual(state_code("  ANXIOUS!"), STATE_CODES['anxious'])
+        self.assertEqual(state_code("🙂"), 0)
+    
+    def test_unknown_states_are_kept(self):
+        """Test states outside EMOTIONAL_STATES get a stored code and appear in the history"""
+        now = datetime(2024, 3, 1, 12)
+        for minutes, state in enumerate(["😊 Happy", "🤩 Excited", "excited", "Proud"]):
+            record_emotional_event(1, 'safety_module_1', state, now + timedelta(minutes=minutes))
+        db.session.commit()
+        
+        self.assertEqual(len({event.state for event in EmotionalEvent.query.all()}), 3)
+        history = emotional_history(1, now, now + timedelta(days=1))
+        self.assertEqual(history[0]['counts'], {'happy': 1, 'excited': 2, 'proud': 1})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -48,6 +48,18 @@ class TestEncryption(unittest.TestCase):
         
         # Verify decryption returns the original text
         self.assertEqual(original_text, decrypted)
+    
+    def test_decrypt_many(self):
+        """Test bulk decryption keeps order and matches decrypt, inline and threaded"""
+        texts = [f"Entry number {i}" for i in range(100)]
+        encrypted = [self.encryptor.encrypt(text) for text in texts]
+        encrypted[7] = None
+        expected = [self.encryptor.decrypt(item) for item in encrypted]
+        
+        threaded = DataEncryption(self.encryptor.secret_key, max_workers=4)
+        self.assertEqual(threaded.decrypt_many(encrypted), expected)
+        self.assertEqual(threaded.decrypt_many(encrypted[:5]), expected[:5])
+        self.assertEqual(threaded.decrypt_many([]), [])
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
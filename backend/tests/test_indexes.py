@@ -0,0 +1,92 @@
+# backend/tests/test_indexes.py
+
+import unittest
+from datetime import datetime, timedelta
+from flask import Flask
+from sqlalchemy import inspect, select, tuple_
+from backend.extensions import db
+from backend.ai_backend.models.progress import Progress
+from backend.ai_backend.models.interaction import Interaction
+from backend.ai_backend.models.journal import JournalEntry
+from backend.ai_backend.models.user import User
+from backend.ai_backend.models.migrations import migrate_hot_indexes
+
+class TestHotIndexes(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
+        db.init_app(self.app)
+        self.context = self.app.app_context()
+        self.context.push()
+        db.create_all()
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.context.pop()
+
+    def query_plan(self, statement):
+        """SQLite's EXPLAIN QUERY PLAN for a statement, as one string"""
+        compiled = statement.compile(dialect=db.engine.dialect)
+        params = tuple(None for _ in compiled.positiontup)
+        rows = db.session.connection().exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}", params)
+        return ' '.join(row[-1] for row in rows)
+
+    def test_hot_queries_use_indexes(self):
+        """Test each hot lookup is answered from its index"""
+        week_ago = datetime.utcnow() - timedelta(days=7)
+        hot_queries = [
+            (select(Progress).filter_by(user_id=1, module_id='module_1'), 'idx_user_module'),
+            (select(Interaction).where(Interaction.user_id == 1, Interaction.timestamp >= week_ago),
+             'idx_interaction_user_time'),
+            (select(JournalEntry).filter_by(user_id=1).order_by(JournalEntry.entry_date.desc()),
+             'idx_journal_user_date'),
+            # Keyset page of GET /api/journal/entries
+            (select(JournalEntry).where(
+                JournalEntry.user_id == 1,
+                tuple_(JournalEntry.entry_date, JournalEntry.id) < (week_ago, 100)
+            ).order_by(JournalEntry.entry_date.desc(), JournalEntry.id.desc()).limit(21),
+             'idx_journal_user_date'),
+        ]
+        for statement, index_name in hot_queries:
+            plan = self.query_plan(statement)
+            self.assertIn(f"USING INDEX {index_name}", plan)
+            self.assertNotIn("TEMP B-TREE", plan)
+
+    def test_migration_merges_duplicates_and_adds_indexes(self):
+        """Test an old schema with duplicate progress rows is migrated"""
+        with db.engine.begin() as connection:
+            connection.exec_driver_sql("DROP INDEX idx_user_module")
+            connection.exec_driver_sql("DROP INDEX idx_interaction_user_time")
+            connection.exec_driver_sql("CREATE INDEX idx_user_module ON progress (user_id, module_id)")
+
+        now = datetime.utcnow()
+        db.session.add(User(id=1, username='learner', age=12))
+        db.session.add_all([
+            Progress(user_id=1, module_id='module_1', completion_percentage=40.0, time_spent=120,
+                     last_activity=now - timedelta(hours=2), quiz_score=55.0, quiz_time_taken=90),
+            Progress(user_id=1, module_id='module_1', completion_percentage=20.0, time_spent=60,
+                     last_activity=now, emotional_state='anxious'),
+            Progress(user_id=1, module_id='module_2', completion_percentage=10.0, time_spent=30,
+                     last_activity=now),
+        ])
+        db.session.commit()
+
+        result = migrate_hot_indexes()
+        self.assertEqual(result['merged_users'], [1])
+        self.assertEqual(sorted(result['created_indexes']), ['idx_interaction_user_time', 'idx_user_module'])
+
+        merged = Progress.query.filter_by(user_id=1, module_id='module_1').one()
+        self.assertEqual(merged.time_spent, 180)
+        self.assertEqual(merged.completion_percentage, 40.0)
+        self.assertEqual(merged.quiz_score, 55.0)
+        self.assertEqual(merged.emotional_state, 'anxious')
+
+        indexes = {index['name']: index for index in inspect(db.engine).get_indexes('progress')}
+        self.assertTrue(indexes['idx_user_module']['unique'])
+
+        # Running it again changes nothing
+        self.assertEqual(migrate_hot_indexes(), {'merged_users': [], 'created_indexes': []})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+# backend/tests/test_journal_export.py
+
+import json
+import tracemalloc
+import unittest
+from datetime import datetime, timedelta
+from flask import Flask
+from backend.extensions import db
+from backend.ai_backend.models.user import User
+from backend.ai_backend.models.journal import JournalEntry
+from backend.ai_backend.journal.export import export_lines
+from backend.ai_backend.security.data_encryption import DataEncryption
+
+ENTRY_COUNT = 100000
+SENSITIVE_EVERY = 50
+
+class TestJournalExport(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
+        db.init_app(self.app)
+        self.context = self.app.app_context()
+        self.context.push()
+        db.create_all()
+        self.encryptor = DataEncryption('test-secret')
+        
+        secret = self.encryptor.encrypt("a private entry")
+        start = datetime(2024, 1, 1)
+        db.session.add(User(id=1, username='writer', age=14))
+        db.session.execute(db.insert(JournalEntry), [
+            {
+                'user_id': 1,
+                'entry_date': start + timedelta(minutes=n),
+                'mood': 'calm',
+                'content': '' if n % SENSITIVE_EVERY == 0 else f"entry {n} about my day at school",
+                'is_sensitive': n % SENSITIVE_EVERY == 0,
+                'encrypted_content': secret if n % SENSITIVE_EVERY == 0 else None
+            }
+            for n in range(ENTRY_COUNT)
+        ])
+        db.session.commit()
+        db.session.expunge_all()
+    
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.context.pop()
+    
+    def test_export_memory_stays_flat(self):
+        """Test streaming 100k entries does not grow memory with the entry count"""
+        exported = 0
+        checkpoints = []
+        tracemalloc.start()
+        try:
+            for chunk in export_lines(1, self.encryptor, chunk_size=500):
+                lines = chunk.splitlines()
+                if exported == 0:
+                    first = json.loads(lines[0])
+                exported += len(lines)
+                if exported % 10000 == 0:
+                    checkpoints.append(tracemalloc.get_traced_memory()[0])
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        
+        self.assertEqual(exported, ENTRY_COUNT)
+        self.assertEqual(first['content'], "a private entry")
+        
+        # Memory after 100k entries is no higher than after 10k, and the peak
+        # is a few chunks' worth, far below the size of the whole export
+        self.assertLess(checkpoints[-1] - checkpoints[0], 256 * 1024)
+        self.assertLess(peak, 8 * 1024 * 1024)
+
+if __name__ == '__main__':
+    unittest.main()
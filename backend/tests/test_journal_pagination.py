@@ -0,0 +1,134 @@
+# backend/tests/test_journal_pagination.py
+
+import base64
+import unittest
+from datetime import datetime, timedelta
+from unittest import mock
+from flask import Flask
+from sqlalchemy import event
+from backend.config import TestingConfig
+from backend.extensions import db
+from backend.ai_backend.models.user import User
+from backend.ai_backend.models.journal import JournalEntry
+from backend.ai_backend.journal import routes
+from backend.ai_backend.security.access_control import AccessControl
+
+ENTRY_COUNT = 45
+
+class TestJournalPagination(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.config.from_object(TestingConfig)
+        db.init_app(self.app)
+        self.app.register_blueprint(routes.journal_bp, url_prefix='/api/journal')
+        self.client = self.app.test_client()
+        self.context = self.app.app_context()
+        self.context.push()
+        db.create_all()
+
+        # Every token belongs to user 1
+        patch = mock.patch.object(AccessControl, 'decode_token', return_value={'sub': 1})
+        patch.start()
+        self.addCleanup(patch.stop)
+
+        db.session.add_all([User(id=1, username='writer', age=14), User(id=2, username='other', age=14)])
+        # Five entries share each date, so pages often split a date
+        start = datetime(2024, 1, 1)
+        secret = routes.encryptor.encrypt("a private entry")
+        for n in range(ENTRY_COUNT):
+            sensitive = n % 4 == 0
+            db.session.add(JournalEntry(
+                user_id=1,
+                entry_date=start + timedelta(days=n // 5),
+                mood='calm',
+                content='' if sensitive else f"entry {n}",
+                is_sensitive=sensitive,
+                encrypted_content=secret if sensitive else None
+            ))
+        db.session.add(JournalEntry(user_id=2, entry_date=start, content="not mine"))
+        db.session.commit()
+        self.expected = [
+            entry.id for entry in JournalEntry.query.filter_by(user_id=1).order_by(
+                JournalEntry.entry_date.desc(), JournalEntry.id.desc()
+            )
+        ]
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.context.pop()
+
+    def get(self, **params):
+        return self.client.get('/api/journal/entries', query_string=params,
+                               headers={'Authorization': 'Bearer test'})
+
+    def test_walk_pages(self):
+        """Test following X-Next-Cursor visits every entry once, newest first, across shared dates"""
+        seen = []
+        pages = 0
+        params = {'limit': 7}
+        while True:
+            response = self.get(**params)
+            self.assertEqual(response.status_code, 200)
+            seen += [entry['id'] for entry in response.get_json()]
+            pages += 1
+            cursor = response.headers.get('X-Next-Cursor')
+            if cursor is None:
+                break
+            params['cursor'] = cursor
+
+        self.assertEqual(seen, self.expected)
+        self.assertEqual(pages, -(-ENTRY_COUNT // 7))
+
+    def test_default_page_size(self):
+        """Test a request without limit returns JOURNAL_PAGE_SIZE entries and a cursor"""
+        response = self.get()
+        self.assertEqual([entry['id'] for entry in response.get_json()], self.expected[:20])
+        self.assertIn('X-Next-Cursor', response.headers)
+
+        # An exactly full last page has no next cursor
+        response = self.get(limit=ENTRY_COUNT)
+        self.assertEqual(len(response.get_json()), ENTRY_COUNT)
+        self.assertNotIn('X-Next-Cursor', response.headers)
+
+    def test_malformed_cursor(self):
+        """Test cursors that do not decode to a date and an id are rejected"""
+        for cursor in ('not base64!', base64.urlsafe_b64encode(b'2024-01-01').decode(),
+                       base64.urlsafe_b64encode(b'yesterday|3').decode(),
+                       base64.urlsafe_b64encode(b'2024-01-01T00:00:00|x').decode(),
+                       base64.urlsafe_b64encode(b'\xff\xfe').decode()):
+            self.assertEqual(self.get(cursor=cursor).status_code, 400, cursor)
+
+    def test_limit_clamped(self):
+        """Test limit is capped at JOURNAL_MAX_PAGE_SIZE and must be positive"""
+        self.app.config['JOURNAL_MAX_PAGE_SIZE'] = 10
+        response = self.get(limit=1000)
+        self.assertEqual(len(response.get_json()), 10)
+        self.assertIn('X-Next-Cursor', response.headers)
+        for limit in (0, -5):
+            self.assertEqual(self.get(limit=limit).status_code, 400)
+
+    def test_headers_only_skips_content(self):
+        """Test headers_only neither selects nor decrypts any content"""
+        statements = []
+        listener = lambda conn, cursor, statement, *args: statements.append(statement)
+        event.listen(db.engine, 'before_cursor_execute', listener)
+        try:
+            with mock.patch.object(routes.encryptor, 'decrypt', side_effect=AssertionError), \
+                    mock.patch.object(routes.encryptor, 'decrypt_many', side_effect=AssertionError):
+                response = self.get(limit=ENTRY_COUNT, headers_only='true')
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', listener)
+
+        self.assertEqual(response.status_code, 200)
+        entries = response.get_json()
+        self.assertEqual([entry['id'] for entry in entries], self.expected)
+        self.assertEqual(set(entries[0]), {'id', 'date', 'mood'})
+        journal_selects = [s for s in statements if 'journal_entries' in s]
+        self.assertTrue(journal_selects)
+        for statement in journal_selects:
+            self.assertNotIn('encrypted_content', statement)
+            self.assertNotIn('journal_entries.content', statement)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+# backend/tests/test_journal_search.py
+
+import unittest
+from flask import Flask
+from sqlalchemy import text
+from backend.extensions import db
+from backend.ai_backend.models.user import User
+from backend.ai_backend.models.journal import JournalEntry
+from backend.ai_backend.models.journal_blind_index import JournalBlindIndex
+from backend.ai_backend.journal.search_index import index_entry, search_query, search_terms, unindex_entry
+from backend.ai_backend.security.data_encryption import DataEncryption
+
+class TestJournalSearch(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
+        db.init_app(self.app)
+        self.context = self.app.app_context()
+        self.context.push()
+        db.create_all()
+        self.encryptor = DataEncryption('test-secret')
+        db.session.add_all([User(id=1, username='learner', age=12), User(id=2, username='other', age=12)])
+    
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.context.pop()
+    
+    def add_entry(self, user_id, content, is_sensitive=False):
+        entry = JournalEntry(
+            user_id=user_id,
+            content='' if is_sensitive else content,
+            is_sensitive=is_sensitive,
+            encrypted_content=self.encryptor.encrypt(content) if is_sensitive else None
+        )
+        db.session.add(entry)
+        db.session.flush()
+        index_entry(entry, content, self.encryptor)
+        return entry.id
+    
+    def search(self, user_id, query):
+        return sorted(entry.id for entry in search_query(user_id, query, self.encryptor))
+    
+    def test_terms(self):
+        """Test terms are lowercase runs of letters and digits, without repeats"""
+        self.assertEqual(search_terms("Felt SAFE, felt_happy! 2day"), ['felt', 'safe', 'happy', '2day'])
+    
+    def test_plain_and_sensitive_entries_are_found(self):
+        """Test every term must match, in plain and blind-indexed entries, per user"""
+        plain = self.add_entry(1, "Walked home with my friend")
+        secret = self.add_entry(1, "My friend scared me", is_sensitive=True)
+        self.add_entry(2, "friend")
+        
+        self.assertEqual(self.search(1, "friend"), [plain, secret])
+        self.assertEqual(self.search(1, "Scared FRIEND"), [secret])
+        self.assertEqual(self.search(1, "friend home"), [plain])
+        self.assertEqual(self.search(1, "teacher"), [])
+        self.assertIsNone(search_query(1, " !? ", self.encryptor))
+        
+        # The blind index holds no plaintext
+        tokens = [row.token for row in JournalBlindIndex.query.filter_by(entry_id=secret)]
+        self.assertEqual(len(tokens), 4)
+        self.assertNotIn('scared', tokens)
+        
+        unindex_entry(secret)
+        self.assertEqual(self.search(1, "friend"), [plain])
+        self.assertEqual(db.session.execute(text("SELECT count(*) FROM journal_fts")).scalar(), 2)
+
+if __name__ == '__main__':
+    unittest.main()
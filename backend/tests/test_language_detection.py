@@ -0,0 +1,53 @@
+# backend/tests/test_language_detection.py
+
+import json
+import os
+import unittest
+from backend.ai_backend.chatbot.language_detection import NGramLanguageDetector
+from backend.ai_backend.chatbot.language_samples import LANGUAGE_SAMPLES
+from backend.ai_backend.chatbot.multilingual import detect_language, detect_languages
+
+CORPUS_FILE = os.path.join(os.path.dirname(__file__), 'data', 'language_corpus.json')
+
+def load_corpus():
+    """Load the labeled language detection corpus"""
+    with open(CORPUS_FILE, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+class TestLanguageDetection(unittest.TestCase):
+    def setUp(self):
+        self.corpus = load_corpus()
+    
+    def test_corpus_accuracy(self):
+        """Test detection accuracy over the labeled corpus"""
+        predictions = detect_languages([sample['text'] for sample in self.corpus])
+        correct = sum(1 for sample, predicted in zip(self.corpus, predictions) if predicted == sample['language'])
+        self.assertGreaterEqual(correct / len(self.corpus), 0.95)
+    
+    def test_batch_matches_single(self):
+        """Test batched detection returns the same results, in order"""
+        texts = [sample['text'] for sample in self.corpus] + [
+            '', 'a', "¿Qué?  ¡Sí!", "l'école\x00d'été", 'ÉTÉ ΣΟΦΟΣ', '中文　日本語', 'x' * 2000
+        ]
+        self.assertEqual(detect_languages(texts), [detect_language(text) for text in texts])
+
+    def test_single_path_from_cold_and_remembered(self):
+        """Test single texts match the batch on first sight, when tokens recur in new texts, and when remembered"""
+        detector = NGramLanguageDetector(LANGUAGE_SAMPLES)
+        texts = [sample['text'] for sample in self.corpus]
+        texts += [' '.join(reversed(text.split())) for text in texts]
+        expected = detector.detect_languages(texts)
+        self.assertEqual([detector.detect_language(text) for text in texts], expected)
+        self.assertEqual([detector.detect_language(text) for text in texts], expected)
+    
+    def test_english_words_containing_foreign_keywords(self):
+        """Test English text is not misdetected from substrings like 'wie' in 'view'"""
+        for text in ["How do I view my progress?", "The locomotive was fast", "The lake is shallow here"]:
+            self.assertEqual(detect_language(text), 'en', text)
+    
+    def test_text_without_letters(self):
+        """Test empty and non-alphabetic input defaults to English"""
+        self.assertEqual(detect_languages(['', '1234 ?!', 'hola']), ['en', 'en', 'es'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+# backend/tests/test_learning_rules.py
+
+import json
+import unittest
+from types import SimpleNamespace
+from backend.ai_backend.adaptive_learning.curriculum import Curriculum
+from backend.ai_backend.adaptive_learning.learning_rules import (
+    compute_learning_chunk, init_worker, learning_path, learning_recommendations
+)
+
+MODULES = [
+    {'id': 'body', 'requires': [], 'languages': ['en', 'es']},
+    {'id': 'boundaries', 'requires': ['body'], 'languages': ['en', 'es']},
+    {'id': 'adults', 'requires': ['body'], 'languages': ['en', 'es']},
+    {'id': 'advanced', 'requires': ['boundaries', 'adults'], 'min_age': 12, 'languages': ['en']},
+]
+
+class TestLearningRules(unittest.TestCase):
+    def setUp(self):
+        self.curriculum = Curriculum(MODULES, age_check=lambda user, min_age: bool(user.age) and user.age >= min_age)
+        init_worker(self.curriculum)
+    
+    def test_path_and_recommendations(self):
+        """Test the path and recommendations follow the progress and the curriculum"""
+        user = SimpleNamespace(age=13, language_preference='en')
+        progress = [
+            SimpleNamespace(module_id='body', completion_percentage=100.0, quiz_score=60.0),
+            SimpleNamespace(module_id='adults', completion_percentage=40.0, quiz_score=None),
+        ]
+        self.assertEqual(learning_path(progress, user, self.curriculum), ['adults', 'boundaries', 'advanced'])
+        self.assertEqual(
+            [(r['id'], r['reason']) for r in learning_recommendations(progress, user, self.curriculum)],
+            [('adults', 'continue_progress'), ('body', 'review_material'), ('boundaries', 'next_in_sequence')]
+        )
+        self.assertEqual(learning_recommendations([], user, self.curriculum)[0]['id'], 'body')
+    
+    def test_chunk_matches_per_user_rules(self):
+        """Test the snapshot worker gives the same results as the per-user functions"""
+        chunk = [
+            (1, 13, 'en', [('adults', 100.0, 90.0), ('body', 100.0, 90.0)]),
+            (2, None, 'es', []),
+        ]
+        results = compute_learning_chunk(chunk)
+        self.assertEqual([user_id for user_id, _, _ in results], [1, 2])
+        
+        user = SimpleNamespace(age=13, language_preference='en')
+        progress = [SimpleNamespace(module_id=m, completion_percentage=c, quiz_score=q) for m, c, q in chunk[0][3]]
+        self.assertEqual(json.loads(results[0][1]), learning_path(progress, user, self.curriculum))
+        self.assertEqual(json.loads(results[0][2]), learning_recommendations(progress, user, self.curriculum))
+        self.assertEqual(compute_learning_chunk(chunk), results)
+
+if __name__ == '__main__':
+    unittest.main()
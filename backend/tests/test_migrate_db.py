@@ -0,0 +1,104 @@
+# backend/tests/test_migrate_db.py
+
+import io
+import unittest
+from contextlib import redirect_stdout
+from datetime import datetime, timedelta
+from flask import Flask
+from sqlalchemy import inspect, text
+from backend.config import TestingConfig
+from backend.extensions import db
+from backend.ai_backend.models.progress import Progress
+from backend.ai_backend.models.progress_summary import ProgressSummary
+from backend.ai_backend.models.module_stats import ModuleStats
+from backend.ai_backend.models.sentiment_daily_count import SentimentDailyCount
+from backend.ai_backend.models.mood_daily_count import MoodDailyCount
+from backend.ai_backend.journal.search_index import search_query
+from backend.migrate_db import encryptor, migrate_database
+
+# Schema created by the first release, before any of the added tables and
+# with the old non-unique progress index
+BASELINE_SCHEMA = [
+    """CREATE TABLE users (
+        id INTEGER NOT NULL, username VARCHAR(80) NOT NULL, age INTEGER,
+        language_preference VARCHAR(10), created_at DATETIME, last_active DATETIME,
+        PRIMARY KEY (id), UNIQUE (username))""",
+    """CREATE TABLE interactions (
+        id INTEGER NOT NULL, user_id INTEGER NOT NULL, "query" TEXT NOT NULL, response TEXT NOT NULL,
+        timestamp DATETIME, query_type VARCHAR(50), sentiment VARCHAR(20),
+        PRIMARY KEY (id), FOREIGN KEY(user_id) REFERENCES users (id))""",
+    """CREATE TABLE progress (
+        id INTEGER NOT NULL, user_id INTEGER NOT NULL, module_id VARCHAR(50) NOT NULL,
+        completion_percentage FLOAT, time_spent INTEGER, last_activity DATETIME,
+        emotional_state VARCHAR(20), quiz_score FLOAT, quiz_time_taken INTEGER,
+        PRIMARY KEY (id), FOREIGN KEY(user_id) REFERENCES users (id))""",
+    "CREATE INDEX idx_user_module ON progress (user_id, module_id)",
+    """CREATE TABLE journal_entries (
+        id INTEGER NOT NULL, user_id INTEGER NOT NULL, entry_date DATETIME, mood VARCHAR(20),
+        content TEXT NOT NULL, is_sensitive BOOLEAN, encrypted_content TEXT,
+        PRIMARY KEY (id), FOREIGN KEY(user_id) REFERENCES users (id))""",
+]
+
+class TestMigrateDatabase(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.config.from_object(TestingConfig)
+        db.init_app(self.app)
+        self.context = self.app.app_context()
+        self.context.push()
+        
+        now = datetime.utcnow()
+        with db.engine.begin() as connection:
+            for statement in BASELINE_SCHEMA:
+                connection.exec_driver_sql(statement)
+            connection.execute(text("INSERT INTO users (id, username, age) VALUES (1, 'learner', 12)"))
+            connection.execute(text(
+                "INSERT INTO progress (user_id, module_id, completion_percentage, time_spent, last_activity, quiz_score) "
+                "VALUES (1, 'module_1', 40.0, 100, :early, NULL), (1, 'module_1', 100.0, 300, :late, 90.0), "
+                "(1, 'module_2', 50.0, 60, :late, NULL)"
+            ), {'early': now - timedelta(hours=2), 'late': now - timedelta(hours=1)})
+            connection.execute(text(
+                "INSERT INTO interactions (user_id, \"query\", response, timestamp, sentiment) "
+                "VALUES (1, 'Hello', 'Hi', :now, 'neutral'), (1, 'Help me', 'Call 911', :now, 'urgent')"
+            ), {'now': now})
+            connection.execute(text(
+                "INSERT INTO journal_entries (user_id, entry_date, mood, content, is_sensitive, encrypted_content) "
+                "VALUES (1, :now, 'happy', 'Walked home with my friend', 0, NULL), "
+                "(1, :now, 'sad', 'secret', 1, :encrypted)"
+            ), {'now': now, 'encrypted': encryptor.encrypt('Felt scared at the park')})
+    
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        with db.engine.begin() as connection:
+            connection.exec_driver_sql("DROP TABLE IF EXISTS journal_fts")
+        self.context.pop()
+    
+    def test_baseline_database_is_migrated(self):
+        """Test migrate_db brings a first-release database with duplicates up to date"""
+        with redirect_stdout(io.StringIO()):
+            migrate_database()
+        
+        self.assertTrue(set(db.metadata.tables) <= set(inspect(db.engine).get_table_names()))
+        
+        rows = Progress.query.filter_by(user_id=1).order_by(Progress.module_id).all()
+        self.assertEqual([(row.module_id, row.time_spent, row.quiz_score) for row in rows],
+                         [('module_1', 400, 90.0), ('module_2', 60, None)])
+        summary = db.session.get(ProgressSummary, 1)
+        self.assertEqual((summary.total_modules, summary.completed_modules, summary.total_time_spent),
+                         (2, 1, 460))
+        
+        self.assertEqual(db.session.get(ModuleStats, 'module_1').quiz_count, 1)
+        counts = SentimentDailyCount.query.one()
+        self.assertEqual((counts.neutral, counts.urgent), (1, 1))
+        self.assertEqual(sorted((row.mood, row.count) for row in MoodDailyCount.query), [('happy', 1), ('sad', 1)])
+        self.assertEqual(search_query(1, 'friend', encryptor).count(), 1)
+        self.assertEqual(search_query(1, 'scared', encryptor).count(), 1)
+        
+        # A second run has nothing left to do
+        with redirect_stdout(io.StringIO()) as output:
+            migrate_database()
+        self.assertEqual(output.getvalue().strip(), "All indexes are already up to date.")
+
+if __name__ == '__main__':
+    unittest.main()
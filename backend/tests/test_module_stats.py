@@ -0,0 +1,92 @@
+# backend/tests/test_module_stats.py
+
+import random
+import statistics
+import unittest
+from unittest import mock
+from flask import Flask
+from backend.config import TestingConfig
+from backend.extensions import db
+from backend.ai_backend.models.user import User
+from backend.ai_backend.models.progress import Progress
+from backend.ai_backend.adaptive_learning import module_stats
+from backend.ai_backend.adaptive_learning.module_stats import P2Quantile, _stddev, _welford, get_module_stats, record_quiz_stats
+
+class TestModuleStats(unittest.TestCase):
+    def test_p2_quantiles_track_exact_percentiles(self):
+        """Test P² estimates stay close to the exact quantiles of a skewed sample"""
+        rng = random.Random(7)
+        values = [rng.lognormvariate(4.5, 0.6) for _ in range(20000)]
+        exact = statistics.quantiles(values, n=10)
+        
+        for p, expected in ((0.1, exact[0]), (0.5, exact[4]), (0.9, exact[8])):
+            estimator = P2Quantile(p)
+            for value in values:
+                estimator.add(value)
+            self.assertAlmostEqual(estimator.value(), expected, delta=0.03 * expected)
+            self.assertEqual(len(estimator.heights), 5)
+    
+    def test_p2_small_samples_and_saved_state(self):
+        """Test the estimate before five values and after a save/restore round trip"""
+        estimator = P2Quantile(0.5)
+        self.assertIsNone(estimator.value())
+        for value in (30, 10, 20):
+            estimator.add(value)
+        self.assertEqual(estimator.value(), 20)
+        
+        for value in (40, 50, 60, 70):
+            estimator.add(value)
+        restored = P2Quantile(0.5, list(estimator.heights), list(estimator.positions))
+        for value in (80, 90):
+            estimator.add(value)
+            restored.add(value)
+        self.assertEqual(restored.value(), estimator.value())
+    
+    def test_welford_matches_batch_moments(self):
+        """Test the running mean and standard deviation match the batch ones"""
+        values = [95, 120, 64, 180, 142, 77, 133]
+        mean, m2 = 0.0, 0.0
+        for count, value in enumerate(values, start=1):
+            mean, m2 = _welford(count, mean, m2, value)
+        self.assertAlmostEqual(mean, statistics.mean(values))
+        self.assertAlmostEqual(_stddev(len(values), m2), statistics.stdev(values))
+
+class TestRecordQuizStats(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.config.from_object(TestingConfig)
+        db.init_app(self.app)
+        self.context = self.app.app_context()
+        self.context.push()
+        db.create_all()
+        db.session.add(User(id=1, username='learner', age=12))
+        db.session.commit()
+    
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.context.pop()
+    
+    def test_first_results_race(self):
+        """Test a stats row created by another request between lookup and insert is used, not a 500"""
+        record_quiz_stats('m1', 80.0, 100)
+        db.session.commit()
+        
+        # This request's lookup ran before the other request's row was committed
+        lookups = iter([None])
+        locked_stats = module_stats._locked_stats
+        with mock.patch.object(module_stats, '_locked_stats',
+                               side_effect=lambda module_id: next(lookups, None) or locked_stats(module_id)):
+            db.session.add(Progress(user_id=1, module_id='m1', quiz_score=60.0))
+            record_quiz_stats('m1', 60.0, 200)
+            db.session.commit()
+        
+        stats = get_module_stats('m1')
+        self.assertEqual(stats['quiz_count'], 2)
+        self.assertEqual(stats['score']['mean'], 70.0)
+        self.assertEqual(stats['time_taken']['count'], 2)
+        # The caller's own writes survive the failed insert
+        self.assertEqual(Progress.query.filter_by(user_id=1, module_id='m1').count(), 1)
+
+if __name__ == '__main__':
+    unittest.main()
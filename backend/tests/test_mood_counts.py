@@ -0,0 +1,155 @@
+# backend/tests/test_mood_counts.py
+
+import unittest
+from datetime import date, datetime, timedelta
+from unittest import mock
+from flask import Flask
+from backend.config import TestingConfig
+from backend.extensions import db
+from backend.ai_backend.models.user import User
+from backend.ai_backend.models.journal import JournalEntry
+from backend.ai_backend.models.mood_daily_count import MoodDailyCount
+from backend.ai_backend.journal import routes
+from backend.ai_backend.journal.mood_counts import backfill_mood_counts, mood_summary, mood_timeseries, record_mood_change
+from backend.ai_backend.security.access_control import AccessControl
+
+class TestMoodCounts(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.config.from_object(TestingConfig)
+        db.init_app(self.app)
+        self.app.register_blueprint(routes.journal_bp, url_prefix='/api/journal')
+        self.client = self.app.test_client()
+        self.context = self.app.app_context()
+        self.context.push()
+        db.create_all()
+
+        # Every token belongs to user 1
+        patch = mock.patch.object(AccessControl, 'decode_token', return_value={'sub': 1})
+        patch.start()
+        self.addCleanup(patch.stop)
+
+        db.session.add_all([User(id=1, username='writer', age=14), User(id=2, username='other', age=14)])
+        db.session.commit()
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.context.pop()
+
+    def request(self, method, path, **kwargs):
+        return self.client.open('/api/journal' + path, method=method,
+                                headers={'Authorization': 'Bearer test'}, **kwargs)
+
+    def counters(self, user_id=1):
+        return {
+            (row.day, row.mood): row.count
+            for row in MoodDailyCount.query.filter_by(user_id=user_id)
+            if row.count
+        }
+
+    def recount(self, user_id=1):
+        """Count the stored entries per day and mood the slow way"""
+        counts = {}
+        for entry in JournalEntry.query.filter_by(user_id=user_id):
+            if entry.mood:
+                key = (entry.entry_date.date(), entry.mood)
+                counts[key] = counts.get(key, 0) + 1
+        return counts
+
+    def test_counters_follow_entries(self):
+        """Test creating, re-mooding and deleting entries through the API keeps the counters exact"""
+        created = []
+        for mood in ('happy', 'happy', 'sad', None):
+            response = self.request('POST', '/entries', json={'content': 'today', 'mood': mood})
+            self.assertEqual(response.status_code, 201)
+            created.append(response.get_json()['entry_id'])
+        today = datetime.utcnow().date()
+        self.assertEqual(self.counters(), {(today, 'happy'): 2, (today, 'sad'): 1})
+
+        self.request('PUT', f'/entries/{created[0]}', json={'mood': 'calm'})
+        self.request('PUT', f'/entries/{created[1]}', json={'content': 'same mood'})
+        self.request('PUT', f'/entries/{created[3]}', json={'mood': 'sad'})
+        self.assertEqual(self.counters(), {(today, 'happy'): 1, (today, 'sad'): 2, (today, 'calm'): 1})
+
+        self.request('DELETE', f'/entries/{created[2]}')
+        self.request('DELETE', f'/entries/{created[0]}')
+        self.assertEqual(self.counters(), {(today, 'happy'): 1, (today, 'sad'): 1})
+        self.assertEqual(self.counters(), self.recount())
+
+    def test_backfill_matches_entries(self):
+        """Test backfilling counts every mood once and does not run twice"""
+        for day, mood in ((1, 'happy'), (1, 'happy'), (2, 'sad'), (2, None), (3, '')):
+            db.session.add(JournalEntry(user_id=1, entry_date=datetime(2024, 3, day, 12), mood=mood, content='x'))
+        db.session.commit()
+
+        self.assertEqual(backfill_mood_counts(), 3)
+        self.assertEqual(self.counters(), self.recount())
+        self.assertEqual(backfill_mood_counts(), 0)
+
+    def test_buckets_across_month_boundary(self):
+        """Test day, week and month buckets around the end of January"""
+        # 2024-01-29 is a Monday, so its week runs into February
+        for day, mood in ((date(2024, 1, 28), 'sad'), (date(2024, 1, 30), 'happy'),
+                          (date(2024, 1, 31), 'happy'), (date(2024, 2, 1), 'happy'),
+                          (date(2024, 2, 1), 'calm'), (date(2024, 2, 5), 'sad')):
+            record_mood_change(1, datetime.combine(day, datetime.min.time()), None, mood)
+        record_mood_change(2, datetime(2024, 1, 30), None, 'angry')
+        db.session.commit()
+
+        since = date(2024, 1, 1)
+        self.assertEqual(mood_timeseries(1, since, 'week'), [
+            {'start': '2024-01-22', 'counts': {'sad': 1}},
+            {'start': '2024-01-29', 'counts': {'calm': 1, 'happy': 3}},
+            {'start': '2024-02-05', 'counts': {'sad': 1}}
+        ])
+        self.assertEqual(mood_timeseries(1, since, 'month'), [
+            {'start': '2024-01-01', 'counts': {'happy': 2, 'sad': 1}},
+            {'start': '2024-02-01', 'counts': {'calm': 1, 'happy': 1, 'sad': 1}}
+        ])
+        days = mood_timeseries(1, date(2024, 1, 31), 'day')
+        self.assertEqual([bucket['start'] for bucket in days], ['2024-01-31', '2024-02-01', '2024-02-05'])
+
+        # A mood moved away leaves an empty bucket out
+        record_mood_change(1, datetime(2024, 2, 5), 'sad', None)
+        self.assertEqual(len(mood_timeseries(1, since, 'week')), 2)
+        with self.assertRaises(ValueError):
+            mood_timeseries(1, since, 'year')
+
+    def test_summary_matches_python_count(self):
+        """Test the SQL mood summary equals counting the user's entries in Python"""
+        for mood in ('happy', 'sad', 'happy', None, '', 'calm', 'happy'):
+            db.session.add(JournalEntry(user_id=1, mood=mood, content='x'))
+        db.session.add(JournalEntry(user_id=2, mood='sad', content='x'))
+        db.session.commit()
+
+        entries = JournalEntry.query.filter_by(user_id=1).all()
+        mood_counts = {}
+        for entry in entries:
+            if entry.mood:
+                mood_counts[entry.mood] = mood_counts.get(entry.mood, 0) + 1
+        expected = {'mood_summary': mood_counts, 'total_entries': len(entries)}
+
+        self.assertEqual(mood_summary(1), expected)
+        self.assertEqual(self.request('GET', '/moods').get_json(), expected)
+        self.assertEqual(mood_summary(3), {'mood_summary': {}, 'total_entries': 0})
+
+    def test_timeseries_validation(self):
+        """Test unknown resolutions and out-of-range or non-numeric days are rejected"""
+        self.app.config['JOURNAL_MAX_TIMESERIES_DAYS'] = 30
+        record_mood_change(1, datetime.utcnow(), None, 'happy')
+        db.session.commit()
+
+        response = self.request('GET', '/moods/timeseries', query_string={'resolution': 'week', 'days': 30})
+        self.assertEqual(response.status_code, 200)
+        data = response.get_json()
+        self.assertEqual(data['since'], (datetime.utcnow().date() - timedelta(days=29)).isoformat())
+        self.assertEqual(sum(sum(bucket['counts'].values()) for bucket in data['buckets']), 1)
+
+        for params in ({'resolution': 'year'}, {'resolution': ''}, {'days': 0}, {'days': -3},
+                       {'days': 31}, {'days': 'abc'}, {'days': '1.5'}):
+            response = self.request('GET', '/moods/timeseries', query_string={'days': 7, **params})
+            self.assertEqual(response.status_code, 400, params)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+# backend/tests/test_persistence.py
+
+import unittest
+from datetime import datetime
+from flask import Flask
+from backend.config import TestingConfig
+from backend.extensions import db
+from backend.ai_backend.models.user import User
+from backend.ai_backend.models.interaction import Interaction
+from backend.ai_backend.chatbot.persistence import InteractionWriter
+
+class TestInteractionWriter(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.config.from_object(TestingConfig)
+        db.init_app(self.app)
+        self.writer = InteractionWriter(self.app)
+        with self.app.app_context():
+            db.create_all()
+            db.session.add(User(id=1, username='learner', age=12))
+            db.session.commit()
+    
+    def tearDown(self):
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+    
+    def row(self, query, response='Answer'):
+        return {
+            'user_id': 1,
+            'query': query,
+            'response': response,
+            'query_type': 'general',
+            'sentiment': 'neutral',
+            'timestamp': datetime.utcnow()
+        }
+    
+    def test_bad_rows_do_not_drop_the_batch(self):
+        """Test a failed background batch is retried so only the bad rows are lost"""
+        rows = [self.row(f'query {i}') for i in range(10)]
+        rows[3]['response'] = None
+        rows[8]['response'] = None
+        
+        with self.assertLogs(self.app.logger, 'ERROR') as logs:
+            self.writer._write_in_context(self.app, rows)
+        
+        self.assertEqual(len([line for line in logs.output if 'Dropped interaction' in line]), 2)
+        with self.app.app_context():
+            stored = sorted(query for (query,) in db.session.query(Interaction.query))
+        self.assertEqual(stored, sorted(row['query'] for row in rows if row['response'] is not None))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+# backend/tests/test_progress_summary.py
+
+import unittest
+from datetime import datetime, timedelta
+from flask import Flask
+from backend.config import TestingConfig
+from backend.extensions import db
+from backend.ai_backend.models.user import User
+from backend.ai_backend.models.progress import Progress
+from backend.ai_backend.models.progress_summary import ProgressSummary
+from backend.ai_backend.adaptive_learning.progress_aggregates import (
+    check_progress_summaries, progress_values, record_progress_change
+)
+from backend.ai_backend.adaptive_learning.user_progress import UserProgressTracker
+
+class TestProgressSummaries(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.config.from_object(TestingConfig)
+        db.init_app(self.app)
+        self.context = self.app.app_context()
+        self.context.push()
+        db.create_all()
+        db.session.add_all([User(id=user_id, username=f'learner{user_id}', age=12) for user_id in (1, 2, 3)])
+        db.session.commit()
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.context.pop()
+
+    def summary(self, user_id):
+        summary = db.session.get(ProgressSummary, user_id)
+        db.session.refresh(summary)
+        return (summary.total_modules, summary.completed_modules, summary.total_time_spent, summary.completion_sum)
+
+    def write(self, user_id, module_id, completion, time_spent):
+        """Create or update a progress row the way the trackers do"""
+        progress = Progress.query.filter_by(user_id=user_id, module_id=module_id).first()
+        before = progress_values(progress) if progress else None
+        if progress is None:
+            progress = Progress(user_id=user_id, module_id=module_id)
+            db.session.add(progress)
+        progress.completion_percentage = completion
+        progress.time_spent = time_spent
+        record_progress_change(user_id, before, progress)
+        db.session.commit()
+
+    def test_record_progress_change_deltas(self):
+        """Test creates, updates and completion crossing 100% in either direction"""
+        self.write(1, 'm1', 40.0, 100)
+        self.assertEqual(self.summary(1), (1, 0, 100, 40.0))
+
+        self.write(1, 'm2', 100.0, 300)
+        self.assertEqual(self.summary(1), (2, 1, 400, 140.0))
+
+        self.write(1, 'm1', 70.0, 250)
+        self.assertEqual(self.summary(1), (2, 1, 550, 170.0))
+
+        self.write(1, 'm1', 100.0, 400)
+        self.assertEqual(self.summary(1), (2, 2, 700, 200.0))
+
+        self.write(1, 'm2', 90.0, 300)
+        self.assertEqual(self.summary(1), (2, 1, 700, 190.0))
+        self.assertEqual(check_progress_summaries(), [])
+
+    def test_check_and_repair(self):
+        """Test wrong, missing and orphaned summaries are reported and only rebuilt on repair"""
+        self.write(1, 'm1', 100.0, 100)
+        self.write(2, 'm1', 50.0, 60)
+
+        db.session.get(ProgressSummary, 1).total_time_spent = 999
+        db.session.delete(db.session.get(ProgressSummary, 2))
+        db.session.add(ProgressSummary(user_id=3, total_modules=4, completed_modules=1,
+                                       total_time_spent=10, completion_sum=120.0))
+        db.session.commit()
+
+        self.assertEqual(check_progress_summaries(), [1, 2, 3])
+        self.assertEqual(self.summary(1), (1, 1, 999, 100.0))
+        self.assertIsNone(db.session.get(ProgressSummary, 2))
+
+        self.assertEqual(check_progress_summaries(repair=True), [1, 2, 3])
+        self.assertEqual(self.summary(1), (1, 1, 100, 100.0))
+        self.assertEqual(self.summary(2), (1, 0, 60, 50.0))
+        self.assertEqual(self.summary(3), (0, 0, 0, 0.0))
+        self.assertEqual(check_progress_summaries(), [])
+
+    def test_aggregated_summary_lists_every_module(self):
+        """Test the default summary lists match the full one, and limits cut them"""
+        now = datetime.utcnow()
+        for index in range(12):
+            db.session.add(Progress(user_id=1, module_id=f'recent{index:02}', completion_percentage=10.0 * index,
+                                    time_spent=60, last_activity=now - timedelta(hours=index)))
+        for index in range(7):
+            db.session.add(Progress(user_id=1, module_id=f'stale{index}', completion_percentage=10.0 * index,
+                                    time_spent=60, last_activity=now - timedelta(days=10)))
+        db.session.commit()
+
+        tracker = UserProgressTracker(1)
+        full = tracker.get_progress_summary()
+        aggregated = tracker.get_aggregated_progress_summary()
+        self.assertEqual(len(aggregated['recent_modules']), 12)
+        self.assertEqual(len(aggregated['needs_attention']), 7)
+        for key in ('recent_modules', 'needs_attention'):
+            by_module = lambda modules: sorted(modules, key=lambda m: m['module_id'])
+            self.assertEqual(by_module(aggregated[key]), by_module(full[key]))
+
+        limited = tracker.get_aggregated_progress_summary(recent_limit=3, attention_limit=2)
+        self.assertEqual([m['module_id'] for m in limited['recent_modules']], ['recent00', 'recent01', 'recent02'])
+        self.assertEqual([m['module_id'] for m in limited['needs_attention']], ['stale0', 'stale1'])
+
+if __name__ == '__main__':
+    unittest.main()
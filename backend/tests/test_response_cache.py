@@ -0,0 +1,63 @@
+# backend/tests/test_response_cache.py
+
+import unittest
+from backend.ai_backend.chatbot.response_cache import ResponseCache, normalize_query
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+class TestResponseCache(unittest.TestCase):
+    def setUp(self):
+        self.version = 1
+        self.clock = FakeClock()
+        self.cache = ResponseCache(lambda key, value: self.version, maxsize=2, ttl=10, clock=self.clock)
+
+    def test_normalize_query(self):
+        """Test case and spacing differences normalize to the same key"""
+        self.assertEqual(normalize_query("  How do I\tREPORT  abuse? "), "how do i report abuse?")
+
+    def test_hit_and_miss_counters(self):
+        """Test repeated lookups are served from the cache"""
+        calls = []
+        compute = lambda: calls.append(1) or {'response': 'answer'}
+
+        self.cache.get_or_compute('q', compute)
+        self.cache.get_or_compute('q', compute)
+
+        self.assertEqual(len(calls), 1)
+        stats = self.cache.stats()
+        self.assertEqual((stats['hits'], stats['misses']), (1, 1))
+
+    def test_lru_eviction(self):
+        """Test the least recently used entry is evicted first"""
+        self.cache.put('a', 1)
+        self.cache.put('b', 2)
+        self.cache.get('a')
+        self.cache.put('c', 3)
+
+        self.assertIsNone(self.cache.get('b'))
+        self.assertEqual(self.cache.get('a'), 1)
+        self.assertEqual(self.cache.stats()['evictions'], 1)
+
+    def test_ttl_expiry(self):
+        """Test entries expire after the TTL"""
+        self.cache.put('a', 1)
+        self.clock.now = 10
+
+        self.assertIsNone(self.cache.get('a'))
+        self.assertEqual(self.cache.stats()['expirations'], 1)
+
+    def test_content_version_invalidation(self):
+        """Test entries are dropped once the content they came from changes"""
+        self.cache.put('a', 1)
+        self.version = 2
+
+        self.assertIsNone(self.cache.get('a'))
+        self.assertEqual(self.cache.stats()['invalidations'], 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+# backend/tests/test_result_cache.py
+
+import unittest
+from datetime import datetime
+from flask import Flask
+from backend.config import TestingConfig
+from backend.extensions import db
+from backend.ai_backend.models.user import User
+from backend.ai_backend.adaptive_learning.result_cache import LRUResultStore, ResultCache
+from backend.ai_backend.adaptive_learning.user_progress import UserProgressTracker
+from backend.ai_backend.chatbot.persistence import InteractionWriter
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self):
+        return self.now
+
+class TestResultCache(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.config.from_object(TestingConfig)
+        db.init_app(self.app)
+        self.context = self.app.app_context()
+        self.context.push()
+        db.create_all()
+        db.session.add(User(id=1, username='learner', age=12))
+        db.session.commit()
+        
+        self.clock = FakeClock()
+        self.cache = ResultCache(LRUResultStore(maxsize=2, clock=self.clock), ttl=60.0)
+    
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.context.pop()
+    
+    def recommendations(self):
+        return self.cache.get_or_compute(
+            'recommendations', 1, lambda: UserProgressTracker(1).get_learning_recommendations()
+        )
+    
+    def test_activity_invalidates(self):
+        """Test a tracked activity changes the key, so the stale result is not served"""
+        before = self.recommendations()
+        self.assertEqual(self.recommendations(), before)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+        
+        UserProgressTracker(1).track_activity('safety_module_1', 120)
+        after = self.recommendations()
+        self.assertEqual(self.cache.misses, 2)
+        self.assertNotEqual(after, before)
+        self.assertEqual(after, UserProgressTracker(1).get_learning_recommendations())
+    
+    def test_interaction_write_invalidates(self):
+        """Test a stored chatbot interaction changes the key"""
+        calls = []
+        compute = lambda: calls.append(1) or len(calls)
+        self.assertEqual(self.cache.get_or_compute('trend', 1, compute), 1)
+        self.assertEqual(self.cache.get_or_compute('trend', 1, compute), 1)
+        
+        InteractionWriter(self.app)._write([{
+            'user_id': 1, 'query': 'Hello', 'response': 'Hi', 'query_type': 'general',
+            'sentiment': 'neutral', 'timestamp': datetime.utcnow()
+        }])
+        self.assertEqual(self.cache.get_or_compute('trend', 1, compute), 2)
+    
+    def test_ttl_expiry(self):
+        """Test entries are recomputed once their TTL has passed"""
+        calls = []
+        compute = lambda: calls.append(1) or len(calls)
+        self.assertEqual(self.cache.get_or_compute('trend', 1, compute), 1)
+        self.clock.now = 59.0
+        self.assertEqual(self.cache.get_or_compute('trend', 1, compute), 1)
+        self.clock.now = 60.0
+        self.assertEqual(self.cache.get_or_compute('trend', 1, compute), 2)
+    
+    def test_lru_eviction(self):
+        """Test the least recently used entry is evicted when the store is full"""
+        store = LRUResultStore(maxsize=2, clock=self.clock)
+        store.set('a', 1, 60.0)
+        store.set('b', 2, 60.0)
+        self.assertEqual(store.get('a'), 1)
+        store.set('c', 3, 60.0)
+        
+        self.assertEqual(len(store), 2)
+        self.assertIsNone(store.get('b'))
+        self.assertEqual((store.get('a'), store.get('c')), (1, 3))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+# backend/tests/test_retrieval.py
+
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+from backend.ai_backend.chatbot import safety_responses
+from backend.ai_backend.chatbot.retrieval import ResponseRetriever
+from backend.ai_backend.chatbot.safety_responses import ResponseCatalog, find_safety_response
+
+RESPONSES = {
+    "reporting": [
+        "Call emergency services if you are in immediate danger.",
+        "A school counselor or a helpline can help you report what happened."
+    ],
+    "boundaries": [
+        "You have the right to say no to any touch that makes you uncomfortable."
+    ],
+    "fallback": [
+        "Could you tell me more about what you would like to know?"
+    ]
+}
+
+KEYWORDS = {
+    "reporting": ["how to report"],
+    "boundaries": ["personal space"]
+}
+
+class TestResponseRetriever(unittest.TestCase):
+    def setUp(self):
+        self.retriever = ResponseRetriever(RESPONSES, KEYWORDS)
+    
+    def test_best_response_in_category(self):
+        """Test the closest response is returned, not the first of its category"""
+        match = self.retriever.best_match("Is there a helpline?")
+        self.assertEqual((match.category, match.index), ("reporting", 1))
+        self.assertGreater(match.score, 0)
+        self.assertLessEqual(match.score, 1)
+    
+    def test_keyword_phrase_selects_category(self):
+        """Test a keyword phrase match picks its category's response"""
+        match = self.retriever.best_match("what about my personal space")
+        self.assertEqual(match.category, "boundaries")
+    
+    def test_category_restriction(self):
+        """Test results can be limited to one category"""
+        match = self.retriever.best_match("Can I call a helpline?", category="boundaries")
+        self.assertEqual((match.category, match.index), ("boundaries", 0))
+    
+    def test_no_match(self):
+        """Test unknown words and excluded categories do not match"""
+        self.assertIsNone(self.retriever.best_match("zebra"))
+        self.assertIsNone(self.retriever.best_match("would like to know more"))
+
+class TestCatalogHotReload(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'safety_responses.json')
+        self.write(json.dumps(RESPONSES))
+        self.catalog = ResponseCatalog(self.path, check_interval=0)
+    
+    def tearDown(self):
+        self.directory.cleanup()
+    
+    def write(self, content):
+        with open(self.path, 'w') as f:
+            f.write(content)
+    
+    def answer(self, query):
+        with mock.patch.object(safety_responses, 'response_catalog', self.catalog):
+            return find_safety_response(query).text
+    
+    def test_reload_serves_new_text(self):
+        """Test a rewritten file bumps the version and its text is served by the rebuilt index"""
+        self.assertEqual(self.catalog.version, 1)
+        self.assertEqual(self.answer("Is there a helpline?"), RESPONSES["reporting"][1])
+        
+        updated = dict(RESPONSES, reporting=["Any trusted adult or a helpline can help you report it, day or night."])
+        self.write(json.dumps(updated))
+        self.assertEqual(self.catalog.version, 2)
+        self.assertEqual(self.answer("Is there a helpline?"), updated["reporting"][0])
+        
+        # Text and index always come from the same load
+        responses, retriever = self.catalog.value
+        self.assertIs(retriever.responses["reporting"], responses["reporting"])
+    
+    def test_invalid_json_keeps_catalog(self):
+        """Test a corrupt or half-written file keeps the previous catalog and version"""
+        self.assertEqual(self.catalog.version, 1)
+        with mock.patch('builtins.print'):
+            for content in ('{"reporting": ["half', '["not", "a", "mapping of categories"]'):
+                self.write(content)
+                self.assertEqual(self.catalog.version, 1)
+                self.assertEqual(self.answer("Is there a helpline?"), RESPONSES["reporting"][1])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,30 @@
+# backend/tests/test_translated_catalog.py
+
+import unittest
+from backend.ai_backend.chatbot.multilingual import Translator
+from backend.ai_backend.chatbot.translated_catalog import LanguageCatalog
+
+RESPONSES = {
+    "reporting": ["Call for help in an emergency.", "Talk to a trusted adult."]
+}
+
+class TestLanguageCatalog(unittest.TestCase):
+    def setUp(self):
+        translator = Translator({"help": "ayuda", "emergency": "emergencia", "trusted adult": "adulto de confianza"})
+        self.catalog = LanguageCatalog('es', RESPONSES, translator)
+    
+    def test_prebuilt_variants(self):
+        """Test every response is translated once, keyed by category and index"""
+        self.assertEqual(self.catalog.safety[("reporting", 0)],
+                         ("Call for help in an emergency.", "Call for ayuda in an emergencia."))
+        self.assertEqual(self.catalog.safety[("reporting", 1)][1], "Talk to a adulto de confianza.")
+    
+    def test_coverage_counts_untranslated_phrases(self):
+        """Test coverage reports runs of words the dictionary does not cover"""
+        coverage = LanguageCatalog('es', RESPONSES, Translator({"help": "ayuda"})).coverage()
+        self.assertEqual(coverage.untranslated["call for"], 1)
+        self.assertEqual(coverage.untranslated["in an emergency"], 1)
+        self.assertLess(coverage.translated_words, coverage.words)
+
+if __name__ == '__main__':
+    unittest.main()
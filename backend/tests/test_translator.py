@@ -0,0 +1,79 @@
+# backend/tests/test_translator.py
+
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+from backend.ai_backend.chatbot import multilingual
+from backend.ai_backend.chatbot.multilingual import Translator, compile_phrase_pattern, translate_text, get_dictionary_version
+
+class TestPhrasePattern(unittest.TestCase):
+    def test_longest_phrase_wins(self):
+        """Test the longest phrase starting at a position is matched, whatever the key order"""
+        pattern = compile_phrase_pattern(["i'm here", "i'm here to help", "here"])
+        self.assertEqual(pattern.findall("I'm here to help you"), ["I'm here to help"])
+        self.assertEqual(pattern.findall("I'm here to listen"), ["I'm here"])
+
+    def test_word_boundaries(self):
+        """Test phrases are not matched inside longer words"""
+        pattern = compile_phrase_pattern(["report", "help"])
+        self.assertEqual(pattern.findall("reporter reporting helpful unhelp"), [])
+        self.assertEqual(pattern.findall("report it, help!"), ["report", "help"])
+
+    def test_longer_phrase_falls_back_on_boundary(self):
+        """Test a longer phrase that ends inside a word gives way to a shorter one"""
+        pattern = compile_phrase_pattern(["safe", "safety"])
+        self.assertEqual(pattern.findall("safetyfirst is safe"), ["safe"])
+        self.assertEqual(pattern.findall("safety"), ["safety"])
+
+class TestTranslator(unittest.TestCase):
+    def test_longest_first_and_boundaries(self):
+        """Test multi-word phrases beat their words and words inside longer words stay untouched"""
+        translator = Translator({"help": "ayuda", "I'm here to help": "Estoy aquí para ayudar", "report": "informar"})
+        self.assertEqual(translator.translate("I'm here to help you report it"), "Estoy aquí para ayudar you informar it")
+        self.assertEqual(translator.translate("The reporter was helpful"), "The reporter was helpful")
+
+    def test_case_handling(self):
+        """Test keys match in any case and the first spelling of a key wins"""
+        translator = Translator({"Hello": "Hola", "hello": "Buenas", "": "nada"})
+        self.assertEqual(translator.translate("HELLO and hello and Hello"), "Hola and Hola and Hola")
+
+    def test_empty_dictionary(self):
+        """Test an empty dictionary returns the text unchanged"""
+        self.assertEqual(Translator({}).translate("Hello"), "Hello")
+
+class TestDictionaryReload(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        patches = [
+            mock.patch.object(multilingual, 'LANGUAGE_DIR', self.directory.name),
+            mock.patch.object(multilingual, 'DICTIONARY_CHECK_INTERVAL', 0),
+            mock.patch.dict(multilingual._translators, clear=True),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        self.addCleanup(self.directory.cleanup)
+
+    def write(self, content):
+        with open(os.path.join(self.directory.name, 'xx.json'), 'w') as f:
+            f.write(content)
+
+    def test_retranslates_after_file_change(self):
+        """Test a changed dictionary file is picked up and bumps the version; a corrupt one is ignored"""
+        self.write(json.dumps({"Hello": "Hallo"}))
+        self.assertEqual(translate_text("Hello there", target='xx'), "Hallo there")
+        version = get_dictionary_version('xx')
+
+        self.write(json.dumps({"Hello": "Hej", "there": "der"}))
+        self.assertEqual(translate_text("Hello there", target='xx'), "Hej der")
+        self.assertEqual(get_dictionary_version('xx'), version + 1)
+
+        with mock.patch('builtins.print'):
+            self.write('{"Hello": ')
+            self.assertEqual(translate_text("Hello there", target='xx'), "Hej der")
+        self.assertEqual(get_dictionary_version('xx'), version + 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,136 @@
+# backend/tests/test_urgent.py
+
+import time
+import unittest
+from unittest import mock
+from flask import Flask
+from backend.config import Config, TestingConfig
+from backend.extensions import db
+from backend.ai_backend.models.user import User
+from backend.ai_backend.models.interaction import Interaction
+from backend.ai_backend.chatbot import engine
+from backend.ai_backend.chatbot.metrics import LatencyHistogram
+from backend.ai_backend.chatbot.persistence import interaction_writer
+from backend.ai_backend.chatbot.safety_responses import response_catalog
+from backend.ai_backend.chatbot.urgent import CRISIS_RESPONSES, answer_urgent_query
+
+URGENT_QUERIES = [
+    ("Please help me now, someone is hurting me", 'en'),
+    ("This is an emergency, I need help immediately", 'en'),
+    ("¡Ayuda! Es una emergencia, estoy en peligro", 'es'),
+    ("Au secours, c'est une urgence, j'ai besoin d'aide maintenant", 'fr'),
+    ("Hilfe, es ist ein Notfall und ich bin in Gefahr", 'de'),
+    # Urgent words shared with French must not switch the language
+    ("Am I in danger?", 'en'),
+    ("What should I do if I feel in danger at home?", 'en'),
+    ("Je suis en danger", 'fr'),
+]
+
+# Weak words ('help', 'now', 'aide', ...) alone must not trigger the fast lane
+NON_URGENT_QUERIES = [
+    "My teacher aide touched me",
+    "How can I help my friend who was abused?",
+    "What should I do now?",
+    "How do I call for help?",
+    "¿Cómo puedo ayudar a mi amiga ahora?",
+    "Que dois-je faire maintenant?",
+    "Was soll ich jetzt tun?",
+]
+
+class TestUrgentFastLane(unittest.TestCase):
+    def test_crisis_response_in_user_language(self):
+        """Test urgent queries get the crisis response in their own language"""
+        for query, language in URGENT_QUERIES:
+            result = answer_urgent_query(query)
+            self.assertEqual(result['sentiment'], 'urgent')
+            self.assertEqual(result['response'], CRISIS_RESPONSES[language], query)
+    
+    def test_non_urgent_queries_skip_fast_lane(self):
+        """Test ordinary questions fall through to the full pipeline"""
+        self.assertIsNone(answer_urgent_query("What are personal boundaries?"))
+        self.assertIsNone(answer_urgent_query("¿Qué son los límites personales?"))
+        for query in NON_URGENT_QUERIES:
+            self.assertIsNone(answer_urgent_query(query), query)
+    
+    def test_support_and_reporting_answers_reachable(self):
+        """Test questions about helping someone or reporting get their catalog category"""
+        for query, category in [
+            ("How can I help my friend who was abused?", 'support'),
+            ("How do I call for help?", 'reporting'),
+        ]:
+            result = engine.answer_query(query)
+            self.assertIn(result['response'], response_catalog.get_category(category), query)
+    
+    def test_requested_language_wins(self):
+        """Test the request's language is used when it has a crisis response"""
+        result = answer_urgent_query("Am I in danger?", 'es')
+        self.assertEqual(result['response'], CRISIS_RESPONSES['es'])
+        self.assertEqual(answer_urgent_query("Am I in danger?", 'xx')['language'], 'en')
+    
+    def test_p99_latency_budget(self):
+        """Test the fast lane stays under the configured p99 budget"""
+        histogram = LatencyHistogram()
+        for _ in range(200):
+            for query, _ in URGENT_QUERIES:
+                started = time.perf_counter()
+                answer_urgent_query(query)
+                histogram.observe(time.perf_counter() - started)
+        
+        self.assertLessEqual(histogram.percentile(0.99) * 1e3, Config.CHATBOT_URGENT_P99_BUDGET_MS)
+
+class TestUrgentRoute(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.config.from_object(TestingConfig)
+        db.init_app(self.app)
+        interaction_writer.init_app(self.app)
+        self.app.register_blueprint(engine.chatbot_bp, url_prefix='/chatbot')
+        self.client = self.app.test_client()
+        with self.app.app_context():
+            db.create_all()
+            db.session.add(User(id=1, username='learner', age=12))
+            db.session.commit()
+    
+    def tearDown(self):
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+    
+    def ask(self, query, **fields):
+        # Closing the response runs the deferred write, as a server would
+        with self.client.post('/chatbot/response', json={'query': query, 'user_id': 1, **fields}) as response:
+            self.assertEqual(response.status_code, 200)
+            return response.get_json()
+    
+    def test_crisis_response_in_user_language(self):
+        """Test /chatbot/response answers urgent queries in their own language and stores them"""
+        for query, language in URGENT_QUERIES:
+            data = self.ask(query)
+            self.assertEqual(data['sentiment'], 'urgent')
+            self.assertEqual(data['response'], CRISIS_RESPONSES[language], query)
+        
+        with self.app.app_context():
+            self.assertEqual(db.session.query(Interaction).count(), len(URGENT_QUERIES))
+    
+    def test_requested_language_used_by_both_lanes(self):
+        """Test a supported request language is honoured on the normal path too, and others detected"""
+        query = "What are personal boundaries?"
+        with mock.patch.object(engine, 'answer_query', wraps=engine.answer_query) as answer_query:
+            self.ask(query, language='es')
+            answer_query.assert_called_with(query, 'es')
+            self.ask(query, language='xx')
+            answer_query.assert_called_with(query, None)
+        self.assertEqual(self.ask("Am I in danger?", language='es')['response'], CRISIS_RESPONSES['es'])
+    
+    def test_p99_latency_budget(self):
+        """Test the route's fast lane stays under the configured p99 budget"""
+        with mock.patch.object(engine, 'urgent_latency', LatencyHistogram()) as histogram:
+            for _ in range(20):
+                for query, _ in URGENT_QUERIES:
+                    self.ask(query)
+        
+        self.assertEqual(histogram.count, 20 * len(URGENT_QUERIES))
+        self.assertLessEqual(histogram.percentile(0.99) * 1e3, Config.CHATBOT_URGENT_P99_BUDGET_MS)
+
+if __name__ == '__main__':
+    unittest.main()